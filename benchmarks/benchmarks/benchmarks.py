@@ -1,6 +1,10 @@
 # Write the benchmarking functions here.
 # See "Writing benchmarks" in the asv docs for more information.
 
+import asyncio
+import gc
+import time
+
 import param
 
 
@@ -635,3 +639,358 @@ class WatcherSuite:
 
     def time_trigger(self):
         self.p.x0 += 1
+
+
+class WatcherChurnSuite:
+    """
+    Short-lived subscribers referencing or depending on a long-lived
+    source should not accumulate watchers on the source over time.
+    """
+
+    def setup(self):
+        class Source(param.Parameterized):
+            x = param.Parameter(0)
+
+        class RefSubscriber(param.Parameterized):
+            value = param.Parameter(allow_refs=True)
+
+        class DependsSubscriber(param.Parameterized):
+            source = param.Parameter()
+
+            @param.depends('source.x', watch=True)
+            def foo(self): pass
+
+        self.source = Source()
+        self.RefSubscriber = RefSubscriber
+        self.DependsSubscriber = DependsSubscriber
+
+    def _churn(self, n):
+        for _ in range(n):
+            self.RefSubscriber(value=self.source.param.x)
+            self.DependsSubscriber(source=self.source)
+        gc.collect()
+
+    def _watcher_count(self):
+        watchers = self.source._param__private.watchers
+        return sum(len(ws) for what in watchers.values() for ws in what.values())
+
+    def time_subscriber_churn(self):
+        self._churn(100)
+
+    def time_trigger_after_churn(self):
+        self._churn(1000)
+        for _ in range(100):
+            self.source.x += 1
+
+    def track_watchers_after_churn(self):
+        self._churn(1000)
+        return self._watcher_count()
+
+
+class DependsPropagationSuite:
+    """Setting a parameter a number of watched methods depend on."""
+
+    params = [1, 10, 100]
+    param_names = ['n_methods']
+
+    def setup(self, n_methods):
+        def method(self): pass
+
+        P = type('P', (param.Parameterized,), {
+            'x': param.Parameter(0),
+            **{f'foo{i}': param.depends('x', watch=True)(method) for i in range(n_methods)}
+        })
+        self.p = P()
+
+    def time_trigger(self, n_methods):
+        self.p.x += 1
+
+
+class DependsChainSuite:
+    """Setting the root of a chain of 10 watched methods."""
+
+    def setup(self):
+        depth = 10
+        namespace = {f'x{i}': param.Parameter(0) for i in range(depth + 1)}
+        for i in range(depth):
+            def method(self, i=i):
+                setattr(self, f'x{i+1}', getattr(self, f'x{i}'))
+            method.__name__ = f'foo{i}'
+            namespace[f'foo{i}'] = param.depends(f'x{i}', watch=True)(method)
+        self.p = type('P', (param.Parameterized,), namespace)()
+
+    def time_trigger(self):
+        self.p.x0 += 1
+
+
+class DependsSubobjectSuite:
+    """Dotted dependencies on the parameters of a sub-object."""
+
+    def setup(self):
+        class Sub(param.Parameterized):
+            x = param.Parameter(0)
+
+        class P(param.Parameterized):
+            sub = param.Parameter()
+
+            @param.depends('sub.x', watch=True)
+            def foo(self): pass
+
+        self.Sub = Sub
+        self.subs = [Sub(), Sub()]
+        self.p = P(sub=self.subs[0])
+
+    def time_trigger(self):
+        self.p.sub.x += 1
+
+    def time_replace_subobject(self):
+        self.p.sub = self.subs[1] if self.p.sub is self.subs[0] else self.subs[0]
+
+
+class RefsSyncSuite:
+    """Parameters referencing the parameters of another object."""
+
+    params = [1, 10, 50]
+    param_names = ['n_refs']
+
+    def setup(self, n_refs):
+        namespace = {f'x{i}': param.Parameter(0) for i in range(n_refs)}
+        Source = type('Source', (param.Parameterized,), namespace)
+        Target = type('Target', (param.Parameterized,), {
+            f'x{i}': param.Parameter(allow_refs=True) for i in range(n_refs)
+        })
+        self.source = Source()
+        self.other = Source()
+        self.target = Target(**{
+            f'x{i}': self.source.param[f'x{i}'] for i in range(n_refs)
+        })
+        self.updates = [{f'x{i}': v for i in range(n_refs)} for v in (1, 2)]
+        self.sources = [self.other, self.source]
+
+    def time_sync_one(self, n_refs):
+        self.source.x0 += 1
+
+    def time_sync_all(self, n_refs):
+        for update in self.updates:
+            self.source.param.update(update)
+
+    def time_update_ref(self, n_refs):
+        for source in self.sources:
+            self.target.x0 = source.param.x0
+
+
+class BindSuite:
+    """Evaluation of functions bound to a number of parameters."""
+
+    params = [1, 10, 50]
+    param_names = ['n_args']
+
+    def setup(self, n_args):
+        P = type('P', (param.Parameterized,), {
+            f'x{i}': param.Parameter(i) for i in range(n_args)
+        })
+        p = P()
+
+        def function(*args, **kwargs):
+            pass
+
+        self.bound_args = param.bind(function, *(p.param[f'x{i}'] for i in range(n_args)))
+        self.bound_kwargs = param.bind(function, **{
+            f'x{i}': p.param[f'x{i}'] for i in range(n_args)
+        })
+
+    def time_bound_args(self, n_args):
+        self.bound_args()
+
+    def time_bound_kwargs(self, n_args):
+        self.bound_kwargs()
+
+
+class RxResolveSuite:
+    """Resolving deep rx pipelines after one of their inputs changed."""
+
+    params = [10, 100, 1000]
+    param_names = ['depth']
+
+    def setup(self, depth):
+        self.head = param.rx(0)
+        self.tail = param.rx(0)
+        expr = self.head
+        for _ in range(depth):
+            expr = expr + 1
+        self.expr = expr + self.tail
+        self.expr.rx.value
+
+    def time_update_tail(self, depth):
+        self.tail.rx.value += 1
+        self.expr.rx.value
+
+    def time_update_head(self, depth):
+        self.head.rx.value += 1
+        self.expr.rx.value
+
+
+class RxConstructionSuite:
+    """Building rx pipelines of a number of operations."""
+
+    params = [10, 100]
+    param_names = ['n_ops']
+
+    def setup(self, n_ops):
+        self.eager = param.rx(0)
+        self.lazy = param.rx(0, lazy=True)
+
+    def _build(self, expr, n_ops):
+        for _ in range(n_ops):
+            expr = expr + 1
+        return expr
+
+    def time_build_eager(self, n_ops):
+        self._build(self.eager, n_ops)
+
+    def time_build_lazy(self, n_ops):
+        self._build(self.lazy, n_ops)
+
+
+class RxBufferSuite:
+    """Emitting values into rx buffers and rolling windows of a given size."""
+
+    params = [1000, 10000]
+    param_names = ['n']
+
+    def setup(self, n):
+        self.source = param.rx(0.0)
+        self.buffer = self.source.rx.buffer(n)
+        self.rolling = self.source.rx.rolling(n, 'max')
+        for i in range(n):
+            self.source.rx.value = float(i)
+            self.buffer.rx.value
+            self.rolling.rx.value
+
+    def time_emit_buffer(self, n):
+        self.source.rx.value += 1
+        self.buffer.rx.value
+
+    def time_emit_rolling(self, n):
+        self.source.rx.value += 1
+        self.rolling.rx.value
+
+
+class RxArrayBufferSuite:
+    """Emitting values into rx buffers backed by a NumPy ring buffer."""
+
+    params = [1000, 100000]
+    param_names = ['n']
+
+    def setup(self, n):
+        try:
+            import numpy  # noqa: F401
+        except ImportError:
+            raise NotImplementedError('NumPy is not installed')
+        self.source = param.rx(0.0)
+        self.buffer = self.source.rx.buffer(n, dtype='float64')
+        for i in range(n):
+            self.source.rx.value = float(i)
+            self.buffer.rx.value
+
+    def time_emit_buffer(self, n):
+        self.source.rx.value += 1
+        self.buffer.rx.value
+
+
+class RxIncrementalSuite:
+    """Appending to the input of rx pipelines recomputed fully or incrementally."""
+
+    params = [1000, 100000]
+    param_names = ['n']
+
+    def setup(self, n):
+        self.source = param.rx(list(range(n)))
+        self.full = self.source.rx.pipe(lambda values: sum(v for v in values if v % 2))
+        self.incremental = self.source.rx.incremental(
+            lambda values: sum(v for v in values if v % 2)
+        )
+        self.full.rx.value
+        self.incremental.rx.value
+
+    def time_append_full(self, n):
+        self.source.rx.append([1, 2, 3])
+        self.full.rx.value
+
+    def time_append_incremental(self, n):
+        self.source.rx.append([1, 2, 3])
+        self.incremental.rx.value
+
+
+class RxAsyncFloodSuite:
+    """
+    Flooding an asynchronous rx operation with updates under each
+    backpressure policy, recording the evaluations started for inputs
+    that never reach the output and the latency of the final output.
+    """
+
+    params = ['latest', 'queue', 'drop']
+    param_names = ['policy']
+
+    n_updates = 50
+
+    def _flood(self, policy):
+        calls = []
+        outputs = []
+
+        async def work(value):
+            calls.append(value)
+            await asyncio.sleep(0.001)
+            return value
+
+        async def flood():
+            x = param.rx(0)
+            y = x.rx.pipe(work).rx.backpressure(policy)
+            y.rx.watch(outputs.append)
+            for i in range(1, self.n_updates + 1):
+                x.rx.value = i
+                await asyncio.sleep(0)
+            start = time.perf_counter()
+            while y._async_busy:
+                await asyncio.sleep(0)
+            return time.perf_counter() - start
+
+        latency = asyncio.run(flood())
+        return calls, outputs, latency
+
+    def time_flood(self, policy):
+        self._flood(policy)
+
+    def track_wasted_evaluations(self, policy):
+        calls, outputs, _ = self._flood(policy)
+        return len(set(calls) - set(outputs))
+
+    def track_latency(self, policy):
+        return self._flood(policy)[2] * 1000
+
+    track_latency.unit = 'ms'
+
+
+class RxResolveAllSuite:
+    """Resolving rx branches sharing an input serially or concurrently."""
+
+    params = [1, 4, 8]
+    param_names = ['n_branches']
+
+    def setup(self, n_branches):
+        def release_gil(value):
+            # Stands in for an operation releasing the GIL, e.g. in NumPy
+            time.sleep(0.002)
+            return value
+
+        self.source = param.rx(0)
+        shared = self.source + 1
+        self.branches = [(shared + i).rx.pipe(release_gil) for i in range(n_branches)]
+
+    def time_resolve_serial(self, n_branches):
+        self.source.rx.value += 1
+        [branch.rx.value for branch in self.branches]
+
+    def time_resolve_all(self, n_branches):
+        self.source.rx.value += 1
+        param.rx.resolve_all(self.branches)
@@ -42,7 +42,7 @@ Lets update the reactive value and check its length:
 """
 import os
 
-from . import version
+from . import profiling, version
 from .depends import depends
 from .parameterized import (
     Parameterized, Parameter, Skip, String, ParameterizedFunction,
@@ -223,6 +223,7 @@ __all__ = (
     'output',
     'param_union',
     'parameterized_class',
+    'profiling',
     'random_seed',
     'resolve_path',
     'rx',
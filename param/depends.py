@@ -2,18 +2,24 @@ from __future__ import annotations
 
 import inspect
 import typing as t
+import weakref
 
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 from functools import wraps
 
 from .parameterized import (
-    Event, Parameter, Parameterized, ParameterizedMetaclass, transform_reference,
+    Event, MInfo, Parameter, Parameterized, ParameterizedMetaclass, _params_depended_on,
+    _resolve_mcs_deps, _validate_executor, resolve_ref, transform_reference,
 )
 from ._utils import iscoroutinefunction
 
 if t.TYPE_CHECKING:
+    import concurrent.futures
+
     from collections.abc import AsyncGenerator, Callable, Generator
 
+    from .parameterized import DInfo, PInfo
+
     _Y = t.TypeVar("_Y")
     _T = t.TypeVar("_T")
 
@@ -23,12 +29,16 @@ _R = t.TypeVar("_R", covariant=True)
 _S = t.TypeVar("_S")
 Dependency = Parameter | str
 
-class DependencyInfo(t.TypedDict):
+class _RequiredDependencyInfo(t.TypedDict):
     dependencies: tuple[Dependency, ...]
     kw: dict[str, Dependency]
     watch: bool
     on_init: bool
 
+class DependencyInfo(_RequiredDependencyInfo, total=False):
+    executor: str | concurrent.futures.Executor
+    cache: int
+
 class _DepsFn(t.Protocol[_FullP, _R]):
     _dinfo: DependencyInfo
     def __call__(self, *args: _FullP.args, **kwargs: _FullP.kwargs) -> _R: ...
@@ -40,24 +50,31 @@ class DependsFunc(t.Protocol[_P, _R]):
 
 @t.overload
 def depends(
-    func: Callable[t.Concatenate[_S, _P], _R], /, *dependencies: Dependency, watch: bool = False, on_init: bool = False, **kw: Dependency
+    func: Callable[t.Concatenate[_S, _P], _R], /, *dependencies: Dependency, watch: bool = False, on_init: bool = False,
+    executor: str | concurrent.futures.Executor | None = None, cache: bool | int = False,
+    **kw: Dependency
 ) -> DependsFunc[_P, _R]:
     ...
 
 @t.overload
 def depends(
-    *dependencies: str, watch: bool = False, on_init: bool = False
+    *dependencies: str, watch: bool = False, on_init: bool = False,
+    executor: str | concurrent.futures.Executor | None = None, cache: bool | int = False
 ) -> Callable[[Callable[t.Concatenate[_S, _P], _R]], DependsFunc[_P, _R]]:
     ...
 
 @t.overload
 def depends(
-    *dependencies: Parameter, watch: bool = False, on_init: bool = False, **kw: Parameter
+    *dependencies: Parameter, watch: bool = False, on_init: bool = False,
+    executor: str | concurrent.futures.Executor | None = None, cache: bool | int = False,
+    **kw: Parameter
 ) -> Callable[[Callable[t.Concatenate[_S, _P], _R]], DependsFunc[_P, _R]]:
     ...
 
 def depends(
-    *dependencies: Dependency | Callable[t.Concatenate[_S, _P], _R], watch: bool = False, on_init: bool = False, **kw: Dependency
+    *dependencies: Dependency | Callable[t.Concatenate[_S, _P], _R], watch: bool = False, on_init: bool = False,
+    executor: str | concurrent.futures.Executor | None = None, cache: bool | int = False,
+    **kw: Dependency
 ) -> DependsFunc[_P, _R] | Callable[[Callable[t.Concatenate[_S, _P], _R]], DependsFunc[_P, _R]]:
     """
     Annotates a function or :class:`Parameterized` method to express its dependencies.
@@ -76,24 +93,171 @@ def depends(
     on_init : bool, optional
         Whether to invoke the function/method when the instance is created,
         by default ``False``.
+    executor : str or concurrent.futures.Executor, optional
+        When watching, dispatch the function/method to an executor instead of
+        invoking it inline, either ``'thread'`` or ``'process'`` to use a shared
+        default pool or a :class:`concurrent.futures.Executor` instance, by
+        default ``None``. See :meth:`param.parameterized.Parameters.watch`.
+    cache : bool or int, optional
+        Whether to cache the results of the function/method, keyed on the
+        current values of its dependencies and the arguments it is called
+        with, so that repeated calls with unchanged inputs return the
+        cached result. An integer sets the maximum number of results kept
+        per instance, least recently used results being evicted first,
+        ``True`` keeps up to 128 results. Unhashable values of parameters
+        a method depends on directly are keyed on their version (see
+        :meth:`param.parameterized.Parameters.version`), so only setting a
+        new value invalidates the cache, not modifying it in place. Calls
+        with other unhashable values or arguments are not cached. Only
+        supported for regular (not generator or coroutine) functions, by
+        default ``False``.
+        The cache may be cleared with the ``cache_clear`` method of the
+        decorated function.
 
     """
     if dependencies and callable(dependencies[0]) and not isinstance(dependencies[0], (str, Parameter)):
         func = t.cast("Callable[t.Concatenate[_S, _P], _R]", dependencies[0])
         deps = t.cast("tuple[Dependency, ...]", dependencies[1:])
-        return t.cast("DependsFunc[_P, _R]", _depends_impl(func, *deps, watch=watch, on_init=on_init, **kw))
+        return t.cast("DependsFunc[_P, _R]", _depends_impl(
+            func, *deps, watch=watch, on_init=on_init, executor=executor, cache=cache, **kw
+        ))
 
     deps = t.cast("tuple[Dependency, ...]", dependencies)
 
     def _decorator(func: Callable[t.Concatenate[_S, _P], _R]) -> DependsFunc[_P, _R]:
-        return t.cast("DependsFunc[_P, _R]", _depends_impl(func, *deps, watch=watch, on_init=on_init, **kw))
+        return t.cast("DependsFunc[_P, _R]", _depends_impl(
+            func, *deps, watch=watch, on_init=on_init, executor=executor, cache=cache, **kw
+        ))
 
     return _decorator
 
 
+_VERSION = object()
+
+
+def _validate_cache(cache: bool | int, func: Callable[..., t.Any]) -> int:
+    """Validate the cache option of depends, returning the maximum number of cached results."""
+    if cache is False:
+        return 0
+    elif cache is True:
+        maxsize = 128
+    elif isinstance(cache, int) and cache > 0:
+        maxsize = cache
+    else:
+        raise ValueError(
+            f'The depends cache must be a boolean or a positive integer, got {cache!r}.'
+        )
+    if (inspect.isgeneratorfunction(func) or inspect.isasyncgenfunction(func)
+        or iscoroutinefunction(func)):
+        raise ValueError(
+            f'Caching is not supported for generator or coroutine function {func!r}.'
+        )
+    return maxsize
+
+
+def _cached(
+    func: Callable[..., _R], dependencies: tuple[Dependency, ...], kw: dict[str, Dependency],
+    maxsize: int
+) -> Callable[..., _R]:
+    """
+    Wrap func in an LRU cache keyed on the current values of its dependencies.
+
+    Results of methods are cached per instance. The dependencies
+    declared as strings on func are resolved once per class, like
+    :meth:`Parameters.method_dependencies` does, only dependencies on
+    subobjects are resolved on each call.
+    """
+    refs = [dep for dep in (*dependencies, *kw.values()) if not isinstance(dep, str)]
+    instance_caches: weakref.WeakKeyDictionary[Parameterized, OrderedDict] = weakref.WeakKeyDictionary()
+    shared_cache: OrderedDict = OrderedDict()
+    class_deps: weakref.WeakKeyDictionary[type, tuple[list[PInfo], list[DInfo]]] = weakref.WeakKeyDictionary()
+
+    def _method_values(obj: Parameterized) -> tuple[t.Any, ...]:
+        cls = type(obj)
+        resolved = class_deps.get(cls)
+        if resolved is None:
+            # Resolve the dependencies declared on this function rather than
+            # looking it up by name, the class may override or rename it.
+            minfo = MInfo(inst=None, cls=cls, name=func.__name__, method=_depends_cached)
+            resolved = class_deps[cls] = _params_depended_on(minfo, dynamic=False, intermediate=False)
+        deps, dynamic = resolved
+        values = []
+        for pinfo in deps:
+            owner = pinfo.inst
+            if owner is None:
+                owner = obj if issubclass(cls, pinfo.cls) else pinfo.cls
+            if pinfo.what == 'value':
+                value = getattr(owner, pinfo.name)
+                try:
+                    hash(value)
+                except TypeError:
+                    # Key unhashable values on the version of the parameter
+                    value = (_VERSION, owner.param.version(pinfo.name))
+                values.append(value)
+            else:
+                values.append(getattr(owner.param[pinfo.name], pinfo.what))
+        for pinfo in (_resolve_mcs_deps(obj, [], dynamic, intermediate=False) if dynamic else ()):
+            if pinfo.what == 'value':
+                owner = pinfo.cls if pinfo.inst is None else pinfo.inst
+                values.append(getattr(owner, pinfo.name))
+            else:
+                values.append(getattr(pinfo.pobj, pinfo.what))
+        return tuple(values)
+
+    def _dependency_values(obj: Parameterized | None) -> tuple[t.Any, ...] | None:
+        if refs:
+            return tuple(
+                getattr(p.owner, p.name) for ref in refs for p in resolve_ref(ref)
+                if p.owner is not None
+            )
+        elif obj is None:
+            return None
+        return _method_values(obj)
+
+    @wraps(func)
+    def _depends_cached(*args, **kwargs):
+        obj = args[0] if args and isinstance(args[0], Parameterized) else None
+        values = _dependency_values(obj)
+        if values is None:
+            return func(*args, **kwargs)
+        if obj is None:
+            cache, key_args = shared_cache, args
+        else:
+            cache = instance_caches.get(obj)
+            if cache is None:
+                cache = instance_caches[obj] = OrderedDict()
+            key_args = args[1:]
+        key = (values, key_args, tuple(sorted(kwargs.items())))
+        try:
+            result = cache[key]
+        except TypeError:
+            # Unhashable values cannot be cached
+            return func(*args, **kwargs)
+        except KeyError:
+            pass
+        else:
+            cache.move_to_end(key)
+            return result
+        result = cache[key] = func(*args, **kwargs)
+        if len(cache) > maxsize:
+            cache.popitem(last=False)
+        return result
+
+    def cache_clear() -> None:
+        instance_caches.clear()
+        shared_cache.clear()
+
+    _depends_cached.cache_clear = cache_clear  # type: ignore[attr-defined]
+    return _depends_cached
+
+
 def _depends_impl(
-    func: Callable[_FullP, _R], /, *dependencies: Dependency, watch: bool = False, on_init: bool = False, **kw: Dependency
+    func: Callable[_FullP, _R], /, *dependencies: Dependency, watch: bool = False, on_init: bool = False,
+    executor: str | concurrent.futures.Executor | None = None, cache: bool | int = False,
+    **kw: Dependency
 ) -> _DepsFn[_FullP, _R]:
+    _validate_executor(executor, func)
+    maxsize = _validate_cache(cache, func)
     dependencies, kw = (
         tuple(transform_reference(arg) for arg in dependencies),
         {key: transform_reference(arg) for key, arg in kw.items()}
@@ -119,6 +283,8 @@ def _depends_impl(
         async def _depends_coro(*args, **kw):
             return await F(*args, **kw)
         _depends = t.cast("Callable[_FullP, _R]", _depends_coro)
+    elif maxsize:
+        _depends = t.cast("Callable[_FullP, _R]", _cached(func, dependencies, kw, maxsize))
     else:
         @wraps(func)
         def _depends_sync(*args, **kw):
@@ -159,6 +325,10 @@ def _depends_impl(
     _dinfo = t.cast("DependencyInfo", dict(getattr(func, '_dinfo', {})))
     _dinfo.update({'dependencies': dependencies,
                    'kw': kw, 'watch': watch, 'on_init': on_init})
+    if executor is not None:
+        _dinfo['executor'] = executor
+    if maxsize:
+        _dinfo['cache'] = maxsize
 
     typed_depends = t.cast("_DepsFn[_FullP, _R]", _depends)
     typed_depends._dinfo = _dinfo
@@ -233,6 +403,6 @@ def _depends_impl(
     for group in grouped.values():
         if group[0].owner is None:
             continue
-        group[0].owner.param.watch(cb, [dep.name for dep in group])
+        group[0].owner.param.watch(cb, [dep.name for dep in group], executor=executor)
 
     return typed_depends
@@ -10,28 +10,34 @@ __init__.py (providing specialized Parameter types).
 from __future__ import annotations
 
 import abc
+import ast
 import copy
 import datetime as dt
 import enum
+import heapq
 import inspect
 import numbers
 import operator
 import os
 import re
 import sys
+import textwrap
+import threading
 import types
 import typing as t
 import warnings
+import weakref
 from contextlib import contextmanager
 from inspect import getfullargspec
 
-from collections import defaultdict, namedtuple, OrderedDict
-from functools import partial, wraps, reduce
-from itertools import chain
+from collections import defaultdict, deque, namedtuple, OrderedDict
+from functools import lru_cache, partial, wraps, reduce
+from itertools import chain, count
 from operator import itemgetter, attrgetter
 from types import FunctionType, MethodType
 
 if t.TYPE_CHECKING:
+    import concurrent.futures
     import logging
 
     from .reactive import reactive_ops
@@ -63,7 +69,7 @@ _T = t.TypeVar("_T")
 _P = t.ParamSpec("_P")
 _R = t.TypeVar("_R", covariant=True)
 
-from . import serializer
+from . import profiling, serializer
 from ._utils import (
     DEFAULT_SIGNATURE,
     ParamDeprecationWarning as _ParamDeprecationWarning,
@@ -183,6 +189,12 @@ def get_logger(name: str | None = None) -> "logging.Logger":
 # processing.
 warnings_as_exceptions = False
 
+# Strategy used to propagate parameter changes to watchers, either
+# 'depth-first' (invoke watchers as soon as a parameter is set) or
+# 'topological' (queue watchers and invoke each once per change in
+# dependency order, see propagation_mode).
+propagation = 'depth-first'
+
 docstring_signature = True        # Add signature to class docstrings
 docstring_describe_params = True  # Add parameter description to class
                                   # docstrings (requires ipython module)
@@ -426,6 +438,249 @@ def batch_call_watchers(parameterized):
             parameterized.param._batch_call_watchers()
 
 
+class _Propagation:
+    """
+    Glitch-free propagation of parameter changes to watchers.
+
+    Instead of invoking watchers depth-first as soon as a parameter is
+    set, watchers are queued along with their events and invoked in
+    topological order of the dependency graph, like a spreadsheet
+    recalculation. Events for a watcher that is already queued are
+    merged, so that e.g. a method depending on two parameters that are
+    both updated in response to a single change runs only once and
+    never observes an inconsistent intermediate state. The watchers a
+    depends method has on its own object and on its subobjects are
+    merged too, so that the method runs once per change.
+
+    Watchers are ranked by the height of the parameters they depend on,
+    i.e. the length of the longest chain of depends methods leading up
+    to them, which is computed from the dependencies and writes declared
+    in the dependency graphs of the objects (see ``_DependsGraph``),
+    following dotted paths into subobjects.
+    """
+
+    __slots__ = ('_counter', 'heights', 'pending', 'queue', 'running')
+
+    def __init__(self):
+        self.pending: dict[t.Any, dict[int, tuple[Parameters, Watcher, dict[tuple[str, str], Event]]]] = {}
+        self.queue: list[tuple[int, int, int, t.Any]] = []
+        self.running: tuple[t.Any, str] | None = None
+        self.heights: dict[tuple[int, str], int] = {}
+        self._counter = count()
+
+    def add(self, parameters: Parameters, watcher: Watcher, events: Iterable[Event]) -> None:
+        method = getattr(watcher.fn, '_watcher_name', None)
+        owner = None if method is None else _watcher_owner(watcher.fn)
+        key: t.Any = id(watcher) if owner is None else (id(owner), method)
+        entry = self.pending.get(key)
+        if entry is None:
+            entry = self.pending[key] = {}
+            if owner is None:
+                obj = parameters.self_or_cls
+                rank = max((self.height(obj, name) for name in watcher.parameter_names), default=0)
+            else:
+                paths = owner.param._depends_graph.read_paths(method)
+                rank = max((self.height(owner, path) for path in paths), default=0)
+            heapq.heappush(self.queue, (rank, watcher.precedence, next(self._counter), key))
+        group = entry.get(id(watcher))
+        if group is None:
+            group = entry[id(watcher)] = (parameters, watcher, {})
+        merged = group[2]
+        for event in events:
+            previous = merged.get((event.name, event.what))
+            if previous is not None:
+                event = event._replace(old=previous.old)
+            merged[(event.name, event.what)] = event
+
+    def height(self, obj: t.Any, path: str, visiting: set[tuple[int, str]] | None = None) -> int:
+        """
+        Length of the longest chain of depends methods setting the
+        parameter at the dotted ``path`` relative to ``obj``.
+        """
+        key = (id(obj), path)
+        height = self.heights.get(key)
+        if height is not None:
+            return height
+        visiting = set() if visiting is None else visiting
+        if key in visiting:
+            return 0
+        visiting.add(key)
+        height, target, prefix, rest = 0, obj, '', path
+        while True:
+            # Writers of the parameter may be declared on the object or on
+            # any subobject along the path, reading relative to themselves
+            graph = target.param._depends_graph
+            for method in graph.writers.get(rest, ()):
+                height = max(height, 1, *(
+                    self.height(obj, prefix + read, visiting) + 1
+                    for read in graph.read_paths(method)
+                ))
+            head, _, rest = rest.partition('.')
+            target = getattr(target, head, None) if rest else None
+            if not isinstance(target, Parameterized):
+                break
+            prefix += head + '.'
+        visiting.discard(key)
+        self.heights[key] = height
+        return height
+
+    def record_write(self, obj: t.Any, name: str) -> None:
+        if self.running is not None and self.running[0] is obj:
+            if obj.param._depends_graph.learn_write(self.running[1], name):
+                self.heights.clear()
+
+    def _merge(self, groups):
+        """
+        Merge the watchers of a depends method on several objects into a
+        single call, running the method unless all of them would skip it.
+        """
+        run = False
+        events = []
+        for _, watcher, merged in groups:
+            evs = list(merged.values())
+            events += evs
+            kwargs = watcher.fn.keywords
+            if kwargs['callback'] is not None:
+                kwargs['callback'](*evs)
+            run = run or not _skip_event(*evs, what=kwargs['what'], changed=kwargs['changed'])
+        if not run:
+            return None
+        parameters, watcher, _ = groups[0]
+        fn = partial(watcher.fn.func, function=watcher.fn.keywords['function'])
+        t.cast("t.Any", fn)._watcher_name = watcher.fn._watcher_name
+        return parameters, watcher._replace(fn=fn), events
+
+    def drain(self) -> None:
+        # An error raised by one watcher must not prevent the remaining
+        # watchers from running, the first error is raised once drained
+        error = None
+        while self.queue:
+            key = heapq.heappop(self.queue)[-1]
+            groups = list(self.pending.pop(key).values())
+            if len(groups) == 1:
+                parameters, watcher, merged = groups[0]
+                call = parameters, watcher, list(merged.values())
+            else:
+                call = self._merge(groups)
+                if call is None:
+                    continue
+            parameters, watcher, events = call
+            previous = self.running
+            method = getattr(watcher.fn, '_watcher_name', None)
+            self.running = None if method is None else (_watcher_owner(watcher.fn), method)
+            try:
+                with _batch_call_watchers(parameters.self_or_cls, enable=watcher.queued):
+                    if profiling.enabled:
+                        parameters._execute_profiled(watcher, events)
+                    else:
+                        parameters._execute_watcher(watcher, events)
+            except Exception as e:
+                if error is None:
+                    error = e
+            finally:
+                self.running = previous
+        if error is not None:
+            raise error
+
+
+# State of the propagation of parameter changes in the current thread,
+# i.e. the mode set by propagation_mode and the active _Propagation.
+_propagation_state = threading.local()
+
+# Number of propagation_mode contexts active in any thread, so that the
+# mode of the current thread only has to be looked up while one is active.
+# Sites dispatching events only check this, ``propagation`` and
+# ``profiling.enabled`` and otherwise invoke watchers directly.
+_propagation_overrides = 0
+
+_propagation_lock = threading.Lock()
+
+
+def _topological() -> bool:
+    """Whether parameter changes propagate topologically in the current thread."""
+    return getattr(_propagation_state, 'mode', propagation) == 'topological'
+
+
+@contextmanager
+def _propagate() -> Generator[_Propagation, None, None]:
+    """Collect watchers in a propagation, invoking them in order on exit of the outermost context."""
+    current = getattr(_propagation_state, 'current', None)
+    if current is not None:
+        yield current
+        return
+    current = _propagation_state.current = _Propagation()
+    try:
+        yield current
+        current.drain()
+    finally:
+        _propagation_state.current = None
+
+
+@contextmanager
+def propagation_mode(mode: t.Literal['depth-first', 'topological']) -> Generator[None, None, None]:
+    """
+    Context manager to temporarily change how parameter changes propagate to watchers.
+
+    By default (``'depth-first'``) watchers are invoked as soon as a
+    parameter they watch is set, so in a diamond-shaped dependency graph,
+    where two watchers of a parameter each set another parameter which a
+    third watcher depends on, the third watcher runs twice and first
+    observes an inconsistent intermediate state. With ``'topological'``
+    propagation watchers are instead queued and invoked once per change in
+    topological order of the dependency graph. The mode only applies to
+    the current thread, the default for all threads may be set globally
+    with ``param.parameterized.propagation``.
+
+    Parameters
+    ----------
+    mode : {'depth-first', 'topological'}
+        The propagation strategy to use within the context.
+
+    Examples
+    --------
+    >>> import param
+    >>> from param.parameterized import propagation_mode
+    >>> class Diamond(param.Parameterized):
+    ...     a = param.Number()
+    ...     b = param.Number()
+    ...     c = param.Number()
+    ...
+    ...     @param.depends('a', watch=True)
+    ...     def update_b(self):
+    ...         self.b = self.a + 1
+    ...
+    ...     @param.depends('a', watch=True)
+    ...     def update_c(self):
+    ...         self.c = self.a + 2
+    ...
+    ...     @param.depends('b', 'c', watch=True)
+    ...     def total(self):
+    ...         print(self.b + self.c)
+    >>> d = Diamond()
+    >>> with propagation_mode('topological'):
+    ...     d.a = 1
+    5
+    """
+    global _propagation_overrides
+    if mode not in ('depth-first', 'topological'):
+        raise ValueError(
+            f"Propagation mode must be 'depth-first' or 'topological', not {mode!r}."
+        )
+    previous = getattr(_propagation_state, 'mode', None)
+    _propagation_state.mode = mode
+    with _propagation_lock:
+        _propagation_overrides += 1
+    try:
+        yield
+    finally:
+        with _propagation_lock:
+            _propagation_overrides -= 1
+        if previous is None:
+            del _propagation_state.mode
+        else:
+            _propagation_state.mode = previous
+
+
 @contextmanager
 def _syncing(parameterized, parameters):
     old = parameterized._param__private.syncing
@@ -689,6 +944,21 @@ def get_method_owner(method: Callable[..., t.Any]) -> t.Any | None:
     return method.__self__
 
 
+def _unwrap_callback(fn: Callable[..., t.Any]) -> t.Any:
+    """Get the function underlying a watcher callback, unwrapping depends and weak callers."""
+    while isinstance(fn, partial):
+        if fn.func is _weak_call or fn.func is _weak_async_call:
+            fn = fn.args[0]()
+        else:
+            fn = fn.keywords.get('function') or fn.func
+    return fn
+
+
+def _watcher_owner(fn: Callable[..., t.Any]) -> t.Any | None:
+    """Get the instance owning a watcher callback, unwrapping depends and weak callers."""
+    return get_method_owner(_unwrap_callback(fn))
+
+
 @accept_arguments
 def output(func, *output, **kw):
     """
@@ -836,6 +1106,7 @@ def output(func, *output, **kw):
     return _output
 
 
+@lru_cache(maxsize=None)
 def _parse_dependency_spec(spec):
     """
     Parse param.depends string specifications into three components.
@@ -845,6 +1116,9 @@ def _parse_dependency_spec(spec):
     1. The dotted path to the sub-object
     2. The attribute being depended on, i.e. either a parameter or method
     3. The parameter attribute being depended on
+
+    Specifications are declared in code and parsed repeatedly whenever
+    instances are created or sub-objects change, so the result is cached.
     """
     assert spec.count(":")<=1
     spec = spec.strip()
@@ -861,6 +1135,19 @@ def _parse_dependency_spec(spec):
     return obj or None, attr, what or 'value'
 
 
+@lru_cache(maxsize=None)
+def _split_dependency_path(path: str) -> tuple[str, ...]:
+    """Split the dotted sub-object path returned by _parse_dependency_spec into its parts."""
+    return tuple(path[1:].split('.'))
+
+
+def _getattr_path(obj: t.Any, path: Iterable[str]) -> t.Any:
+    """Walk an attribute path, returning None if any attribute is missing."""
+    for attr in path:
+        obj = getattr(obj, attr, None)
+    return obj
+
+
 def _params_depended_on(minfo, dynamic=True, intermediate=True):
     """
     Resolve dependencies declared on a Parameterized method.
@@ -916,6 +1203,184 @@ def _resolve_mcs_deps(obj, resolved, dynamic, intermediate=True):
     return dependencies
 
 
+def _attribute_path(node: t.Any, self_name: str) -> str | None:
+    """Dotted path of an attribute access on ``self_name``, e.g. ``'a.b'`` for ``self.a.b``."""
+    parts = []
+    while isinstance(node, ast.Attribute):
+        parts.append(node.attr)
+        node = node.value
+    if not (isinstance(node, ast.Name) and node.id == self_name and parts):
+        return None
+    return '.'.join(reversed(parts))
+
+
+def _method_writes(function: t.Any) -> list[str]:
+    """
+    Find the dotted paths of the parameters a method sets on ``self`` or
+    its subobjects by inspecting its source, e.g. ``self.a = ...``,
+    ``self.sub.a = ...`` or ``self.param.update(a=...)``.
+    """
+    try:
+        tree = ast.parse(textwrap.dedent(inspect.getsource(function)))
+    except (OSError, TypeError, SyntaxError):
+        return []
+    fdef = tree.body[0] if tree.body else None
+    if not isinstance(fdef, (ast.FunctionDef, ast.AsyncFunctionDef)) or not fdef.args.args:
+        return []
+    self_name = fdef.args.args[0].arg
+    writes: list[str] = []
+    for node in ast.walk(fdef):
+        if isinstance(node, ast.Assign):
+            targets = [
+                elt for target in node.targets
+                for elt in (target.elts if isinstance(target, (ast.Tuple, ast.List)) else [target])
+            ]
+        elif isinstance(node, (ast.AugAssign, ast.AnnAssign)):
+            targets = [node.target]
+        elif isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute):
+            method = node.func.attr
+            path = _attribute_path(node.func.value, self_name)
+            if method not in ('update', 'trigger') or path is None or path.split('.')[-1] != 'param':
+                continue
+            prefix = path[:-len('param')]
+            names = [kw.arg for kw in node.keywords if kw.arg is not None]
+            for arg in node.args:
+                if isinstance(arg, ast.Dict):
+                    names += [k.value for k in arg.keys if isinstance(k, ast.Constant)]
+                elif isinstance(arg, ast.Constant):
+                    names.append(arg.value)
+            writes += [prefix + name for name in names if isinstance(name, str)]
+            continue
+        else:
+            continue
+        for target in targets:
+            path = _attribute_path(target, self_name)
+            if path is not None:
+                writes.append(path)
+    return writes
+
+
+class _DependsGraph:
+    """
+    Dependency graph of the methods of a Parameterized class declared
+    with ``@depends(..., watch=True)``.
+
+    Compiled once per class from the ``(name, queued, on_init, deps,
+    dynamic_deps)`` tuples in ``Parameters._depends['watch']``, so that
+    instances can set up their watchers in a single pass without
+    re-resolving each dependency.
+
+    `methods`: List of ``(name, queued, on_init, groups, dynamic_deps,
+    coroutine, executor)`` tuples, one per method, where ``groups`` is a
+    list of ``(target, what, parameter_names)`` tuples describing one
+    watcher each. A ``target`` of None stands for the instance itself,
+    otherwise it is the object or class owning the parameters.
+
+    `dynamic`: Dictionary mapping the name of the attribute at the root of
+    a dynamic dependency to the ``(name, queued, dynamic_deps)`` of the
+    methods that have to be rewired when that attribute changes.
+
+    `reads`: Dictionary mapping each method to the parameters of the
+    instance it depends on.
+
+    `paths`: Dictionary mapping each method to the dotted paths of all
+    parameter values it depends on, including those of subobjects, e.g.
+    ``'sub.a'``, and `writers` mapping such paths to the methods setting
+    them. Both are only compiled on first use by topological propagation
+    (see ``propagation_mode``): writes are found by inspecting the source
+    of each method for assignments to parameters of ``self`` or its
+    subobjects and calls to ``param.update`` and ``param.trigger``. Writes
+    that cannot be found statically, e.g. in helper methods, are learned
+    whenever a method is observed setting a parameter.
+    """
+
+    __slots__ = ('_functions', '_writers', 'dynamic', 'methods', 'paths', 'reads')
+
+    def __init__(self, cls: type[Parameterized], watch: list[t.Any]):
+        self.methods: list[tuple[
+            str, bool, bool, list[tuple[t.Any, str, list[str]]], list[DInfo], bool, t.Any
+        ]] = []
+        self.dynamic: dict[str, list[tuple[str, bool, list[DInfo]]]] = {}
+        self._functions: dict[str, t.Any] = {}
+        for name, queued, on_init, constant, dynamic in watch:
+            groups: dict[tuple[t.Any, ...], tuple[t.Any, str, list[str]]] = {}
+            for dep in constant:
+                if dep.inst is not None:
+                    target = dep.inst
+                elif issubclass(cls, dep.cls):
+                    target = None
+                else:
+                    target = dep.cls
+                key = (id(target), id(dep.cls), dep.what)
+                if key not in groups:
+                    groups[key] = (target, dep.what, [])
+                names = groups[key][2]
+                if dep.name not in names:
+                    names.append(dep.name)
+            function = self._functions[name] = getattr(cls, name)
+            executor = getattr(function, '_dinfo', {}).get('executor')
+            self.methods.append((
+                name, queued, on_init, list(groups.values()), dynamic,
+                iscoroutinefunction(function), executor
+            ))
+            by_attribute = defaultdict(list)
+            for ddep in dynamic:
+                by_attribute[ddep.spec.split(".")[0]].append(ddep)
+            for attribute, ddeps in by_attribute.items():
+                self.dynamic.setdefault(attribute, []).append((name, queued, ddeps))
+        self.reads: dict[str, list[str]] = {
+            method[0]: [
+                pname for target, what, names in method[3]
+                if target is None and what == 'value' for pname in names
+            ] for method in self.methods
+        }
+        self.paths: dict[str, list[str]] = {}
+        self._writers: dict[str, set[str]] | None = None
+
+    @property
+    def writers(self) -> dict[str, set[str]]:
+        if self._writers is None:
+            self._compile_writers()
+        return t.cast("dict[str, set[str]]", self._writers)
+
+    def _compile_writers(self) -> None:
+        self._writers = {}
+        for name, *_, dynamic, _, _ in self.methods:
+            paths = self.paths[name] = list(self.reads[name])
+            for ddep in dynamic:
+                path, attr, what = _parse_dependency_spec(ddep.spec)
+                if path is not None and attr != 'param' and what == 'value':
+                    paths.append(f'{path[1:]}.{attr}')
+            for path in _method_writes(self._functions[name]):
+                self._writers.setdefault(path, set()).add(name)
+
+    def read_paths(self, method: str) -> list[str]:
+        """Dotted paths of the parameter values ``method`` depends on."""
+        if self._writers is None:
+            self._compile_writers()
+        return self.paths.get(method, [])
+
+    def learn_write(self, method: str, path: str) -> bool:
+        """Record that ``method`` sets the parameter at ``path``, returning whether it was unknown."""
+        writers = self.writers.setdefault(path, set())
+        if method in writers:
+            return False
+        writers.add(method)
+        return True
+
+
+# Types of values compared by equality when deciding whether setting a
+# parameter changed its version. Any other value may have been modified
+# in place, so setting it always changes the version, even when it is the
+# same object, and deep comparisons are avoided.
+_SCALAR_TYPES = frozenset((bool, int, float, complex, str, bytes, type(None)))
+
+
+def _value_changed(old: t.Any, new: t.Any) -> bool:
+    """Whether setting a parameter from ``old`` to ``new`` changes its version."""
+    return not (type(old) is type(new) and type(new) in _SCALAR_TYPES and old == new)
+
+
 def _skip_event(*events, **kwargs):
     """
     Check whether a subobject event should be skipped.
@@ -1003,7 +1468,8 @@ def _m_caller(
     method_name: str,
     what: str = 'value',
     changed: t.Any = None,
-    callback: t.Callable[..., None] | None = None
+    callback: t.Callable[..., None] | None = None,
+    coroutine: bool | None = None,
 ) -> t.Callable[..., t.Any]:
     """
     Wrap a method call adding support for scheduling a callback
@@ -1011,12 +1477,100 @@ def _m_caller(
     changed but its values have not.
     """
     function = getattr(self, method_name)
-    _caller = _async_caller if iscoroutinefunction(function) else _sync_caller
+    if coroutine is None:
+        coroutine = iscoroutinefunction(function)
+    _caller = _async_caller if coroutine else _sync_caller
     caller = partial(_caller, what=what, changed=changed, callback=callback, function=function)
     t.cast("t.Any", caller)._watcher_name = method_name
     return caller
 
 
+class _WeakMethod:
+    """
+    Weak reference to a bound method, returning None once its owner is collected.
+
+    Methods bound to a :class:`Parameters` namespace, which is created on
+    demand, are resolved through a weak reference to the object owning the
+    namespace instead.
+    """
+
+    __slots__ = ('_name', '_ref')
+
+    def __init__(self, method, callback=None):
+        if method is None:
+            self._ref, self._name = _dead_ref, None
+            return
+        owner = method.__self__
+        if isinstance(owner, Parameters):
+            self._ref = weakref.ref(owner.self_or_cls, callback)
+            self._name = method.__name__
+        else:
+            self._ref = weakref.WeakMethod(method, callback)
+            self._name = None
+
+    def __call__(self):
+        obj = self._ref()
+        if obj is None or self._name is None:
+            return obj
+        return getattr(obj.param, self._name)
+
+    def __reduce__(self):
+        # Serialized as the method itself, re-establishing a weak
+        # reference to the unpickled (or copied) owner.
+        return type(self), (self(),)
+
+
+def _dead_ref():
+    return None
+
+
+# Callers for weak watchers at the module top level to support pickling.
+def _weak_call(ref: _WeakMethod, *args: t.Any, **kwargs: t.Any) -> t.Any:
+    method = ref()
+    if method is not None:
+        return method(*args, **kwargs)
+
+
+async def _weak_async_call(ref: _WeakMethod, *args: t.Any, **kwargs: t.Any) -> t.Any:
+    method = ref()
+    if method is not None:
+        return await method(*args, **kwargs)
+
+
+def _weak_callback(
+    fn: Callable[..., t.Any],
+    callback: Callable[[t.Any], None] | None = None
+) -> Callable[..., t.Any]:
+    """
+    Wrap a watcher callback so it only holds a weak reference to its owner.
+
+    Supports bound methods and the callers created by ``_m_caller``,
+    ``callback`` is invoked once the owner has been garbage collected.
+    """
+    if isinstance(fn, partial) and fn.keywords.get('function') is not None:
+        function = _weak_callback(fn.keywords['function'], callback)
+        caller = partial(fn.func, *fn.args, **dict(fn.keywords, function=function))
+        if hasattr(fn, '_watcher_name'):
+            t.cast("t.Any", caller)._watcher_name = t.cast("t.Any", fn)._watcher_name
+        return caller
+    if not inspect.ismethod(fn):
+        raise ValueError(
+            f'Weak watchers require a bound method as callback, got {fn!r}.'
+        )
+    weak_caller = _weak_async_call if iscoroutinefunction(fn) else _weak_call
+    return partial(weak_caller, _WeakMethod(fn, callback))
+
+
+def _unwatch_collected(obj: t.Any, watchers: list[Watcher], ref: t.Any) -> None:
+    """Remove weak watchers whose callback owner has been garbage collected."""
+    for watcher in watchers:
+        try:
+            obj.param.unwatch(watcher)
+        except (ValueError, KeyError):
+            # The watcher or its parameter was already removed
+            pass
+
+
 def _add_doc(obj, docstring):
     """Add a docstring to a namedtuple."""
     obj.__doc__ = docstring
@@ -1081,7 +1635,7 @@ _add_doc(Event,
     or  None if type not yet known
     """)
 
-_Watcher = namedtuple("_Watcher", "inst cls fn mode onlychanged parameter_names what queued precedence")
+_Watcher = namedtuple("_Watcher", "inst cls fn mode onlychanged parameter_names what queued precedence executor")
 
 class Watcher(_Watcher):
     """
@@ -1115,14 +1669,19 @@ class Watcher(_Watcher):
     `precedence` : A numeric value which determines the precedence of
     the watcher.  Lower precedence values are executed
     with higher priority.
+
+    `executor` : None to invoke the callback inline, or 'thread',
+    'process' or a `concurrent.futures.Executor` to dispatch the
+    callback to an executor.
     """
 
     def __new__(cls_, *args, **kwargs):
-        """Create a new instance of the class, setting a default precedence value.
+        """Create a new instance of the class, setting default precedence and executor values.
 
         This method allows creating a `Watcher` instance without explicitly
-        specifying a `precedence` value. If `precedence` is not provided, it
-        defaults to `0`.
+        specifying a `precedence` or `executor` value. If `precedence` is not
+        provided, it defaults to `0`, if `executor` is not provided it
+        defaults to `None`.
 
         Parameters
         ----------
@@ -1139,6 +1698,8 @@ class Watcher(_Watcher):
         values.update(kwargs)
         if 'precedence' not in values:
             values['precedence'] = 0
+        if 'executor' not in values:
+            values['executor'] = None
         return super().__new__(cls_, **values)
 
     def __str__(self):
@@ -1147,6 +1708,380 @@ class Watcher(_Watcher):
         return f"{cls.__name__}({attrs})"
 
 
+class AsyncScheduler:
+    """
+    Scheduler for coroutine watchers and coroutine methods run ``on_init``.
+
+    Coroutines are still handed to the registered ``async_executor`` to be
+    placed on an event loop, but the scheduler keeps track of the resulting
+    tasks. This makes it possible to bound the number of coroutine callbacks
+    running concurrently, to cancel superseded runs of the same watcher when
+    a newer event arrives and to wait for all pending callbacks using
+    :meth:`Parameters.idle`.
+
+    The scheduler also dispatches synchronous watchers declared with an
+    ``executor`` to a ``concurrent.futures`` executor, ensuring that the
+    invocations of each watcher run one at a time and in order.
+
+    A scheduler may be set globally on ``param.parameterized.async_scheduler``,
+    or per :class:`Parameterized` class or instance on ``.param.scheduler``.
+
+    Parameters
+    ----------
+    max_concurrency : int | None, optional
+        Maximum number of coroutine callbacks that may run at the same time.
+        Additional callbacks wait for a free slot in submission order. By
+        default concurrency is unbounded.
+    cancel_superseded : bool, optional
+        Whether to cancel a pending or running invocation of a watcher when
+        a newer event for the same watcher is scheduled. Default is ``False``.
+
+    Examples
+    --------
+    >>> import param
+    >>> class P(param.Parameterized):
+    ...     a = param.Number()
+    ...
+    ...     @param.depends('a', watch=True)
+    ...     async def update(self):
+    ...         ...
+    >>> p = P()
+    >>> p.param.scheduler = param.parameterized.AsyncScheduler(
+    ...     max_concurrency=2, cancel_superseded=True
+    ... )
+
+    Within a coroutine wait for all pending callbacks:
+
+    >>> p.a = 1
+    >>> await p.param.idle()  # doctest: +SKIP
+    """
+
+    _max_errors = 100
+
+    def __init__(self, max_concurrency: int | None = None, cancel_superseded: bool = False):
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError(
+                "AsyncScheduler max_concurrency must be a positive integer "
+                f"or None, not {max_concurrency!r}."
+            )
+        self.max_concurrency = max_concurrency
+        self.cancel_superseded = cancel_superseded
+        self._reset()
+
+    def _reset(self):
+        # Futures of scheduled callbacks mapped to the objects they belong to
+        self._pending: dict[t.Any, tuple[t.Any, ...]] = {}
+        # Future of the callback executed by each running task
+        self._running: dict[t.Any, t.Any] = {}
+        # Most recent task scheduled for each watcher
+        self._latest: dict[t.Any, t.Any] = {}
+        self._semaphores: t.Any = weakref.WeakKeyDictionary()
+        # Queued executor submissions of each watcher, the first is running
+        self._queues: dict[t.Any, deque] = {}
+        self._lock = threading.Lock()
+        self._errors: list[tuple[tuple[t.Any, ...], BaseException]] = []
+
+    def __getstate__(self):
+        return {'max_concurrency': self.max_concurrency,
+                'cancel_superseded': self.cancel_superseded}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._reset()
+
+    def __repr__(self):
+        return (f"{type(self).__name__}(max_concurrency={self.max_concurrency!r}, "
+                f"cancel_superseded={self.cancel_superseded!r})")
+
+    @property
+    def pending(self) -> int:
+        """Number of coroutine callbacks that are running or waiting to run."""
+        return len(self._pending)
+
+    def schedule(
+        self,
+        fn: Callable[[], t.Awaitable[t.Any]],
+        key: t.Any = None,
+        owners: Iterable[t.Any] = (),
+    ) -> None:
+        """
+        Schedule a coroutine function for execution.
+
+        Parameters
+        ----------
+        fn : callable
+            Coroutine function called without arguments.
+        key : hashable, optional
+            Identifies the callback, e.g. a :class:`Watcher`. When
+            ``cancel_superseded`` is enabled an earlier run scheduled with
+            the same key is cancelled.
+        owners : iterable, optional
+            Objects the callback belongs to, used by :meth:`idle` to only
+            wait for the callbacks of a particular object.
+        """
+        import asyncio
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Without a running loop the executor runs the coroutine to
+            # completion, errors are raised to the caller as before.
+            done = None
+        else:
+            # Track the callback from the moment it is scheduled so that
+            # idle() also waits for callbacks that have not started yet.
+            done = loop.create_future()
+            with self._lock:
+                self._pending[done] = tuple(owners)
+        async_executor(partial(self._run, fn, key, tuple(owners), done))
+
+    def submit(
+        self,
+        executor: str | concurrent.futures.Executor,
+        fn: Callable[[], t.Any],
+        key: t.Any = None,
+        owners: Iterable[t.Any] = (),
+    ) -> concurrent.futures.Future:
+        """
+        Submit a synchronous callback to a ``concurrent.futures`` executor.
+
+        Callbacks submitted with the same key are executed one at a time
+        in submission order, callbacks with different keys may run in
+        parallel.
+
+        Parameters
+        ----------
+        executor : str | concurrent.futures.Executor
+            ``'thread'`` or ``'process'`` to use a shared default pool, or
+            an executor instance.
+        fn : callable
+            Callable invoked without arguments. Must be picklable when
+            using a process pool.
+        key : hashable, optional
+            Identifies the callback, e.g. a :class:`Watcher`. When
+            ``cancel_superseded`` is enabled queued submissions with the same
+            key that have not started yet are cancelled.
+        owners : iterable, optional
+            Objects the callback belongs to, used by :meth:`idle` to only
+            wait for the callbacks of a particular object.
+
+        Returns
+        -------
+        concurrent.futures.Future
+            Future resolving to the result or exception of the callback.
+        """
+        import concurrent.futures
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        owners = tuple(owners)
+        key = object() if key is None else key
+        entry = (_resolve_executor(executor), fn, owners, future)
+        with self._lock:
+            self._pending[future] = owners
+            queue = self._queues.get(key)
+            if queue is None:
+                queue = self._queues[key] = deque()
+            elif self.cancel_superseded:
+                while len(queue) > 1:
+                    superseded = queue.pop()[-1]
+                    superseded.cancel()
+                    self._pending.pop(superseded, None)
+            queue.append(entry)
+            start = len(queue) == 1
+        if start:
+            self._submit_next(key)
+        return future
+
+    def _submit_next(self, key):
+        import concurrent.futures
+        with self._lock:
+            executor, fn, _, future = self._queues[key][0]
+        if future.set_running_or_notify_cancel():
+            try:
+                inner = executor.submit(fn)
+            except Exception as e:
+                inner = concurrent.futures.Future()
+                inner.set_exception(e)
+        else:
+            inner = future
+        inner.add_done_callback(partial(self._submitted_done, key))
+
+    def _submitted_done(self, key, inner):
+        with self._lock:
+            queue = self._queues[key]
+            _, fn, owners, future = queue.popleft()
+            if not queue:
+                del self._queues[key]
+        if inner is not future:
+            if inner.cancelled():
+                future.cancel()
+            elif inner.exception() is not None:
+                error = inner.exception()
+                self._record_error(owners, error)
+                get_logger().error(
+                    f'Exception in callback {fn!r} dispatched to executor.',
+                    exc_info=error
+                )
+                future.set_exception(error)
+            else:
+                future.set_result(inner.result())
+        with self._lock:
+            self._pending.pop(future, None)
+            submit_next = key in self._queues
+        if submit_next:
+            self._submit_next(key)
+
+    def _record_error(self, owners, error):
+        with self._lock:
+            if len(self._errors) >= self._max_errors:
+                self._errors.pop(0)
+            self._errors.append((owners, error))
+
+    def _semaphore(self):
+        if self.max_concurrency is None:
+            return None
+        import asyncio
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return semaphore
+
+    async def _run(self, fn, key, owners, done):
+        import asyncio
+        task = asyncio.current_task()
+        if done is not None:
+            self._running[task] = done
+        if key is not None and self.cancel_superseded:
+            previous = self._latest.get(key)
+            if previous is not None and not previous.done():
+                previous.cancel()
+            self._latest[key] = task
+        try:
+            semaphore = self._semaphore()
+            if semaphore is None:
+                await fn()
+            else:
+                async with semaphore:
+                    await fn()
+        except asyncio.CancelledError:
+            # Swallow cancellation of superseded runs only
+            if key is None or self._latest.get(key) is task:
+                raise
+        except Exception as e:
+            if done is None:
+                raise
+            self._record_error(owners, e)
+            asyncio.get_running_loop().call_exception_handler({
+                'message': f'Exception in scheduled coroutine callback {fn!r}',
+                'exception': e,
+                'task': task,
+            })
+        finally:
+            if done is not None:
+                self._running.pop(task, None)
+                with self._lock:
+                    self._pending.pop(done, None)
+                if not done.done():
+                    done.set_result(None)
+            if key is not None and self._latest.get(key) is task:
+                del self._latest[key]
+
+    async def idle(self, owner: t.Any = None) -> None:
+        """
+        Wait until all pending callbacks have completed.
+
+        Callbacks scheduled while waiting, e.g. by a callback setting
+        another parameter, are waited for as well. If any of the awaited
+        callbacks raised an exception the first one is re-raised.
+
+        Parameters
+        ----------
+        owner : object, optional
+            Only wait for callbacks belonging to this object.
+        """
+        import asyncio
+        import concurrent.futures
+        # A callback waiting for idle must not wait for itself
+        current = self._running.get(asyncio.current_task())
+
+        def owned(owners):
+            return owner is None or any(o is owner for o in owners)
+
+        while True:
+            with self._lock:
+                scheduled = list(self._pending.items())
+            pending = [
+                asyncio.wrap_future(done)
+                if isinstance(done, concurrent.futures.Future) else done
+                for done, owners in scheduled
+                if done is not current and owned(owners)
+            ]
+            if not pending:
+                break
+            await asyncio.wait(pending)
+        with self._lock:
+            errors = [e for owners, e in self._errors if owned(owners)]
+            self._errors = [(owners, e) for owners, e in self._errors if not owned(owners)]
+        if errors:
+            raise errors[0]
+
+
+#: Scheduler used for coroutine callbacks of objects that do not declare one.
+async_scheduler = AsyncScheduler()
+
+# Shared default executors created on first use
+_executors: dict[str, concurrent.futures.Executor] = {}
+
+def _resolve_executor(executor: str | concurrent.futures.Executor) -> concurrent.futures.Executor:
+    """Resolve an executor specification to a ``concurrent.futures`` executor."""
+    if not isinstance(executor, str):
+        return executor
+    import concurrent.futures
+    if executor not in _executors:
+        if executor == 'thread':
+            _executors[executor] = concurrent.futures.ThreadPoolExecutor(thread_name_prefix='param')
+        elif executor == 'process':
+            _executors[executor] = concurrent.futures.ProcessPoolExecutor()
+        else:
+            raise ValueError(
+                f"Executor must be 'thread', 'process' or a concurrent.futures.Executor, not {executor!r}."
+            )
+    return _executors[executor]
+
+def _is_process_executor(executor: str | concurrent.futures.Executor) -> bool:
+    """Whether callbacks submitted to the executor run in another process."""
+    if executor == 'process':
+        return True
+    elif isinstance(executor, str):
+        return False
+    import concurrent.futures
+    return isinstance(executor, concurrent.futures.ProcessPoolExecutor)
+
+def _validate_executor(executor: t.Any, fn: t.Any = None) -> None:
+    if executor is None:
+        return
+    elif isinstance(executor, str):
+        if executor not in ('thread', 'process'):
+            raise ValueError(
+                f"Executor must be 'thread', 'process' or a concurrent.futures.Executor, not {executor!r}."
+            )
+    elif not callable(getattr(executor, 'submit', None)):
+        raise ValueError(
+            "Executor must be 'thread', 'process' or a concurrent.futures.Executor, "
+            f"not {type(executor).__name__}."
+        )
+    if fn is not None and iscoroutinefunction(fn):
+        raise ValueError(
+            "Coroutine callbacks cannot be dispatched to an executor, they "
+            "are scheduled on the event loop by the AsyncScheduler."
+        )
+
+def _call_skipping(fn, *args, **kwargs):
+    """Call a watcher callback ignoring Skip, defined on the module to support pickling."""
+    try:
+        return fn(*args, **kwargs)
+    except Skip:
+        return None
+
 
 class ParameterMetaclass(type):
     """Metaclass allowing control over creation of Parameter classes."""
@@ -1866,10 +2801,13 @@ class Parameter(_ParameterBase, t.Generic[_T]):
                 "An event cannot be triggered for an unbound parameter."
             )
         event = Event(what=attribute, name=self.name, obj=None, cls=self.owner, old=old, new=new, type=None)
+        if profiling.enabled or propagation != 'depth-first' or _propagation_overrides:
+            self.owner.param._dispatch_event(self.watchers[attribute], event)
+            return
         for watcher in self.watchers[attribute]:
             self.owner.param._call_watcher(watcher, event)
         if not self.owner.param._BATCH_WATCH:
-            self.owner.param._batch_call_watchers()
+            self.owner.param._flush_events()
 
     def _invalidate_init_cache(self):
         try:
@@ -2029,6 +2967,18 @@ class Parameter(_ParameterBase, t.Generic[_T]):
                 obj._param__private.values[name] = val
         self._post_setter(obj, val)
 
+        # Class-level sets always target the class owning the parameter,
+        # ParameterizedMetaclass copies inherited parameters onto the
+        # subclass that receives the assignment before setting them.
+        # Versions are only tracked once they were requested, see Parameters.version
+        private = (self.owner if obj is None else obj)._param__private
+        versions = private.versions
+        if versions is not None and (obj is None or private.initialized) and (
+            private.parameters_state['TRIGGER'] or _value_changed(_old, val)
+        ):
+            versions[name] = versions.get(name, 0) + 1
+            private.version += 1
+
         if obj is None:
             self._invalidate_init_cache()
 
@@ -2053,11 +3003,20 @@ class Parameter(_ParameterBase, t.Generic[_T]):
 
         event = Event(what='value', name=name, obj=obj, cls=self.owner, old=_old, new=val, type=None)
 
-        # Copy watchers here since they may be modified inplace during iteration
-        for watcher in sorted(watchers, key=lambda w: w.precedence):
-            obj.param._call_watcher(watcher, event)
-        if not obj.param._BATCH_WATCH:
-            obj.param._batch_call_watchers()
+        if not (profiling.enabled or propagation != 'depth-first' or _propagation_overrides):
+            # Copy watchers here since they may be modified inplace during iteration
+            for watcher in sorted(watchers, key=lambda w: w.precedence):
+                obj.param._call_watcher(watcher, event)
+            if not obj.param._BATCH_WATCH:
+                obj.param._flush_events()
+        elif profiling.enabled:
+            owner = obj if isinstance(obj, type) else type(obj)
+            profiling._profile.call(
+                f'set {owner.__name__}.{name}', obj.param._dispatch_event, (watchers, event),
+                category='set', info={'object': obj.name}, record=False
+            )
+        else:
+            obj.param._dispatch_event(watchers, event)
 
     def _validate_value(self, value, allow_None):
         """Validate the parameter value against constraints.
@@ -2484,6 +3443,37 @@ class Parameters:
     def self_or_cls(self_) -> Parameterized | type[Parameterized]:
         return self_.cls if self_.self is None else self_.self
 
+    @property
+    def scheduler(self_) -> AsyncScheduler:
+        """
+        The :class:`AsyncScheduler` executing coroutine callbacks.
+
+        Looked up on the instance, then on the class hierarchy, falling
+        back to the global ``param.parameterized.async_scheduler``.
+        """
+        if self_.self is not None:
+            scheduler = getattr(self_.self._param__private, 'scheduler', None)
+            if scheduler is not None:
+                return scheduler
+        for cls in self_.cls.__mro__:
+            private = cls.__dict__.get('_param__private')
+            if private is None:
+                continue
+            scheduler = getattr(private.class_ns, 'scheduler', None)
+            if scheduler is not None:
+                return scheduler
+        return async_scheduler
+
+    @scheduler.setter
+    def scheduler(self_, scheduler: AsyncScheduler | None):
+        if self_.self is not None and not isinstance(self_.self._param__private, _InstancePrivate):
+            raise RuntimeError(
+                'Setting a scheduler on a partially initialized Parameterized instance '
+                'is not allowed. Ensure you have called super().__init__(**params) in '
+                'the Parameterized instance constructor before setting a scheduler.'
+            )
+        self_.self_or_cls._param__private.scheduler = scheduler
+
     def __setstate__(self, state):
         # Set old parameters state on Parameterized.parameters_state
         self_, cls = state.get('self'), state.get('cls')
@@ -2655,9 +3645,11 @@ class Parameters:
                 setattr(self, name, resolved)
         return refs, deps
 
-    def _setup_refs(self_, refs: Mapping[str, Iterable[t.Any]]):
-        if self_.self is None:
-            return
+    @staticmethod
+    def _group_refs(
+        refs: Mapping[str, Iterable[t.Any]]
+    ) -> defaultdict[t.Any, list[tuple[str, str | None]]]:
+        """Group the parameters references depend on by their owner."""
         groups: defaultdict[t.Any, list[tuple[str, str | None]]] = defaultdict(list)
         for pname, subrefs in refs.items():
             for p in subrefs:
@@ -2667,42 +3659,110 @@ class Parameters:
                 else:
                     for sp in extract_dependencies(p):
                         groups[sp.owner].append((pname, sp.name))
+        return groups
+
+    @staticmethod
+    def _add_ref_index(
+        index: dict[tuple[int, str], list[str]],
+        groups: Mapping[t.Any, list[tuple[str, str | None]]],
+    ):
         for owner, grouped_pnames in groups.items():
-            refnames, pnames = zip(*grouped_pnames)
-            watched_pnames = [p for p in pnames if p is not None]
-            self_.self._param__private.ref_watchers.append((
-                refnames,
-                owner.param._watch(self_._sync_refs, list(set(watched_pnames)), precedence=-1)
-            ))
+            for pname, dep_name in grouped_pnames:
+                if dep_name is None:
+                    continue
+                dependents = index.setdefault((id(owner), dep_name), [])
+                if pname not in dependents:
+                    dependents.append(pname)
+
+    def _index_refs(self_, groups: Mapping[t.Any, list[tuple[str, str | None]]]):
+        """Index the references depending on each parameter, see _sync_refs."""
+        index: dict[tuple[int, str], list[str]] = {}
+        self_._add_ref_index(index, groups)
+        self_.self._param__private.ref_index = index
+
+    def _watch_ref_owner(self_, owner: t.Any, grouped_pnames: list[tuple[str, str | None]]):
+        refnames, pnames = zip(*grouped_pnames)
+        watched_pnames = [p for p in pnames if p is not None]
+        # Watch other objects weakly so they do not keep this one alive
+        self_.self._param__private.ref_watchers.append((
+            refnames,
+            owner.param._watch(
+                self_._sync_refs, list(set(watched_pnames)), precedence=-1,
+                weak=owner is not self_.self
+            )
+        ))
+
+    def _setup_refs(self_, refs: Mapping[str, Iterable[t.Any]]):
+        if self_.self is None:
+            return
+        groups = self_._group_refs(refs)
+        self_._index_refs(groups)
+        for owner, grouped_pnames in groups.items():
+            self_._watch_ref_owner(owner, grouped_pnames)
 
     def _update_ref(self_, name: str, ref: t.Any):
+        """
+        Point the parameter ``name`` to a new reference, only re-watching
+        the objects the previous or the new reference depend on.
+        """
         if self_.self is None:
             return
         param_private = self_.self._param__private
         if name in param_private.async_refs:
             param_private.async_refs.pop(name).cancel()
-        for _, watcher in param_private.ref_watchers:
+        groups = self_._group_refs({name: resolve_ref(ref, self_[name].nested_refs)})
+
+        # Replace the dependencies of the previous reference in the index
+        index = param_private.ref_index
+        for key, dependents in list(index.items()):
+            if name in dependents:
+                dependents.remove(name)
+                if not dependents:
+                    del index[key]
+        self_._add_ref_index(index, groups)
+
+        owners = {id(owner): owner for owner in groups}
+        ref_watchers = []
+        for refnames, watcher in param_private.ref_watchers:
             dep_obj = watcher.cls if watcher.inst is None else watcher.inst
-            dep_obj.param.unwatch(watcher)
-        self_.self._param__private.ref_watchers = []
-        refs = dict(self_.self._param__private.refs, **{name: ref})
-        deps = {name: resolve_ref(ref, self_[name].nested_refs) for name, ref in refs.items()}
-        self_._setup_refs(deps)
-        self_.self._param__private.refs = refs
+            if name in refnames or id(dep_obj) in owners:
+                dep_obj.param.unwatch(watcher)
+                owners[id(dep_obj)] = dep_obj
+            else:
+                ref_watchers.append((refnames, watcher))
+        param_private.ref_watchers = ref_watchers
+        for owner_id, owner in owners.items():
+            grouped_pnames = [
+                (pname, dep_name) for (dep_id, dep_name), dependents in index.items()
+                if dep_id == owner_id for pname in dependents
+            ]
+            if grouped_pnames:
+                self_._watch_ref_owner(owner, grouped_pnames)
+        param_private.refs = dict(param_private.refs, **{name: ref})
+
+    def _ref_kind(self_, pname: str, ref: t.Any) -> tuple[bool, bool]:
+        """Whether the reference of a parameter is resolved recursively and asynchronously."""
+        kinds = self_.self._param__private.ref_kinds
+        kind = kinds.get(pname)
+        if kind is None or kind[0] is not ref:
+            is_async = iscoroutinefunction(ref) or inspect.isgeneratorfunction(ref)
+            kind = kinds[pname] = (ref, self_[pname].nested_refs, is_async)
+        return kind[1], kind[2]
 
     def _sync_refs(self_, *events):
         if self_.self is None:
             return
+        private = self_.self._param__private
+        index, refs = private.ref_index, private.refs
+        # Only resolve the references depending on the changed parameters
+        affected = {
+            pname: None for e in events for pname in index.get((id(e.obj), e.name), ())
+            if pname in refs
+        }
         updates = {}
-        for pname, ref in self_.self._param__private.refs.items():
-            # Skip updating value if dependency has not changed
-            recursive = self_[pname].nested_refs
-            deps = resolve_ref(ref, recursive)
-            is_gen = inspect.isgeneratorfunction(ref)
-            is_async = iscoroutinefunction(ref) or is_gen
-            if not any((dep.owner is e.obj and dep.name == e.name) for dep in deps for e in events) and not is_async:
-                continue
-
+        for pname in affected:
+            ref = refs[pname]
+            recursive, is_async = self_._ref_kind(pname, ref)
             try:
                 new_val = resolve_value(ref, recursive)
             except Skip:
@@ -2715,9 +3775,14 @@ class Parameters:
 
             updates[pname] = new_val
 
-        with edit_constant(self_.self):
+        if not updates:
+            return
+        elif any(self_[pname].constant for pname in updates):
+            with edit_constant(self_.self), _syncing(self_.self, updates):
+                self_._update(updates)
+        else:
             with _syncing(self_.self, updates):
-                self_.update(updates)
+                self_._update(updates)
 
     def _resolve_ref(self_, pobj: Parameter, value: t.Any):
         is_gen = inspect.isgeneratorfunction(value)
@@ -2815,47 +3880,118 @@ class Parameters:
             # could instead have kept the same name
             new_object.param._generate_name()
 
+    @property
+    def _depends_graph(self_) -> _DependsGraph:
+        """Dependency graph of the class, compiled on first use."""
+        private = self_.cls._param__private
+        graph = private.depends_graph
+        if graph is None:
+            graph = private.depends_graph = _DependsGraph(
+                self_.cls, self_.cls.param._depends['watch']
+            )
+        return graph
+
     def _update_deps(self_, attribute: str | None = None, init: bool = False):
         obj = self_.self
         if obj is None:
             return
-        class_param = self_.cls.param
+        graph = self_._depends_graph
+        if not init:
+            # Clean up previous dynamic watchers for the updated attribute
+            # and watch the parameters of the new subobjects
+            if attribute is None:
+                rewire = [(m, q, d) for m, q, _, _, d, _, _ in graph.methods if d]
+            else:
+                rewire = graph.dynamic.get(attribute)
+                if not rewire:
+                    return
+            for method, queued, dynamic in rewire:
+                self_._watch_dynamic(obj, method, queued, dynamic)
+            return
+
         init_methods = []
-        for method, queued, on_init, constant, dynamic in class_param._depends['watch']:
-            # On initialization set up constant watchers; otherwise
-            # clean up previous dynamic watchers for the updated attribute
-            dynamic = [d for d in dynamic if attribute is None or d.spec.split(".")[0] == attribute]
-            if init:
-                constant_grouped = defaultdict(list)
-                for dep in _resolve_mcs_deps(obj, constant, []):
-                    constant_grouped[(id(dep.inst), id(dep.cls), dep.what)].append((None, dep))
-                for group in constant_grouped.values():
-                    self_._watch_group(obj, method, queued, t.cast("list[tuple[Parameter | None, PInfo]]", group))
-                m = getattr(self_.self, method)
-                if on_init and m not in init_methods:
+        for method, queued, on_init, groups, dynamic, coroutine, executor in graph.methods:
+            # On initialization set up constant watchers
+            for target, what, names in groups:
+                dep_obj = obj if target is None else target
+                dep_obj.param._watch(
+                    _m_caller(obj, method, what, coroutine=coroutine), names, what,
+                    queued=queued, precedence=-1, executor=executor, weak=dep_obj is not obj
+                )
+            if on_init:
+                m = getattr(obj, method)
+                if m not in init_methods:
                     init_methods.append(m)
-            elif dynamic:
-                for w in obj._param__private.dynamic_watchers.pop(method, []):
-                    (w.cls if w.inst is None else w.inst).param.unwatch(w)
+            if dynamic:
+                self_._watch_dynamic(obj, method, queued, dynamic)
+        for m in init_methods:
+            executor = m._dinfo.get('executor')
+            if iscoroutinefunction(m):
+                self_.scheduler.schedule(m, owners=(obj,))
+            elif executor is not None:
+                self_.scheduler.submit(executor, partial(_call_skipping, m), key=m, owners=(obj,))
             else:
-                continue
+                m()
 
+    def _watch_dynamic(
+        self_,
+        obj: Parameterized,
+        method: str,
+        queued: bool,
+        dynamic: list[DInfo],
+    ):
+        """
+        Watch the dynamic dependencies of a method, rewiring only the
+        watchers that changed since they were last set up.
+
+        Watchers are tracked per attribute at the root of the dependency
+        specs, e.g. ``'a'`` for ``'a.b.c'``. Resolving the dependencies
+        yields the set of watchers required for the current subobjects,
+        which is diffed against the existing watchers, so that when a
+        subobject is replaced only the watchers on the old subobject are
+        removed and only those on the new subobject are added.
+        """
+        by_attribute = defaultdict(list)
+        for ddep in dynamic:
+            by_attribute[ddep.spec.split('.')[0]].append(ddep)
+        method_watchers = obj._param__private.dynamic_watchers[method]
+        for attribute, ddeps in by_attribute.items():
             # Resolve dynamic dependencies one-by-one to be able to trace their watchers
             grouped = defaultdict(list)
-            for ddep in dynamic:
+            for ddep in ddeps:
                 for dep in _resolve_mcs_deps(obj, [], [ddep]):
                     grouped[(id(dep.inst), id(dep.cls), dep.what)].append((ddep, dep))
 
+            existing = {
+                self_._dynamic_watcher_key(w, spec): (spec, w)
+                for spec, w in method_watchers.get(attribute, [])
+            }
+            watchers = []
             for group in grouped.values():
+                spec = group[0][0].spec
+                key = self_._dynamic_group_key(group, spec)
+                if key in existing:
+                    watchers.append(existing.pop(key))
+                    continue
                 watcher = self_._watch_group(
                     obj, method, queued, t.cast("list[tuple[Parameter | None, PInfo]]", group), attribute
                 )
-                obj._param__private.dynamic_watchers[method].append(watcher)
-        for m in init_methods:
-            if iscoroutinefunction(m):
-                async_executor(m)
-            else:
-                m()
+                watchers.append((spec, watcher))
+            for _, w in existing.values():
+                (w.cls if w.inst is None else w.inst).param.unwatch(w)
+            method_watchers[attribute] = watchers
+
+    @staticmethod
+    def _dynamic_watcher_key(watcher: Watcher, spec: str) -> tuple[int, str, tuple[str, ...], str]:
+        owner = watcher.cls if watcher.inst is None else watcher.inst
+        return id(owner), watcher.what, tuple(watcher.parameter_names), spec
+
+    @staticmethod
+    def _dynamic_group_key(group: list[tuple[t.Any, PInfo]], spec: str) -> tuple[int, str, tuple[str, ...], str]:
+        param_dep = group[0][1]
+        owner = param_dep.cls if param_dep.inst is None else param_dep.inst
+        names = tuple(dict.fromkeys(dep.name for _, dep in group))
+        return id(owner), param_dep.what, names, spec
 
     def _resolve_dynamic_deps(
         self, obj: Parameterized, dynamic_dep: Parameter, param_dep: PInfo, attribute: str | None = None
@@ -2872,7 +4008,8 @@ class Parameters:
         reinitialized so we return a callback which updates the
         dependencies.
         """
-        spec_parts = dynamic_dep.spec.split(':')[0].split('.')
+        spec_path, spec_attr, _ = _parse_dependency_spec(dynamic_dep.spec)
+        spec_parts = [*_split_dependency_path(spec_path), spec_attr]
         subobj: t.Any = obj
         subobjs = [obj]
         for subpath in spec_parts[:-1]:
@@ -2889,12 +4026,15 @@ class Parameters:
             return None, None, param_dep.what
         callback = None
         if depth > 0:
+            obj_ref = weakref.ref(obj)
             def cb(*events):
                 """
                 If a subobject changes, we need to notify the main
                 object to update the dependencies.
                 """
-                obj.param._update_deps(attribute)
+                owner = obj_ref()
+                if owner is not None:
+                    owner.param._update_deps(attribute)
             callback = cb
 
         p = '.'.join(spec_parts[depth+1:])
@@ -2941,8 +4081,11 @@ class Parameters:
                 obj, dynamic_dep, param_dep, attribute)
 
         mcaller = _m_caller(obj, name, what, subparams, callback)
+        executor = getattr(getattr(obj, name), '_dinfo', {}).get('executor')
+        # Dependencies on other objects are watched weakly so they do not keep obj alive
         return dep_obj.param._watch(
-            mcaller, params, param_dep.what, queued=queued, precedence=-1)
+            mcaller, params, param_dep.what, queued=queued, precedence=-1,
+            executor=executor, weak=dep_obj is not obj)
 
     @_recursive_repr()
     def _repr_html_(self_, open=True):
@@ -3105,8 +4248,7 @@ class Parameters:
         for tp in trigger_params:
             self_[tp]._mode = 'set'
 
-        values = self_.values()
-        restore = {k: values[k] for k, v in base.items() if k in values}
+        restore = {k: self_.get_value_generator(k) for k in base if k in self_}
 
         for (k, v) in base.items():
             if k not in self_:
@@ -3313,6 +4455,22 @@ class Parameters:
             event_type = 'changed' if watcher.onlychanged else 'set'
         return event._replace(type=event_type)
 
+    def _watcher_owners(self, watcher: Watcher) -> list[t.Any]:
+        """Objects a watcher callback belongs to, i.e. the watched object and the callback owner."""
+        owners = [self.self_or_cls]
+        fn_owner = _watcher_owner(watcher.fn)
+        if fn_owner is not None and fn_owner is not owners[0]:
+            owners.append(fn_owner)
+        return owners
+
+    def _watcher_profile_info(
+        self, watcher: Watcher, events: Iterable[Event]
+    ) -> tuple[str, str, dict[str, t.Any]]:
+        """Name, trace category and trace arguments of a profiled watcher call."""
+        name = profiling.callback_name(_unwrap_callback(watcher.fn))
+        category = 'depends' if hasattr(watcher.fn, '_watcher_name') else 'watcher'
+        return name, category, {'events': [event.name for event in events]}
+
     def _execute_watcher(self, watcher: Watcher, events: Iterable[Event]):
         if watcher.mode == 'args':
             args, kwargs = tuple(events), {}
@@ -3326,15 +4484,56 @@ class Parameters:
                                    "param.parameterized.async_executor, which "
                                    "schedules the function on an event loop." %
                                    watcher.fn)
-            async_executor(partial(watcher.fn, *args, **kwargs))
+            self.scheduler.schedule(
+                partial(watcher.fn, *args, **kwargs), key=watcher,
+                owners=self._watcher_owners(watcher)
+            )
+        elif watcher.executor is not None:
+            self.scheduler.submit(
+                watcher.executor, partial(_call_skipping, watcher.fn, *args, **kwargs),
+                key=watcher, owners=self._watcher_owners(watcher)
+            )
         else:
             try:
                 watcher.fn(*args, **kwargs)
             except Skip:
                 pass
 
-    def _call_watcher(self_, watcher: Watcher, event: Event):
-        """Invoke the given watcher appropriately given an Event object."""
+    def _execute_profiled(self, watcher: Watcher, events: Iterable[Event]):
+        """Execute a watcher recording the time spent in its callback, see ``param.profiling``."""
+        if iscoroutinefunction(watcher.fn) or (
+            # Callbacks sent to another process cannot record into this
+            # process' profile, so they are only wrapped for other executors
+            watcher.executor is not None and _is_process_executor(watcher.executor)
+        ):
+            self._execute_watcher(watcher, events)
+            return
+        if watcher.mode == 'args':
+            args, kwargs = tuple(events), {}
+        else:
+            args, kwargs = (), {event.name: event.new for event in events}
+        name, category, info = self._watcher_profile_info(watcher, events)
+        if watcher.executor is not None:
+            call = partial(_call_skipping, watcher.fn, *args, **kwargs)
+            self.scheduler.submit(
+                watcher.executor,
+                partial(profiling._profile.call, name, call, category=category, info=info),
+                key=watcher, owners=self._watcher_owners(watcher)
+            )
+            return
+        try:
+            profiling._profile.call(name, watcher.fn, args, kwargs, category, info)
+        except Skip:
+            pass
+
+    def _call_watcher(self_, watcher: Watcher, event: Event, execute: Callable[[Watcher, Iterable[Event]], None] | None = None):
+        """
+        Invoke the given watcher appropriately given an Event object.
+
+        Watchers are executed directly unless an ``execute`` function is
+        supplied by a dispatch site that is profiling or propagating
+        changes topologically.
+        """
         if self_._TRIGGER:
             pass
         elif watcher.onlychanged and (not self_._changed(event)):
@@ -3347,19 +4546,52 @@ class Parameters:
         else:
             event = self_._update_event_type(watcher, event, self_._TRIGGER)
             with _batch_call_watchers(self_.self_or_cls, enable=watcher.queued, run=False):
-                self_._execute_watcher(watcher, (event,))
+                if execute is None:
+                    self_._execute_watcher(watcher, (event,))
+                else:
+                    execute(watcher, (event,))
+
+    def _dispatch_event(self_, watchers: Iterable[Watcher], event: Event):
+        """Dispatch an event while profiling or propagating changes topologically."""
+        if _topological():
+            with _propagate() as current:
+                current.record_write(self_.self_or_cls, event.name)
+                self_._dispatch_watchers(watchers, event, partial(current.add, self_))
+        else:
+            self_._dispatch_watchers(watchers, event, self_._execute_profiled)
+
+    def _dispatch_watchers(self_, watchers, event, execute):
+        # Copy watchers here since they may be modified inplace during iteration
+        for watcher in sorted(watchers, key=lambda w: w.precedence):
+            self_._call_watcher(watcher, event, execute)
+        if not self_._BATCH_WATCH:
+            self_._flush_events(execute)
 
     def _batch_call_watchers(self_):
         """
         Batch call a set of watchers based on the parameter value
         settings in kwargs using the queued Event and watcher objects.
         """
+        if not (profiling.enabled or propagation != 'depth-first' or _propagation_overrides):
+            self_._flush_events()
+        elif not self_._events:
+            return
+        elif _topological():
+            # Collect all batched watchers before any of them is invoked
+            with _propagate() as current:
+                self_._flush_events(partial(current.add, self_))
+        else:
+            self_._flush_events(self_._execute_profiled)
+
+    def _flush_events(self_, execute: Callable[[Watcher, Iterable[Event]], None] | None = None):
         while self_._events:
             event_dict = OrderedDict([((event.name, event.what), event)
                                       for event in self_._events])
             watchers = self_._state_watchers[:]
             self_._events = []
             self_._state_watchers = []
+            if execute is not None and profiling.enabled:
+                profiling._profile.record_batch(len(event_dict))
 
             for watcher in sorted(watchers, key=lambda w: w.precedence):
                 events = [self_._update_event_type(watcher, event_dict[(name, watcher.what)],
@@ -3367,7 +4599,10 @@ class Parameters:
                           for name in watcher.parameter_names
                           if (name, watcher.what) in event_dict]
                 with _batch_call_watchers(self_.self_or_cls, enable=watcher.queued, run=False):
-                    self_._execute_watcher(watcher, events)
+                    if execute is None:
+                        self_._execute_watcher(watcher, events)
+                    else:
+                        execute(watcher, events)
 
     def set_dynamic_time_fn(self_, time_fn: Callable, sublistattr: str | None = None) -> None:
         """
@@ -3861,6 +5096,82 @@ class Parameters:
 
         return value
 
+    def version(self_, name: str | None = None) -> int:
+        """
+        Return the version of a parameter value or of the object as a whole.
+
+        Versions start at 0 and are incremented whenever a parameter is set
+        to a different value or triggered, so comparing versions is a cheap
+        way for caches to check whether a value changed since they last saw
+        it, without comparing the values themselves. Values of scalar types
+        (numbers, strings, bytes and ``None``) are compared by equality,
+        setting any other value increments the version even if it is the
+        same object. A value modified in place therefore only gets a new
+        version once it is set again or triggered.
+
+        Versions are only tracked from the first time they are requested on
+        an object (or class), changes made before that are not counted.
+
+        The version of a class-level parameter is tracked on the class it
+        was set on, setting it on a subclass does not change the version
+        on its superclasses while a subclass inheriting the parameter
+        reports the version of its superclass.
+
+        Parameters
+        ----------
+        name : str, optional
+            The name of the parameter. If omitted, the version of the
+            object is returned, which is incremented whenever any of its
+            parameter values change.
+
+        Returns
+        -------
+        int
+            The version of the parameter or object.
+
+        Raises
+        ------
+        ValueError
+            If ``name`` is not a parameter of the object.
+
+        Examples
+        --------
+        >>> import param
+        >>> class P(param.Parameterized):
+        ...     a = param.Number()
+        ...     b = param.List()
+        >>> p = P()
+        >>> p.param.version('a')
+        0
+        >>> p.a = 1
+        >>> p.a = 1
+        >>> p.param.version('a')
+        1
+        >>> p.b = [1]
+        >>> p.b.append(2)
+        >>> p.param.trigger('b')
+        >>> p.param.version('b'), p.param.version()
+        (2, 3)
+        """
+        private = self_.self_or_cls._param__private
+        if name is None:
+            if private.versions is None:
+                private.versions = {}
+            return private.version
+        if name not in self_.cls.param:
+            raise ValueError(
+                f"{name} parameter was not found in list of parameters of "
+                f"class {self_.cls.__name__}"
+            )
+        if self_.self is None:
+            # Inherited parameters are versioned on the class that set them
+            private = self_.cls.get_param_descriptor(name)[1]._param__private
+        if private.versions is None:
+            # Start tracking, so that objects nobody asks the version of
+            # do not pay for it on every set
+            private.versions = {}
+        return private.versions.get(name, 0)
+
     def method_dependencies(self_, name: str, intermediate: bool = False) -> list[PInfo]:
         """
         Retrieve the parameter dependencies of a specified method.
@@ -4012,17 +5323,18 @@ class Parameters:
         elif not dynamic:
             return [], [DInfo(spec=spec)]
         else:
-            if not hasattr(self_.self_or_cls, obj.split('.')[1]):
+            self_or_cls = self_.self_or_cls
+            path = _split_dependency_path(obj)
+            if not hasattr(self_or_cls, path[0]):
                 raise AttributeError(
-                    f'Dependency {obj[1:]!r} could not be resolved, {self_.self_or_cls} '
-                    f'has no parameter or attribute {obj.split(".")[1]!r}. Ensure '
+                    f'Dependency {obj[1:]!r} could not be resolved, {self_or_cls} '
+                    f'has no parameter or attribute {path[0]!r}. Ensure '
                     'the object being depended on is declared before calling the '
                     'Parameterized constructor.'
                 )
 
-            src = _getattrr(self_.self_or_cls, obj[1::], None)
+            src = _getattr_path(self_or_cls, path)
             if src is None:
-                path = obj[1:].split('.')
                 deps = []
                 # Attempt to partially resolve subobject path to ensure
                 # that if a subobject is later updated making the full
@@ -4033,7 +5345,7 @@ class Parameters:
                     subpath = path
                     while sub_src is None and subpath:
                         subpath = subpath[:-1]
-                        sub_src = _getattrr(self_.self_or_cls, '.'.join(subpath), None)
+                        sub_src = _getattr_path(self_or_cls, subpath) if subpath else None
                     if subpath:
                         subdeps, _ = self_._spec_to_obj(
                             '.'.join(path[:len(subpath)+1]), dynamic, intermediate)
@@ -4124,6 +5436,8 @@ class Parameters:
         onlychanged: bool = True,
         queued: bool = False,
         precedence: int = 0,
+        executor: str | concurrent.futures.Executor | None = None,
+        weak: bool = False,
     ) -> Watcher:
         """
         Register a callback function to be invoked for parameter events.
@@ -4163,6 +5477,22 @@ class Parameters:
             executed earlier. User-defined watchers must use positive precedence
             values. Negative precedences are reserved for internal watchers
             (e.g., those set up by :func:`depends`). Default is ``0``.
+        executor : str or concurrent.futures.Executor, optional
+            By default (``None``) the callback is invoked inline, blocking
+            the code that set the parameter until it returns. Long-running
+            callbacks may instead be dispatched to an executor, either
+            ``'thread'`` or ``'process'`` to use a shared default pool or a
+            :class:`concurrent.futures.Executor` instance. Invocations of the
+            same watcher still run one at a time and in order. Errors are
+            logged and re-raised by :meth:`idle`, which can also be awaited
+            to wait for the callbacks to complete.
+        weak : bool, optional
+            Whether to only hold a weak reference to the object owning ``fn``,
+            which must be a bound method. By default (``False``) the watcher
+            keeps the owner of the callback alive for as long as the watched
+            object exists. Weak watchers are removed automatically once the
+            owner is garbage collected, allowing short-lived objects to watch
+            long-lived ones without having to :meth:`unwatch` explicitly.
 
         Returns
         -------
@@ -4208,7 +5538,7 @@ class Parameters:
             raise ValueError("User-defined watch callbacks must declare "
                              "a positive precedence. Negative precedences "
                              "are reserved for internal Watchers.")
-        return self_._watch(fn, parameter_names, what, onlychanged, queued, precedence)
+        return self_._watch(fn, parameter_names, what, onlychanged, queued, precedence, executor, weak)
 
     def _watch(
         self_,
@@ -4218,11 +5548,17 @@ class Parameters:
         onlychanged: bool = True,
         queued: bool = False,
         precedence: int = -1,
+        executor: str | concurrent.futures.Executor | None = None,
+        weak: bool = False,
     ) -> Watcher:
+        _validate_executor(executor, fn)
         if isinstance(parameter_names, (list, tuple)):
             parameter_names = tuple(parameter_names)
         else:
             parameter_names = (parameter_names,)
+        collected: list[Watcher] = []
+        if weak:
+            fn = _weak_callback(fn, partial(_unwatch_collected, self_.self_or_cls, collected))
         watcher = Watcher(
             inst=self_.self,
             cls=self_.cls,
@@ -4233,7 +5569,9 @@ class Parameters:
             what=what,
             queued=queued,
             precedence=precedence,
+            executor=executor,
         )
+        collected.append(watcher)
         self_._register_watcher('append', watcher, what)
         return watcher
 
@@ -4298,7 +5636,9 @@ class Parameters:
         what: t.Literal["value"] = 'value',
         onlychanged: bool = True,
         queued: bool = False,
-        precedence: int = 0
+        precedence: int = 0,
+        executor: str | concurrent.futures.Executor | None = None,
+        weak: bool = False,
     ) -> Watcher:
         """
         Register a callback function for changes in parameter values.
@@ -4339,6 +5679,12 @@ class Parameters:
             The precedence level of the watcher. Lower precedence values are executed
             earlier. User-defined watchers must use positive precedence values.
             Default is ``0``.
+        executor : str or concurrent.futures.Executor, optional
+            Executor to dispatch the callback to instead of invoking it inline,
+            see :meth:`watch`. Default is ``None``.
+        weak : bool, optional
+            Whether to only hold a weak reference to the object owning the
+            bound method ``fn``, see :meth:`watch`. Default is ``False``.
 
         Returns
         -------
@@ -4394,17 +5740,50 @@ class Parameters:
                 stacklevel=_find_stack_level(),
             )
         assert what == 'value'
+        _validate_executor(executor, fn)
         if isinstance(parameter_names, (list, tuple)):
             parameter_names = tuple(parameter_names)
         else:
             parameter_names = (parameter_names,)
+        collected: list[Watcher] = []
+        if weak:
+            fn = _weak_callback(fn, partial(_unwatch_collected, self_.self_or_cls, collected))
         watcher = Watcher(inst=self_.self, cls=self_.cls, fn=fn,
                           mode='kwargs', onlychanged=onlychanged,
                           parameter_names=parameter_names, what=what,
-                          queued=queued, precedence=precedence)
+                          queued=queued, precedence=precedence,
+                          executor=executor)
+        collected.append(watcher)
         self_._register_watcher('append', watcher, what)
         return watcher
 
+    async def idle(self_) -> None:
+        """
+        Wait until all pending coroutine callbacks of this object have completed.
+
+        Coroutine watchers and ``@param.depends`` coroutine methods are run
+        as tasks by the :attr:`scheduler`, watchers declared with an
+        ``executor`` are dispatched to that executor. Awaiting ``idle`` waits
+        for all such callbacks belonging to this object, including callbacks
+        scheduled while waiting. If any of these callbacks raised an
+        exception, the first one is re-raised.
+
+        Examples
+        --------
+        >>> import param
+        >>> class MyClass(param.Parameterized):
+        ...     a = param.Number(default=1)
+        ...
+        ...     @param.depends('a', watch=True)
+        ...     async def callback(self):
+        ...         print(f"a changed to {self.a}")
+        >>> instance = MyClass()
+        >>> instance.a = 2
+        >>> await instance.param.idle()  # doctest: +SKIP
+        a changed to 2
+        """
+        await self_.scheduler.idle(self_.self_or_cls)
+
     # Instance methods
 
     # Designed to avoid any processing unless the print
@@ -4806,6 +6185,10 @@ class ParameterizedMetaclass(type):
         if docstring_signature:
             mcs.__class_docstring()
 
+        # Values set while creating the class are not changes
+        _param__private.versions = None
+        _param__private.version = 0
+
     @property
     def __get_params(mcs) -> Parameters:
         return mcs._param__parameters  # type: ignore[attr-defined,return-value, ty:invalid-return-type]
@@ -4948,6 +6331,13 @@ class ParameterizedMetaclass(type):
                 parameter = copy.copy(parameter)
                 parameter.owner = t.cast("t.Any", mcs)
                 type.__setattr__(mcs, attribute_name, parameter)
+                # Carry on from the inherited version so it keeps increasing
+                inherited = owning_class._param__private.versions
+                if inherited and inherited.get(attribute_name):
+                    private = mcs._param__private
+                    if private.versions is None:
+                        private.versions = {}
+                    private.versions[attribute_name] = inherited[attribute_name]
             mcs.__dict__[attribute_name].__set__(None,value)
 
         else:
@@ -5515,6 +6905,15 @@ class _ClassPrivate:
         Whether the class has been renamed by a super class
     params: dict
         Dict of parameter_name:parameter.
+    scheduler: AsyncScheduler | None
+        Scheduler for coroutine callbacks declared on the class.
+    depends_graph: _DependsGraph | None
+        Compiled dependency graph of the watched depends methods.
+    versions: dict | None
+        Dict of parameter name: number of times its class value changed,
+        None until versions are first requested.
+    version: int
+        Number of times any class parameter value changed.
     """
 
     __slots__ = [
@@ -5528,6 +6927,10 @@ class _ClassPrivate:
         'initialized',
         'signature',
         'explicit_no_refs',
+        'scheduler',
+        'depends_graph',
+        'versions',
+        'version',
     ]
 
     parameters_state: dict[str, t.Any]
@@ -5540,6 +6943,10 @@ class _ClassPrivate:
     initialized: bool
     signature: inspect.Signature | None
     explicit_no_refs: list[str]
+    scheduler: AsyncScheduler | None
+    depends_graph: _DependsGraph | None
+    versions: dict[str, int] | None
+    version: int
 
     def __init__(
         self,
@@ -5566,11 +6973,21 @@ class _ClassPrivate:
         self.initialized = False
         self.signature = None
         self.explicit_no_refs = [] if explicit_no_refs is None else explicit_no_refs
+        self.scheduler = None
+        self.depends_graph = None
+        self.versions = None
+        self.version = 0
 
     def __getstate__(self):
-        return {slot: getattr(self, slot) for slot in self.__slots__}
+        state = {slot: getattr(self, slot) for slot in self.__slots__}
+        # The compiled graph is only a cache, recompiled on demand
+        state['depends_graph'] = None
+        return state
 
     def __setstate__(self, state):
+        # Versions are missing from states pickled by older versions
+        self.versions = None
+        self.version = 0
         for k, v in state.items():
             setattr(self, k, v)
 
@@ -5582,9 +6999,16 @@ class _InstancePrivate:
     parameters_state: dict
         Dict holding some transient states
     dynamic_watchers: defaultdict
-        Dynamic watchers
+        Dynamic watchers by method name and attribute at the root of the
+        dependency spec, each stored along with the spec it resolves.
     ref_watchers: list[Watcher]
         Watchers used for internal references
+    ref_index: dict
+        Dict of (id of owner, parameter name): names of the parameters
+        whose reference depends on that parameter
+    ref_kinds: dict
+        Dict of parameter name: (reference, whether it is resolved
+        recursively, whether it is resolved asynchronously)
     params: dict
         Dict of parameter_name:parameter
     refs: dict
@@ -5595,6 +7019,13 @@ class _InstancePrivate:
                 parameter_attribute (e.g. 'value'): list of `Watcher`s
     values: dict
         Dict of parameter name: value.
+    scheduler: AsyncScheduler | None
+        Scheduler for coroutine callbacks declared on the instance.
+    versions: dict | None
+        Dict of parameter name: number of times its value changed, None
+        until versions are first requested.
+    version: int
+        Number of times any parameter value changed.
     """
 
     __slots__ = [
@@ -5605,29 +7036,39 @@ class _InstancePrivate:
         'async_refs',
         'refs',
         'ref_watchers',
+        'ref_index',
+        'ref_kinds',
         'syncing',
         'watchers',
         'values',
         'explicit_no_refs',
+        'scheduler',
+        'versions',
+        'version',
     ]
 
     initialized: bool
     parameters_state: dict[str, t.Any]
-    dynamic_watchers: defaultdict[str, list[Watcher]]
+    dynamic_watchers: defaultdict[str, dict[str, list[tuple[str, Watcher]]]]
     params: dict[str, Parameter]
     async_refs: dict[str, t.Any]
     refs: dict[str, t.Any]
     ref_watchers: list[tuple[tuple[str, ...], Watcher]]
+    ref_index: dict[tuple[int, str], list[str]]
+    ref_kinds: dict[str, tuple[t.Any, bool, bool]]
     syncing: set[str]
     watchers: dict[str, dict[str, list[Watcher]]]
     values: dict[str, t.Any]
     explicit_no_refs: list[str]
+    scheduler: AsyncScheduler | None
+    versions: dict[str, int] | None
+    version: int
 
     def __init__(
         self,
         initialized: bool = False,
         parameters_state: dict[str, t.Any] | None = None,
-        dynamic_watchers: dict[str, list[Watcher]] | None = None,
+        dynamic_watchers: dict[str, dict[str, list[tuple[str, Watcher]]]] | None = None,
         refs: dict[str, t.Any] | None = None,
         params: dict[str, Parameter] | None = None,
         watchers: dict[str, dict[str, list[Watcher]]] | None = None,
@@ -5645,9 +7086,14 @@ class _InstancePrivate:
                 "watchers": [] # Queue of batched watchers
             }
         self.ref_watchers = []
+        self.ref_index = {}
+        self.ref_kinds = {}
         self.async_refs = {}
+        self.scheduler = None
+        self.versions = None
+        self.version = 0
         self.parameters_state = parameters_state
-        self.dynamic_watchers = defaultdict(list, dynamic_watchers or ())
+        self.dynamic_watchers = defaultdict(dict, dynamic_watchers or ())
         self.params = {} if params is None else params
         self.refs = {} if refs is None else refs
         self.watchers = {} if watchers is None else watchers
@@ -5657,6 +7103,11 @@ class _InstancePrivate:
         return {slot: getattr(self, slot) for slot in self.__slots__}
 
     def __setstate__(self, state):
+        # Slots missing from states pickled by older versions
+        self.versions = None
+        self.version = 0
+        self.ref_index = {}
+        self.ref_kinds = {}
         for k, v in state.items():
             setattr(self, k, v)
 
@@ -5967,6 +7418,15 @@ class Parameterized(metaclass=ParameterizedMetaclass):
 
         for name,value in state.items():
             setattr(self,name,value)
+
+        # The reference index is keyed on the identity of the objects
+        # references depend on, which differ on copies
+        refs = self._param__private.refs
+        if refs:
+            self.param._index_refs(self.param._group_refs({
+                name: resolve_ref(ref, self.param[name].nested_refs)
+                for name, ref in refs.items()
+            }))
         self._param__private.initialized = True
 
     @_recursive_repr()
@@ -0,0 +1,338 @@
+"""
+Opt-in instrumentation of watcher callbacks and ``rx`` pipelines.
+
+Profiling is disabled by default, in which case the only overhead is a
+check of the module level ``enabled`` flag whenever a watcher is executed
+or an ``rx`` operation is evaluated. Once enabled Param records for each
+callback how often it was called along with the cumulative and maximum
+wall time spent in it, how many events were dispatched per batch and how
+deeply watchers triggered other watchers.
+
+A causal :class:`Trace` of parameter sets, watcher calls and ``rx``
+evaluations may additionally be recorded with :func:`trace` and exported
+as Chrome Trace Event JSON, to be displayed as a timeline in
+``chrome://tracing`` or Perfetto.
+
+Examples
+--------
+>>> import param
+>>> class P(param.Parameterized):
+...     a = param.Number()
+...
+...     @param.depends('a', watch=True)
+...     def update(self):
+...         pass
+>>> p = P()
+>>> with param.profiling.profile() as profile:
+...     p.a = 1
+>>> profile.stats()['callbacks']['P.update']['calls']
+1
+>>> with param.profiling.trace() as trace:
+...     p.a = 2
+>>> [event['name'] for event in trace.events]
+['P.update', 'set P.a']
+"""
+from __future__ import annotations
+
+import itertools
+import json
+import os
+import threading
+import time
+import typing as t
+from contextlib import contextmanager
+
+if t.TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+#: Whether instrumentation is currently enabled, see :func:`enable`.
+enabled = False
+
+
+class CallbackStats:
+    """
+    Statistics about the calls of a single callback.
+
+    `calls`: Number of times the callback was called
+
+    `total`: Cumulative wall time spent in the callback, in seconds
+
+    `max`: Longest wall time spent in a single call, in seconds
+    """
+
+    __slots__ = ('calls', 'max', 'total')
+
+    def __init__(self):
+        self.calls = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.calls if self.calls else 0.0
+
+    def to_dict(self) -> dict[str, float]:
+        return {'calls': self.calls, 'total': self.total, 'max': self.max, 'mean': self.mean}
+
+    def __repr__(self):
+        return (
+            f'{type(self).__name__}(calls={self.calls}, total={self.total:.6f}, '
+            f'max={self.max:.6f})'
+        )
+
+
+class Profile:
+    """
+    Statistics collected while profiling is enabled.
+
+    Callbacks are identified by their qualified name, e.g. ``'P.update'``
+    for a method or ``'rx.add'`` for an operation in an ``rx``
+    pipeline.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.reset()
+
+    def reset(self) -> None:
+        """Discard all statistics recorded so far."""
+        with self._lock:
+            self.callbacks: dict[str, CallbackStats] = {}
+            self.batches = 0
+            self.batch_events = 0
+            self.max_batch_events = 0
+            self.max_depth = 0
+
+    def call(
+        self,
+        name: str,
+        fn: Callable[..., t.Any],
+        args: tuple[t.Any, ...] = (),
+        kwargs: dict[str, t.Any] | None = None,
+        category: str = 'watcher',
+        info: dict[str, t.Any] | None = None,
+        record: bool = True,
+    ) -> t.Any:
+        """
+        Call ``fn`` with the supplied arguments, recording its cost under ``name``.
+
+        When a :class:`Trace` is active the call is also added to it as a
+        span of the given ``category``, with ``info`` as additional
+        arguments. Calls with ``record=False`` are only traced.
+        """
+        trace = _trace
+        if not record and trace is None:
+            return fn(*args, **(kwargs or {}))
+        local = self._local
+        if record:
+            depth = local.depth = getattr(local, 'depth', 0) + 1
+        if trace is not None:
+            stack = getattr(local, 'stack', None)
+            if stack is None:
+                stack = local.stack = []
+            parent = stack[-1] if stack else None
+            span = trace._next_id()
+            stack.append(span)
+        start = time.perf_counter()
+        try:
+            return fn(*args, **(kwargs or {}))
+        finally:
+            duration = time.perf_counter() - start
+            if trace is not None:
+                stack.pop()
+                trace._add(name, category, start, duration, span, parent, info)
+            if record:
+                local.depth = depth - 1
+                with self._lock:
+                    stats = self.callbacks.get(name)
+                    if stats is None:
+                        stats = self.callbacks[name] = CallbackStats()
+                    stats.calls += 1
+                    stats.total += duration
+                    if duration > stats.max:
+                        stats.max = duration
+                    if depth > self.max_depth:
+                        self.max_depth = depth
+
+    def record_batch(self, n_events: int) -> None:
+        """Record the dispatch of a batch of ``n_events`` events."""
+        with self._lock:
+            self.batches += 1
+            self.batch_events += n_events
+            if n_events > self.max_batch_events:
+                self.max_batch_events = n_events
+
+    def stats(self) -> dict[str, t.Any]:
+        """
+        Return a snapshot of the recorded statistics.
+
+        Returns
+        -------
+        dict
+            Dictionary with the per-callback statistics under ``'callbacks'``,
+            sorted by cumulative time, the number of batches and events
+            dispatched in them, the largest batch and the deepest cascade of
+            watchers triggering other watchers.
+        """
+        with self._lock:
+            callbacks = sorted(self.callbacks.items(), key=lambda item: -item[1].total)
+            return {
+                'callbacks': {name: stats.to_dict() for name, stats in callbacks},
+                'batches': self.batches,
+                'batch_events': self.batch_events,
+                'max_batch_events': self.max_batch_events,
+                'max_cascade_depth': self.max_depth,
+            }
+
+
+class Trace:
+    """
+    Causal trace of parameter sets, watcher calls and ``rx`` evaluations.
+
+    Each call is recorded as a complete event in the Chrome Trace Event
+    format, which can be loaded into ``chrome://tracing`` or Perfetto to
+    display a timeline of cascading updates. Nested calls on the same
+    thread are displayed as children of the call that caused them, the
+    ``id`` and ``parent`` arguments of each event additionally record
+    this causal link explicitly.
+
+    Events are categorized as ``'set'`` for the dispatch of a parameter
+    set to its watchers, ``'watcher'`` for watcher callbacks, ``'depends'``
+    for methods called via ``param.depends`` and ``'rx'`` for operations
+    re-evaluated in ``rx`` pipelines.
+    """
+
+    def __init__(self):
+        self.events: list[dict[str, t.Any]] = []
+        self._ids = itertools.count(1)
+        self._origin = time.perf_counter()
+        self._pid = os.getpid()
+
+    def _next_id(self) -> int:
+        return next(self._ids)
+
+    def _add(
+        self,
+        name: str,
+        category: str,
+        start: float,
+        duration: float,
+        span: int,
+        parent: int | None,
+        info: dict[str, t.Any] | None,
+    ) -> None:
+        args: dict[str, t.Any] = {'id': span, 'parent': parent}
+        if info:
+            args.update(info)
+        self.events.append({
+            'name': name,
+            'cat': category,
+            'ph': 'X',
+            'ts': (start - self._origin) * 1e6,
+            'dur': duration * 1e6,
+            'pid': self._pid,
+            'tid': threading.get_ident(),
+            'args': args,
+        })
+
+    def to_dict(self) -> dict[str, t.Any]:
+        """Return the trace as a JSON serializable Chrome Trace Event dictionary."""
+        return {'traceEvents': list(self.events), 'displayTimeUnit': 'ms'}
+
+    def save(self, filename: str | os.PathLike[str]) -> None:
+        """Write the trace to ``filename`` as Chrome Trace Event JSON."""
+        with open(filename, 'w') as f:
+            json.dump(self.to_dict(), f)
+
+
+_profile = Profile()
+
+_trace: Trace | None = None
+
+
+def callback_name(fn: t.Any) -> str:
+    """Return the name statistics of the callback ``fn`` are recorded under."""
+    name = getattr(fn, '__qualname__', None)
+    if name is None:
+        name = type(fn).__qualname__
+    return name
+
+
+def enable() -> None:
+    """Enable the instrumentation of watchers and ``rx`` pipelines."""
+    global enabled
+    enabled = True
+
+
+def disable() -> None:
+    """Disable the instrumentation, keeping the statistics recorded so far."""
+    global enabled
+    enabled = False
+
+
+def reset() -> None:
+    """Discard all statistics recorded so far."""
+    _profile.reset()
+
+
+def stats() -> dict[str, t.Any]:
+    """Return a snapshot of the statistics recorded so far, see :meth:`Profile.stats`."""
+    return _profile.stats()
+
+
+@contextmanager
+def profile(reset: bool = True) -> Iterator[Profile]:
+    """
+    Context manager enabling profiling within its scope.
+
+    Parameters
+    ----------
+    reset : bool, optional
+        Whether to discard previously recorded statistics on entry.
+        Default is ``True``.
+
+    Yields
+    ------
+    Profile
+        The profile recording the statistics, which remain available
+        after exiting the context.
+    """
+    global enabled
+    previous = enabled
+    if reset:
+        _profile.reset()
+    enabled = True
+    try:
+        yield _profile
+    finally:
+        enabled = previous
+
+
+@contextmanager
+def trace(filename: str | os.PathLike[str] | None = None) -> Iterator[Trace]:
+    """
+    Context manager recording a :class:`Trace` within its scope.
+
+    Tracing also enables the collection of statistics, see :func:`profile`.
+
+    Parameters
+    ----------
+    filename : str or os.PathLike, optional
+        File the trace is written to as Chrome Trace Event JSON on exit.
+
+    Yields
+    ------
+    Trace
+        The trace recording the events.
+    """
+    global _trace, enabled
+    previous = (_trace, enabled)
+    _trace = current = Trace()
+    enabled = True
+    try:
+        yield current
+    finally:
+        _trace, enabled = previous
+        if filename is not None:
+            current.save(filename)
@@ -72,6 +72,18 @@ Instances also track their dependencies to ensure accurate updates:
   in `dfi.head()`).
 - `_dirty`: Indicates whether the current value needs re-computation.
 - `_current`: Stores the result of the most recent computation.
+- `_dependents`: Weak references to the instances derived from this one, which
+  are invalidated along with it, so that only the instances introducing new
+  dependencies have to watch parameters themselves.
+
+When a value is requested the chain is walked back iteratively to the closest
+instance that does not have to be re-evaluated, after which the dirty instances
+are evaluated going forward in a single pass (see `_resolve`). Consecutive pure
+operations (operators and builtins) whose instances only have a single dependent
+are fused into one callable, cached on the instance consuming them, without
+storing their intermediate results. Those instances are recomputed if their own
+value is requested, while branching instances always store their result so that
+branching pipelines do not recompute shared steps.
 
 Benefits and Use Cases
 ----------------------
@@ -92,10 +104,13 @@ import inspect
 import logging
 import math
 import operator
+import os
+import sys
 import typing as t
 import warnings
 import weakref
 
+from collections import OrderedDict, deque
 from collections.abc import (
     AsyncGenerator, Callable, Coroutine, Generator, Iterable, Iterator, Sized
 )
@@ -103,7 +118,8 @@ from itertools import chain
 from functools import partial
 from types import FunctionType, MethodType
 
-from .depends import depends
+from . import profiling
+from .depends import _VERSION, depends
 from .display import _display_accessors, _reactive_display_objs
 from .parameterized import (
     Parameter, Parameterized, Skip, Undefined, eval_function_with_deps, get_method_owner,
@@ -122,6 +138,9 @@ if t.TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+#: Whether rx expressions are lazy unless declared otherwise, see :class:`rx`.
+default_lazy = False
+
 
 class Wrapper(Parameterized):
     """Helper class to allow updating literal values easily."""
@@ -243,6 +262,35 @@ class reactive_ops:
     def _as_rx(self):
         return self._reactive if isinstance(self._reactive, rx) else self()
 
+    def _settable(self) -> 'rx':
+        """Return the expression if its input may be set, raising otherwise."""
+        reactive = self._reactive
+        if isinstance(reactive, Parameter):
+            raise AttributeError(
+                "`Parameter.rx.value = value` is not supported. Cannot override "
+                "parameter value."
+            )
+        elif not isinstance(reactive, rx):
+            raise AttributeError(
+                "`bind(...).rx.value = value` is not supported. Cannot override "
+                "the output of a function."
+            )
+        elif reactive._root is not reactive:
+            raise AttributeError(
+                "The value of a derived expression cannot be set. Ensure you "
+                "set the value on the root node wrapping a concrete value, e.g.:"
+                "\n\n    a = rx(1)\n    b = a + 1\n    a.rx.value = 2\n\n "
+                "is valid but you may not set `b.rx.value = 2`."
+            )
+        if reactive._wrapper is None:
+            raise AttributeError(
+                "Setting the value of a reactive expression is only "
+                "supported if it wraps a concrete value. A reactive "
+                "expression wrapping a Parameter or another dynamic "
+                "reference cannot be updated."
+            )
+        return reactive
+
     def __call__(self) -> 'rx':
         """Create a reactive expression."""
         rxi = self._reactive
@@ -285,6 +333,74 @@ class reactive_ops:
         """
         return self._as_rx()._apply_operator(lambda obj, other: obj and other, other)
 
+    def backpressure(self, policy: str = 'latest', coalesce: float | None = None) -> 'rx':
+        """
+        Configure how an asynchronous operation handles rapid updates.
+
+        Applies to an expression whose last operation is asynchronous, e.g.
+        ``expr.rx.pipe(async_fn)``, and determines what happens when its
+        input changes while a previous evaluation is still running:
+
+        - ``'latest'``: Cancel the running evaluation and start a new one,
+          so that only the latest input is evaluated (default).
+        - ``'queue'``: Evaluate every input in order, one at a time.
+        - ``'drop'``: Ignore inputs that arrive while an evaluation is
+          running, so the output may not reflect the latest input until
+          the input changes again.
+
+        Additionally rapid results, e.g. the items of an asynchronous
+        generator or the results of queued evaluations, may be coalesced
+        so that expressions depending on this one are re-evaluated at most
+        once per ``coalesce`` interval, always with the latest result.
+
+        The expression is configured in place and returned.
+
+        Parameters
+        ----------
+        policy : {'latest', 'queue', 'drop'}, optional
+            The policy applied to inputs arriving while busy.
+        coalesce : float or None, optional
+            The interval in seconds to coalesce results over. Defaults
+            to None, i.e. every result is emitted immediately.
+
+        Returns
+        -------
+        rx
+            The configured reactive expression.
+
+        Raises
+        ------
+        ValueError
+            If the policy or interval is invalid or the operation is not
+            asynchronous.
+
+        Examples
+        --------
+        >>> import asyncio
+        >>> import param
+        >>> async def fetch(value):
+        ...     await asyncio.sleep(0.1)
+        ...     return value * 2
+        >>> x = param.rx(1)
+        >>> doubled = x.rx.pipe(fetch).rx.backpressure('queue', coalesce=0.05)
+        """
+        if policy not in _ASYNC_POLICIES:
+            raise ValueError(
+                f'The rx backpressure policy must be one of {_ASYNC_POLICIES!r}, got {policy!r}.'
+            )
+        elif coalesce is not None and (not isinstance(coalesce, (int, float)) or coalesce < 0):
+            raise ValueError(
+                f'The rx coalesce interval must be None or a non-negative number, got {coalesce!r}.'
+            )
+        expr = self._as_rx()
+        if not expr._is_async:
+            raise ValueError(
+                'Backpressure policies can only be applied to asynchronous rx operations.'
+            )
+        expr._async_policy = policy
+        expr._async_coalesce = coalesce
+        return expr
+
     def bool(self) -> 'rx':
         """
         Evaluate the truthiness of the current object.
@@ -317,7 +433,7 @@ class reactive_ops:
         """
         return self._as_rx()._apply_operator(bool)
 
-    def buffer(self, n) -> 'rx':
+    def buffer(self, n: int, dtype: t.Any = None) -> 'rx':
         """
         Collect the last ``n`` items emitted by the reactive expression.
 
@@ -325,15 +441,33 @@ class reactive_ops:
         most recent ``n`` items emitted by the current reactive expression. As new values
         are emitted, older values are discarded to keep the buffer size constant.
 
+        By default each output is a new list of the buffered items, so
+        emitting an item is O(n). For large buffers a NumPy ``dtype`` may
+        be supplied, in which case the items are stored in a ring buffer
+        backed by a NumPy array and the output is a read-only view of the
+        buffered items. Emitting an item is then O(1) regardless of the
+        size of the buffer, since the buffer is never shifted or copied,
+        but the view shares memory with the buffer and is overwritten as
+        new items are emitted, so callbacks keeping outputs around must
+        copy them.
+
         Parameters
         ----------
         n : int
             The maximum number of items to retain in the buffer.
+        dtype : numpy.dtype or str, optional
+            The NumPy dtype of the items, if supplied the buffered items
+            are output as a NumPy array instead of a list.
 
         Returns
         -------
         rx
-            A new reactive expression containing the buffered items as a list.
+            A new reactive expression containing the buffered items.
+
+        Raises
+        ------
+        ValueError
+            If ``n`` is not a positive integer.
 
         Examples
         --------
@@ -353,14 +487,80 @@ class reactive_ops:
         >>> rx_buffer.rx.value
         [2, 3, 4]
         """
-        items = []
+        if not isinstance(n, int) or n < 1:
+            raise ValueError(f'The rx buffer size must be a positive integer, got {n!r}.')
+        items = _RingBuffer(n, dtype)
         def collect(new, n):
-            items.append(new)
-            while len(items) > n:
-                items.pop(0)
-            return items
+            return items.append(new)
         return self._as_rx()._apply_operator(collect, n)
 
+    def cache(self, maxsize: int = 128, max_bytes: int | None = None) -> 'rx':
+        """
+        Memoize the output of the expression for previously seen inputs.
+
+        Returns a new expression that remembers its output for the most
+        recent combinations of input values, so that switching back to
+        previously seen inputs (e.g. toggling a widget back and forth)
+        does not recompute the pipeline. Inputs are keyed on the values
+        of all parameters the expression depends on, unhashable values
+        on the version of their parameter (see ``Parameters.version``),
+        so a value modified in place must be triggered to be recomputed.
+
+        Parameters
+        ----------
+        maxsize : int, optional
+            The maximum number of outputs to keep. Defaults to 128.
+        max_bytes : int or None, optional
+            The maximum combined size of the outputs to keep in bytes,
+            estimated using ``memory_usage``, ``nbytes`` or
+            ``sys.getsizeof``. Defaults to None, i.e. unbounded.
+
+        Returns
+        -------
+        rx
+            A new reactive expression memoizing the output of the current one.
+
+        Raises
+        ------
+        ValueError
+            If ``maxsize`` or ``max_bytes`` are not positive integers or the
+            expression is asynchronous.
+
+        Examples
+        --------
+        >>> import param
+        >>> calls = []
+        >>> def expensive(value):
+        ...     calls.append(value)
+        ...     return value * 2
+        >>> x = param.rx(1)
+        >>> cached = x.rx.pipe(expensive).rx.cache()
+        >>> cached.rx.value
+        2
+        >>> x.rx.value = 2
+        >>> cached.rx.value
+        4
+        >>> x.rx.value = 1
+        >>> cached.rx.value
+        2
+        >>> calls
+        [1, 2]
+        """
+        if not isinstance(maxsize, int) or maxsize < 1:
+            raise ValueError(f'The rx cache maxsize must be a positive integer, got {maxsize!r}.')
+        elif max_bytes is not None and (not isinstance(max_bytes, int) or max_bytes < 1):
+            raise ValueError(
+                f'The rx cache max_bytes must be None or a positive integer, got {max_bytes!r}.'
+            )
+        expr = self._as_rx()
+        if isinstance(expr._wrapper, GenWrapper) or any(
+            isinstance(p.owner, Trigger) and p.owner.internal for p in expr._internal_params
+        ):
+            raise ValueError('Caching is not supported for asynchronous rx expressions.')
+        cached = expr._apply_operator(_cached_output)
+        cached._cache = _OutputCache(maxsize, max_bytes)
+        return cached
+
     def in_(self, other) -> 'rx':
         """
         Check if the current object is contained "in" the given operand.
@@ -403,6 +603,81 @@ class reactive_ops:
         """
         return self._as_rx()._apply_operator(operator.contains, other, reverse=True)
 
+    def incremental(self, func, /, *args, combine=None, **kwargs) -> 'rx':
+        """
+        Apply a function which may be updated incrementally as data is appended.
+
+        Applies ``func`` to the current value like ``.rx.pipe``. However
+        when the input of the expression grows through ``.rx.append`` the
+        function is only applied to the appended data and the result is
+        combined with the previous output, turning an update that is
+        proportional to the full data into one proportional to the
+        appended data. This is valid for operations such as filtering,
+        mapping, summing, counting or aggregating over groups, where
+        applying the function to the concatenated data is equivalent to
+        combining the results of applying it to each part.
+
+        Incremental updates are applied when the expression is applied
+        directly to an expression with a concrete input or to another
+        incremental expression. If the input is replaced, or any other
+        dependency of the expression changes, the output is recomputed
+        from the full input.
+
+        Parameters
+        ----------
+        func : callable
+            The function to apply to the full input or to appended data.
+        *args : iterable
+            Positional arguments to pass to ``func``.
+        combine : callable, optional
+            Function combining the previous output with the output of
+            ``func`` applied to the appended data. By default pandas
+            objects and NumPy arrays are concatenated, lists extended and
+            other objects added.
+        **kwargs : mapping, optional
+            Keyword arguments to pass to ``func``.
+
+        Returns
+        -------
+        rx
+            A new reactive expression containing the result of ``func``.
+
+        Examples
+        --------
+        Count and sum the positive values of a growing list:
+
+        >>> import param
+        >>> values = param.rx([1, -2])
+        >>> positive = values.rx.incremental(lambda v: [x for x in v if x > 0])
+        >>> total = positive.rx.incremental(sum)
+        >>> total.rx.value
+        1
+        >>> values.rx.append([3, -4])
+        >>> positive.rx.value, total.rx.value
+        ([1, 3], 4)
+
+        Aggregate a growing DataFrame over groups, adding the partial
+        aggregates of the appended rows:
+
+        >>> import pandas as pd  # doctest: +SKIP
+        >>> df = param.rx(pd.DataFrame({'key': ['a', 'b'], 'value': [1, 2]}))  # doctest: +SKIP
+        >>> sums = df.rx.incremental(
+        ...     lambda df: df.groupby('key').value.sum(),
+        ...     combine=lambda a, b: a.add(b, fill_value=0)
+        ... )  # doctest: +SKIP
+        """
+        expr = self._as_rx()
+        operation = _IncrementalOperation(func, combine or _append_delta)
+        new = expr._apply_operator(operation, *args, **kwargs)
+        new._incremental = operation
+        operation.consumers = new._delta_consumers
+        if new._prev is expr and (expr._incremental is not None or (
+            expr._root is expr and isinstance(expr._wrapper, Wrapper)
+        )):
+            expr._delta_consumers.append(weakref.ref(operation))
+            operation.streaming = True
+        return new
+
     def is_(self, other) -> 'rx':
         """
         Perform a logical "is" comparison with the given operand.
@@ -761,6 +1036,66 @@ class reactive_ops:
         resolver = resolver_type(object=self._reactive, recursive=recursive)
         return resolver.param.value.rx()
 
+    def rolling(self, n: int, agg: str = 'mean') -> 'rx':
+        """
+        Reduce the last ``n`` items emitted by the reactive expression.
+
+        Creates a new reactive expression computing the sum, mean, minimum
+        or maximum of the most recent ``n`` numeric items emitted by the
+        current expression. Unlike reducing the output of ``.rx.buffer``
+        the reduction is updated incrementally as each item is emitted,
+        rather than by rescanning all the buffered items. Until ``n`` items
+        have been emitted the reduction is computed over the items emitted
+        so far.
+
+        Parameters
+        ----------
+        n : int
+            The number of items in the window.
+        agg : {'mean', 'sum', 'min', 'max'}, optional
+            The reduction computed over the window. Defaults to 'mean'.
+
+        Returns
+        -------
+        rx
+            A new reactive expression containing the reduction of the window.
+
+        Raises
+        ------
+        ValueError
+            If ``n`` is not a positive integer or ``agg`` is not supported.
+
+        Examples
+        --------
+        Compute the maximum of the last 2 emitted items:
+
+        >>> import param
+        >>> rx_value = param.rx(1)
+        >>> rx_max = rx_value.rx.rolling(2, 'max')
+        >>> rx_max.rx.value
+        1
+        >>> rx_value.rx.value = 3
+        >>> rx_max.rx.value
+        3
+        >>> rx_value.rx.value = 2
+        >>> rx_max.rx.value
+        3
+        >>> rx_value.rx.value = 0
+        >>> rx_max.rx.value
+        2
+        """
+        if not isinstance(n, int) or n < 1:
+            raise ValueError(f'The rx rolling window size must be a positive integer, got {n!r}.')
+        elif agg not in _RollingWindow.aggregations:
+            raise ValueError(
+                f'The rx rolling aggregation must be one of {_RollingWindow.aggregations!r}, '
+                f'got {agg!r}.'
+            )
+        window = _RollingWindow(n, agg)
+        def reduce(new, n, agg):
+            return window.add(new)
+        return self._as_rx()._apply_operator(reduce, n, agg)
+
     def updating(self) -> 'rx':
         """
         Return a new expression that indicates whether the current expression is updating.
@@ -963,6 +1298,43 @@ class reactive_ops:
         """
         self.value = value
 
+    def append(self, data):
+        """
+        Append data to the input of the pipeline.
+
+        Equivalent to setting ``.rx.value`` to the current value with
+        ``data`` appended, i.e. concatenated for pandas objects and NumPy
+        arrays, extended for lists and added otherwise. Unlike setting the
+        value the appended data is additionally recorded as a delta, which
+        allows operations applied with ``.rx.incremental`` to update their
+        output from the delta instead of recomputing it from the full input.
+
+        Parameters
+        ----------
+        data : object
+            The data to append to the pipeline input.
+
+        Examples
+        --------
+        >>> import param
+        >>> rows = param.rx([1, 2])
+        >>> rows.rx.append([3])
+        >>> rows.rx.value
+        [1, 2, 3]
+        """
+        reactive = self._settable()
+        data = resolve_value(data)
+        for ref in reactive._delta_consumers:
+            consumer = ref()
+            if consumer is not None:
+                consumer.pending.append(data)
+        wrapper = reactive._wrapper
+        reactive._appending = True
+        try:
+            wrapper.object = _append_delta(wrapper.object, data)
+        finally:
+            reactive._appending = False
+
     @property
     def value(self):
         """
@@ -1046,31 +1418,7 @@ class reactive_ops:
         >>> rx_pipeline.rx.value
         40
         """
-        if isinstance(self._reactive, Parameter):
-            raise AttributeError(
-                "`Parameter.rx.value = value` is not supported. Cannot override "
-                "parameter value."
-            )
-        elif not isinstance(self._reactive, rx):
-            raise AttributeError(
-                "`bind(...).rx.value = value` is not supported. Cannot override "
-                "the output of a function."
-            )
-        elif self._reactive._root is not self._reactive:
-            raise AttributeError(
-                "The value of a derived expression cannot be set. Ensure you "
-                "set the value on the root node wrapping a concrete value, e.g.:"
-                "\n\n    a = rx(1)\n    b = a + 1\n    a.rx.value = 2\n\n "
-                "is valid but you may not set `b.rx.value = 2`."
-            )
-        if self._reactive._wrapper is None:
-            raise AttributeError(
-                "Setting the value of a reactive expression is only "
-                "supported if it wraps a concrete value. A reactive "
-                "expression wrapping a Parameter or another dynamic "
-                "reference cannot be updated."
-            )
-        self._reactive._wrapper.object = resolve_value(new)
+        self._settable()._wrapper.object = resolve_value(new)
 
     def watch(self, fn=None, onlychanged=True, queued=False, precedence=0):
         """
@@ -1169,6 +1517,18 @@ def bind(
 ) -> Callable[_P, _R]: ...
 
 
+def _argument_getter(arg: t.Any) -> Callable[[], t.Any] | None:
+    """
+    Return a callable resolving the current value of a bound argument,
+    or None if the argument is a constant.
+    """
+    if hasattr(arg, '_dinfo'):
+        return partial(eval_function_with_deps, arg)
+    elif isinstance(arg, Parameter) and arg.owner is not None and arg.name is not None:
+        return partial(getattr, arg.owner, arg.name)
+    return None
+
+
 def bind(
     function: Callable[..., t.Any], *args: t.Any, watch: bool = False, **kwargs: t.Any
 ) -> Callable[..., t.Any]:
@@ -1267,25 +1627,29 @@ def bind(
         elif isinstance(v, Parameter):
             dependencies[kw] = v
 
+    # Precompute how each bound argument is resolved so that evaluating
+    # the bound function only has to call the getters of dynamic arguments
+    bound_args = list(args)
+    arg_getters = [
+        (i, getter) for i, getter in enumerate(map(_argument_getter, args))
+        if getter is not None
+    ]
+    bound_kwargs = dict(kwargs)
+    kwarg_getters = [
+        (kw, getter) for kw, getter in zip(kwargs, map(_argument_getter, kwargs.values()))
+        if getter is not None
+    ]
+
     def combine_arguments(wargs, wkwargs, asynchronous=False):
-        combined_args = []
-        for arg in args:
-            if hasattr(arg, '_dinfo'):
-                arg = eval_function_with_deps(arg)  # type: ignore[arg-type]
-            elif isinstance(arg, Parameter):
-                if arg.owner is not None and arg.name is not None:
-                    arg = getattr(arg.owner, arg.name)
-            combined_args.append(arg)
-        combined_args += list(wargs)
-
-        combined_kwargs = {}
-        for kw, arg in kwargs.items():
-            if hasattr(arg, '_dinfo'):
-                arg = eval_function_with_deps(arg)  # type: ignore[arg-type]
-            elif isinstance(arg, Parameter):
-                if arg.owner is not None and arg.name is not None:
-                    arg = getattr(arg.owner, arg.name)
-            combined_kwargs[kw] = arg
+        combined_args = bound_args.copy()
+        for i, getter in arg_getters:
+            combined_args[i] = getter()
+        if wargs:
+            combined_args += wargs
+
+        combined_kwargs = bound_kwargs.copy()
+        for kw, getter in kwarg_getters:
+            combined_kwargs[kw] = getter()
         for kw, arg in wkwargs.items():
             if asynchronous:
                 if kw.startswith('__arg'):
@@ -1302,10 +1666,11 @@ def bind(
             combined_kwargs[kw] = arg
         return combined_args, combined_kwargs
 
-    def eval_fn():
-        if callable(function):
-            fn = function
-        else:
+    if callable(function):
+        def eval_fn():
+            return function
+    else:
+        def eval_fn():
             p = transform_reference(function)
             if isinstance(p, Parameter):
                 if p.owner is None or p.name is None:
@@ -1313,7 +1678,7 @@ def bind(
                 fn = getattr(p.owner, p.name)
             else:
                 fn = eval_function_with_deps(p)
-        return fn
+            return fn
 
     wrapped: Callable[..., t.Any]
     if inspect.isgeneratorfunction(function):
@@ -1396,6 +1761,361 @@ def _remove_watcher(owner, watcher):
 # When we only support python >= 3.11 we should exchange 'rx' with Self type annotation below.
 # See https://peps.python.org/pep-0673/
 
+def _argument_dependencies(arg) -> frozenset[tuple[int, str]] | None:
+    """
+    Classify an argument of an ``rx`` operation.
+
+    Returns None if the argument is a constant, otherwise the
+    ``(id(owner), name)`` pairs of the parameters its value depends on,
+    which are empty if it has to be re-resolved on every evaluation.
+    """
+    if isinstance(arg, (list, tuple, dict, slice)):
+        if isinstance(arg, dict):
+            items = [o for kv in arg.items() for o in kv]
+        elif isinstance(arg, slice):
+            items = [arg.start, arg.stop, arg.step]
+        else:
+            items = list(arg)
+        deps = [_argument_dependencies(item) for item in items]
+        if all(dep is None for dep in deps):
+            return None
+        elif any(dep is not None and not dep for dep in deps):
+            return frozenset()
+        return frozenset().union(*(dep for dep in deps if dep))
+    ref = transform_reference(arg)
+    if isinstance(ref, Parameter):
+        if ref.owner is None or ref.name is None:
+            return frozenset()
+        return frozenset([(id(ref.owner), ref.name)])
+    elif hasattr(ref, '_dinfo'):
+        return frozenset((id(p.owner), p.name) for p in resolve_ref(ref))
+    elif iscoroutinefunction(ref) or inspect.isgeneratorfunction(ref):
+        return frozenset()
+    return None
+
+
+def _cached_output(obj):
+    return obj
+
+
+def _nbytes(obj) -> int:
+    """Estimate the memory used by an object in bytes."""
+    memory_usage = getattr(obj, 'memory_usage', None)
+    if callable(memory_usage):
+        try:
+            usage = memory_usage(deep=True)
+            return int(usage.sum() if hasattr(usage, 'sum') else usage)
+        except Exception:
+            pass
+    nbytes = getattr(obj, 'nbytes', None)
+    if isinstance(nbytes, int):
+        return nbytes
+    return sys.getsizeof(obj)
+
+
+class _OutputCache:
+    """
+    LRU cache of the outputs of an ``rx`` node, see ``reactive_ops.cache``.
+
+    Outputs are keyed on the values of the parameters the node depends
+    on, unhashable values are keyed on the version of their parameter.
+    """
+
+    __slots__ = ('entries', 'max_bytes', 'maxsize', 'nbytes')
+
+    def __init__(self, maxsize: int, max_bytes: int | None = None):
+        self.entries: OrderedDict[tuple[t.Any, ...], tuple[t.Any, int]] = OrderedDict()
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+
+    def key(self, params: list[Parameter]) -> tuple[t.Any, ...]:
+        values = []
+        for p in params:
+            value = getattr(p.owner, p.name)
+            try:
+                hash(value)
+            except TypeError:
+                value = (_VERSION, p.owner.param.version(p.name))
+            values.append(value)
+        return tuple(values)
+
+    def get(self, key: tuple[t.Any, ...]) -> t.Any:
+        entry = self.entries.get(key)
+        if entry is None:
+            return Undefined
+        self.entries.move_to_end(key)
+        return entry[0]
+
+    def put(self, key: tuple[t.Any, ...], value: t.Any) -> None:
+        nbytes = 0 if self.max_bytes is None else _nbytes(value)
+        if self.max_bytes is not None and nbytes > self.max_bytes:
+            return
+        self.entries[key] = (value, nbytes)
+        self.nbytes += nbytes
+        while len(self.entries) > self.maxsize or (
+            self.max_bytes is not None and self.nbytes > self.max_bytes
+        ):
+            _, (_, evicted) = self.entries.popitem(last=False)
+            self.nbytes -= evicted
+
+
+class _RingBuffer:
+    """
+    Fixed capacity buffer of the most recent values, see ``reactive_ops.buffer``.
+
+    Without a ``dtype`` the values are kept in a bounded deque and each
+    append emits a new list, which is O(n). With a ``dtype`` the values are
+    written twice to a NumPy array of twice the capacity, so that the
+    buffered values are always contiguous and may be emitted as a read-only
+    view. Appending a value is then O(1) and never copies the buffer, but
+    the emitted views share memory with it and change as values arrive.
+    """
+
+    __slots__ = ('array', 'count', 'head', 'items', 'n')
+
+    def __init__(self, n: int, dtype: t.Any = None):
+        self.n = n
+        self.count = 0
+        self.head = 0
+        self.items: deque[t.Any] = deque(maxlen=n)
+        if dtype is None:
+            self.array = None
+        else:
+            import numpy as np
+            self.array = np.empty(2*n, dtype=dtype)
+
+    def append(self, value: t.Any) -> t.Any:
+        if self.array is None:
+            self.items.append(value)
+            return list(self.items)
+        n, head = self.n, self.head
+        self.array[head] = self.array[head+n] = value
+        self.head = (head + 1) % n
+        if self.count < n:
+            self.count += 1
+            view = self.array[:self.count]
+        else:
+            view = self.array[self.head:self.head+n]
+        view.flags.writeable = False
+        return view
+
+
+class _RollingWindow:
+    """
+    Reduction over the most recent values, see ``reactive_ops.rolling``.
+
+    Each value is added in amortized O(1): sums are updated by adding the
+    new and subtracting the evicted value, minima and maxima are tracked in
+    a monotonic queue of the candidates for the extremum of the window.
+    """
+
+    __slots__ = ('agg', 'candidates', 'evicted', 'index', 'n', 'total', 'values')
+
+    aggregations = ('sum', 'mean', 'min', 'max')
+
+    def __init__(self, n: int, agg: str):
+        self.n = n
+        self.agg = agg
+        self.index = 0
+        self.evicted = 0
+        self.total: t.Any = 0
+        self.values: deque[t.Any] = deque()
+        self.candidates: deque[tuple[int, t.Any]] = deque()
+
+    def add(self, value: t.Any) -> t.Any:
+        if self.agg in ('sum', 'mean'):
+            return self._add_sum(value)
+        return self._add_extremum(value)
+
+    def _add_sum(self, value):
+        values = self.values
+        values.append(value)
+        if len(values) > self.n:
+            self.total -= values.popleft()
+            self.evicted += 1
+            # Recompute the sum once per window to bound the accumulation
+            # of floating point errors by the running sum
+            if self.evicted >= self.n:
+                self.evicted = 0
+                self.total = sum(values)
+            else:
+                self.total += value
+        else:
+            self.total += value
+        return self.total / len(values) if self.agg == 'mean' else self.total
+
+    def _add_extremum(self, value):
+        candidates = self.candidates
+        superseded = operator.le if self.agg == 'min' else operator.ge
+        # Drop candidates the new value supersedes for as long as it remains
+        # in the window, keeping the extremum at the front of the queue
+        while candidates and superseded(value, candidates[-1][1]):
+            candidates.pop()
+        candidates.append((self.index, value))
+        if candidates[0][0] <= self.index - self.n:
+            candidates.popleft()
+        self.index += 1
+        return candidates[0][1]
+
+
+_ASYNC_POLICIES = ('latest', 'queue', 'drop')
+
+
+def _upstream_nodes(expr: rx) -> list[rx]:
+    """
+    Return the nodes an expression is resolved from, including itself,
+    the shared nodes it branches from and expressions passed as arguments
+    to its operations.
+    """
+    seen = set()
+    nodes = []
+    stack = [expr]
+    while stack:
+        node = stack.pop()
+        if id(node) in seen:
+            continue
+        seen.add(id(node))
+        nodes.append(node)
+        stack.extend(n for n in (node._prev, node._shared) if n is not None)
+        if node._operation:
+            stack.extend(
+                arg for arg in chain(
+                    node._operation.get('args', ()), node._operation.get('kwargs', {}).values()
+                ) if isinstance(arg, rx)
+            )
+    return nodes
+
+
+def _append_delta(current: t.Any, delta: t.Any) -> t.Any:
+    """
+    Return ``current`` with ``delta`` appended, without modifying either.
+
+    pandas objects are concatenated, NumPy arrays are concatenated along
+    the first axis, lists are extended and all other objects are added.
+    """
+    if current is None or current is Undefined:
+        return delta
+    if (pd := sys.modules.get('pandas')) and isinstance(current, (pd.DataFrame, pd.Series)):
+        return pd.concat([current, delta])
+    if (np := sys.modules.get('numpy')) and isinstance(current, np.ndarray):
+        return np.concatenate([current, delta])
+    if isinstance(current, list):
+        return current + list(delta)
+    return current + delta
+
+
+class _IncrementalOperation:
+    """
+    Operation updating its output from appended deltas, see ``reactive_ops.incremental``.
+
+    While the input only grows through ``reactive_ops.append`` the
+    operation is applied to each pending delta and the result combined
+    with the previous output. The deltas of the output are in turn passed
+    on to incremental operations consuming it. Any other change of the
+    input or the arguments invalidates the output, which is then
+    recomputed from the full input.
+    """
+
+    def __init__(self, func: Callable[..., t.Any], combine: Callable[[t.Any, t.Any], t.Any]):
+        self.func = func
+        self.combine = combine
+        self.consumers: list[weakref.ref[_IncrementalOperation]] = []
+        self.output: t.Any = Undefined
+        self.pending: list[t.Any] = []
+        self.streaming = False
+        self.valid = False
+
+    def __call__(self, obj, *args, **kwargs):
+        incremental = self.valid and self.output is not Undefined
+        # Mark the output invalid until it was successfully updated
+        self.valid = False
+        if incremental:
+            deltas = []
+            for delta in self.pending:
+                out = self.func(delta, *args, **kwargs)
+                self.output = self.combine(self.output, out)
+                deltas.append(out)
+        else:
+            self.output = self.func(obj, *args, **kwargs)
+        self.pending.clear()
+        self.valid = self.streaming
+        for ref in self.consumers:
+            consumer = ref()
+            if consumer is None:
+                continue
+            elif incremental:
+                consumer.pending.extend(deltas)
+            else:
+                consumer.valid = False
+                consumer.pending.clear()
+        return self.output
+
+
+# Operations without side effects, whose intermediate outputs may be
+# recomputed rather than stored when they are fused (see _fuse_operations).
+_PURE_OPERATIONS = frozenset([
+    abs, divmod, getattr, math.ceil, math.floor, math.trunc, round, str,
+    operator.abs, operator.add, operator.and_, operator.contains, operator.eq,
+    operator.floordiv, operator.ge, operator.getitem, operator.gt, operator.inv,
+    operator.le, operator.lshift, operator.lt, operator.matmul, operator.mod,
+    operator.mul, operator.ne, operator.neg, operator.not_, operator.or_,
+    operator.pos, operator.pow, operator.rshift, operator.sub,
+    operator.truediv, operator.truth, operator.xor,
+])
+
+
+def _is_pure(fn) -> bool:
+    try:
+        return fn in _PURE_OPERATIONS
+    except TypeError:
+        return False
+
+
+def _fuse_operations(nodes: list[rx]) -> Callable[[t.Any], t.Any]:
+    """
+    Fuse the operations of a linear run of ``rx`` nodes, given in order
+    of evaluation, into a single callable applying all of them.
+
+    Operations with constant arguments are called directly, those with
+    references resolve their arguments through their node. Raises Skip
+    if any argument resolves to Skip.
+    """
+    steps = []
+    for node in nodes:
+        operation = node._operation
+        args, kwargs = operation['args'], operation['kwargs']
+        # The attributes of the node are looked up in its __dict__ to
+        # bypass rx.__getattribute__, the _method accessor may change
+        attrs = node.__dict__
+        if all(dep is None for dep in node._arg_deps.values()) and not any(
+            arg is Skip or arg is Undefined for arg in chain(args, kwargs.values())
+        ):
+            steps.append((operation['fn'], args, kwargs, operation.get('reverse'), attrs))
+        else:
+            steps.append((node._eval_operation, operation, None, None, attrs))
+
+    def fused(obj):
+        for fn, args, kwargs, reverse, attrs in steps:
+            if kwargs is None:
+                obj = fn(obj, args)
+            elif reverse:
+                obj = fn(args[0], obj, *args[1:], **kwargs)
+            else:
+                obj = fn(obj, *args, **kwargs)
+            method = attrs['_method']
+            if method:
+                obj = getattr(obj, method, obj)
+        return obj
+    return fused
+
+
+def _operation_name(operation):
+    """Name under which profiling records the evaluation of an ``rx`` operation."""
+    fn = operation['fn']
+    return f"rx.{fn if isinstance(fn, str) else profiling.callback_name(fn)}"
+
+
 class rx:
     """
     A class for creating reactive expressions by wrapping objects.
@@ -1411,6 +2131,12 @@ class rx:
     obj : any
         The object to wrap, such as a number, string, list, or any supported
         data structure.
+    lazy : bool or None, optional
+        Whether the expression is lazy. Lazy expressions, and all expressions
+        derived from them, are never evaluated while they are constructed,
+        including when checking the predicates of registered accessors, but
+        only when their value is requested. Defaults to None, i.e. the
+        module level ``param.reactive.default_lazy`` setting.
 
     References
     ----------
@@ -1452,6 +2178,17 @@ class rx:
 
     _method_handlers: dict[str, Callable] = {}
 
+    # Scheduling of asynchronous operations, see reactive_ops.backpressure
+    _async_policy: str = 'latest'
+
+    _async_coalesce: float | None = None
+
+    _async_busy: bool = False
+
+    _async_queue: deque[t.Any] | None = None
+
+    _async_emit_handle: t.Any = None
+
     @classmethod
     def register_accessor(
         cls, name: str, accessor: Callable[[t.Any], t.Any],
@@ -1501,6 +2238,73 @@ class rx:
         """
         cls._method_handlers[method] = handler
 
+    @staticmethod
+    def resolve_all(exprs, executor=None) -> list[t.Any]:
+        """
+        Resolve the values of several reactive expressions concurrently.
+
+        Nodes the expressions have in common, e.g. a shared input the
+        expressions branch from, are first resolved once, serially. The
+        remaining independent branches are then resolved concurrently on
+        the ``executor``, which is worthwhile when the operations release
+        the GIL, e.g. NumPy or pandas operations or I/O.
+
+        Parameters
+        ----------
+        exprs : Iterable[rx]
+            The reactive expressions to resolve. Other objects are
+            returned unchanged.
+        executor : concurrent.futures.Executor, optional
+            The executor the branches are resolved on. Defaults to a
+            thread pool with one thread per expression, up to the default
+            number of threads of a ``ThreadPoolExecutor``.
+
+        Returns
+        -------
+        list
+            The values of the expressions, in order.
+
+        Examples
+        --------
+        >>> import param
+        >>> x = param.rx(2)
+        >>> shared = x * 10
+        >>> param.rx.resolve_all([shared + 1, shared - 1])
+        [21, 19]
+        """
+        exprs = list(exprs)
+        branches = list({id(expr): expr for expr in exprs if isinstance(expr, rx)}.values())
+        counts: dict[int, int] = {}
+        nodes: dict[int, rx] = {}
+        for expr in branches:
+            for node in _upstream_nodes(expr):
+                counts[id(node)] = counts.get(id(node), 0) + 1
+                nodes[id(node)] = node
+        shared = sorted(
+            (nodes[key] for key, count in counts.items() if count > 1),
+            key=lambda node: node._depth
+        )
+        for node in shared:
+            node.rx.value
+        if executor is None and len(branches) < 2:
+            return [expr.rx.value if isinstance(expr, rx) else expr for expr in exprs]
+        pool = None
+        if executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+            executor = pool = ThreadPoolExecutor(
+                max_workers=min(len(branches), 32, (os.cpu_count() or 1) + 4)
+            )
+        try:
+            futures = {
+                id(expr): executor.submit(lambda expr: expr.rx.value, expr) for expr in branches
+            }
+            return [
+                futures[id(expr)].result() if isinstance(expr, rx) else expr for expr in exprs
+            ]
+        finally:
+            if pool is not None:
+                pool.shutdown()
+
     def __new__(cls, obj=None, **kwargs):
         wrapper = None
         obj = transform_reference(obj)
@@ -1535,7 +2339,7 @@ class rx:
         return inst
 
     def __init__(
-        self, obj=None, operation=None, fn=None, depth=0, method=None, prev=None, lazy=False,
+        self, obj=None, operation=None, fn=None, depth=0, method=None, prev=None, lazy=None,
         _shared_obj=None, _current=None, _wrapper=None, _shared=None, **kwargs
     ):
         # _init is used to prevent to __getattribute__ to execute its
@@ -1550,7 +2354,7 @@ class rx:
             if dopt in kwargs
         })
         self._display_opts = display_opts
-        self._lazy = lazy
+        self._lazy = default_lazy if lazy is None else lazy
         self._method = method
         self._operation = operation
         self._depth = depth
@@ -1572,23 +2376,49 @@ class rx:
 
         # Define special trigger parameter if operation has to be lazily evaluated
         self._trigger: Trigger | None
-        if operation and (iscoroutinefunction(operation['fn']) or inspect.isgeneratorfunction(operation['fn'])):
+        self._is_async = bool(operation) and (
+            iscoroutinefunction(operation['fn']) or inspect.isgeneratorfunction(operation['fn'])
+        )
+        if self._is_async:
             self._trigger = Trigger(internal=True)
             self._current_ = Undefined
         else:
             self._trigger = None
+        self._dependents: list[weakref.ref[rx]] = []
+        # Pure operations of the nodes preceding this one may be fused
+        # into a single callable, cached along with the number of nodes
+        self._pure = bool(operation) and not self._is_async and _is_pure(operation['fn'])
+        self._fused: tuple[int, Callable[[t.Any], t.Any]] | None = None
+        self._cache: _OutputCache | None = None
+        # State of streaming updates, see reactive_ops.append and incremental
+        self._appending = False
+        self._incremental: _IncrementalOperation | None = None
+        self._delta_consumers: list[weakref.ref[_IncrementalOperation]] = []
+        # Classify the operation arguments into constants and references,
+        # caching the resolved values of references until they change
+        self._arg_deps: dict[int | str, frozenset[tuple[int, str]] | None] = {}
+        self._arg_cache: dict[int | str, t.Any] = {}
+        if operation:
+            self._arg_deps.update(
+                (i, _argument_dependencies(arg)) for i, arg in enumerate(operation.get('args', ()))
+            )
+            self._arg_deps.update(
+                (k, _argument_dependencies(arg)) for k, arg in operation.get('kwargs', {}).items()
+            )
         self._root = self._compute_root()
         self._fn_params = self._compute_fn_params()
         self._internal_params = self._compute_params()
         # Filter params that external objects depend on, ensuring
         # that Trigger parameters do not cause double execution
+        internal_ids = {id(p) for p in self._internal_params}
         self._params = [
             p for p in self._internal_params if (not isinstance(p.owner, Trigger) or p.owner.internal)
             or (
                 p.owner is not None
-                and any(p not in self._internal_params for p in t.cast('t.Any', p.owner).parameters)
+                and any(id(p) not in internal_ids for p in t.cast('t.Any', p.owner).parameters)
             )
         ]
+        self._chain_params = self._compute_chain_params()
         self._setup_invalidations(depth)
         self._kwargs = kwargs
         self._rx = reactive_ops(self)
@@ -1596,7 +2426,8 @@ class rx:
         for name, accessor in _display_accessors.items():
             setattr(self, name, t.cast('Callable', accessor)(self))
         for name, (accessor, predicate) in rx._accessors.items():
-            if predicate is None or predicate(self._current):
+            # Lazy expressions check accessor predicates on access instead
+            if predicate is None or (not self._lazy and predicate(self._current)):
                 setattr(self, name, accessor(self))
 
     @property
@@ -1650,17 +2481,6 @@ class rx:
         else:
             self._shared_obj[0] = obj
 
-    @property
-    def _is_async(self) -> bool:
-        if not self._operation:
-            return False
-        fn = self._operation["fn"]
-        return (
-            inspect.iscoroutinefunction(fn) or
-            inspect.isasyncgenfunction(fn) or
-            inspect.isgeneratorfunction(fn)
-        )
-
     @property
     def _current(self):
         if self._error_state:
@@ -1672,15 +2492,17 @@ class rx:
     def _compute_root(self):
         if self._prev is None:
             return self
-        root = self
-        while root._prev is not None:
-            root = root._prev
-        return root
+        return self._prev._root
 
     def _compute_fn_params(self) -> list[Parameter]:
         if self._fn is None:
             return []
 
+        # Nodes derived from the same function share its dependencies
+        for node in (self._prev, self._shared):
+            if node is not None and node._fn is self._fn:
+                return list(node._fn_params)
+
         owner = get_method_owner(self._fn)
         if owner is not None:
             deps = [
@@ -1697,30 +2519,43 @@ class rx:
         ps = list(self._fn_params)
         if self._trigger:
             ps.append(self._trigger.param.value)
-
-        # Collect parameters on previous objects in chain
-        prev = self._prev
-        while prev is not None:
-            for p in prev._params:
-                if p not in ps:
+        seen = {id(p) for p in ps}
+
+        # Collect parameters on previous objects in chain, which each
+        # node accumulates in _chain_params so this does not have to
+        # walk the whole chain.
+        if self._prev is not None:
+            for p in self._prev._chain_params:
+                if id(p) not in seen:
+                    seen.add(id(p))
                     ps.append(p)
-            prev = prev._prev
 
         if self._operation is None:
             return ps
 
         # Accumulate dependencies in args and/or kwargs
-        for ref in resolve_ref(self._operation['fn']):
-            if ref not in ps:
-                ps.append(ref)
-        for arg in chain(
-            self._operation.get("args", tuple()),
-            self._operation.get("kwargs", {}).values(),
+        for ref in chain(
+            resolve_ref(self._operation['fn']),
+            *(resolve_ref(arg, recursive=True) for arg in chain(
+                self._operation.get("args", tuple()),
+                self._operation.get("kwargs", {}).values(),
+            ))
         ):
-            for ref in resolve_ref(arg, recursive=True):
-                if ref not in ps:
-                    ps.append(ref)
+            if id(ref) not in seen:
+                seen.add(id(ref))
+                ps.append(ref)
+
+        return ps
 
+    def _compute_chain_params(self) -> list[Parameter]:
+        if self._prev is None:
+            return self._params
+        ps = list(self._params)
+        seen = {id(p) for p in ps}
+        for p in self._prev._chain_params:
+            if id(p) not in seen:
+                seen.add(id(p))
+                ps.append(p)
         return ps
 
     def _setup_invalidations(self, depth: int = 0):
@@ -1740,15 +2575,23 @@ class rx:
            it has to re-evaluate the pipeline. This is done by marking
            the pipeline as `_dirty`. The next time the `_current` value
            is requested the value is resolved by re-executing the
-           pipeline.
+           pipeline. Since a node depends on all parameters of the
+           nodes preceding it, the preceding node propagates its
+           invalidations and a node only watches the parameters that
+           are not already watched upstream.
         """
-        if self._fn is not None:
+        if self._fn is not None and self._root is self:
             for _, params in full_groupby(self._fn_params, lambda x: id(x.owner)):
-                fps = [p.name for p in params if p in self._root._fn_params]
-                if fps:
-                    self._watch_invalidation(params[0].owner, self._invalidate_obj, fps)
-        for _, params in full_groupby(self._internal_params, lambda x: id(x.owner)):
-            self._watch_invalidation(params[0].owner, self._invalidate_current, [p.name for p in params])
+                self._watch_invalidation(params[0].owner, self._invalidate_obj, [p.name for p in params])
+        params = self._internal_params
+        if self._prev is not None:
+            prev = self._prev
+            prev._dependents = [ref for ref in prev._dependents if ref() is not None]
+            prev._dependents.append(weakref.ref(self))
+            upstream = {id(p) for p in prev._internal_params}
+            params = [p for p in params if id(p) not in upstream]
+        for _, group in full_groupby(params, lambda x: id(x.owner)):
+            self._watch_invalidation(group[0].owner, self._invalidate_current, [p.name for p in group])
 
     def _watch_invalidation(self, owner, method, names):
         """
@@ -1763,10 +2606,25 @@ class rx:
         weakref.finalize(self, _remove_watcher, owner, watcher)
 
     def _invalidate_current(self, *events):
-        if all(event.obj is self._trigger for event in events):
-            return
-        self._dirty = True
-        self._error_state = None
+        nodes = [self]
+        while nodes:
+            node = nodes.pop()
+            if node._dependents:
+                dependents = [ref() for ref in node._dependents]
+                nodes.extend(dep for dep in dependents if dep is not None)
+            if all(event.obj is node._trigger for event in events):
+                continue
+            node._dirty = True
+            node._error_state = None
+            if node._incremental is not None:
+                root = node._root
+                if not (root._appending and all(event.obj is root._wrapper for event in events)):
+                    node._incremental.valid = False
+            if node._arg_cache:
+                changed = {(id(event.obj), event.name) for event in events}
+                for key in list(node._arg_cache):
+                    if not node._arg_deps[key].isdisjoint(changed):
+                        del node._arg_cache[key]
 
     def _invalidate_obj(self, *events):
         t.cast('t.Any', self._root)._dirty_obj = True
@@ -1792,7 +2650,7 @@ class rx:
                 if stale():
                     return
                 self._current_ = shared.rx.value
-                trigger.param.trigger('value')
+                self._emit_async()
             elif inspect.isasyncgen(obj):
                 async for val in obj:
                     if stale():
@@ -1807,21 +2665,38 @@ class rx:
                             )
                         break
                     self._current_ = val
-                    trigger.param.trigger('value')
+                    self._emit_async()
             else:
                 value = await obj
                 if stale():
                     return
                 self._current_ = value
-                trigger.param.trigger('value')
+                self._emit_async()
         except asyncio.CancelledError:
             return
         finally:
             if self._current_task is task:
                 self._current_task = None
+            if generation == self._resolve_generation:
+                self._async_busy = False
+                if self._async_queue:
+                    self._lazy_resolve(self._async_queue.popleft())
+                # Emit the final result once no more results are pending
+                if not self._async_busy:
+                    self._flush_async()
 
     def _lazy_resolve(self, obj = None):
         from .parameterized import async_executor
+        policy = self._async_policy
+        if self._async_busy and policy != 'latest':
+            if policy == 'queue':
+                if self._async_queue is None:
+                    self._async_queue = deque()
+                self._async_queue.append(obj)
+            elif inspect.iscoroutine(obj) or inspect.isgenerator(obj):
+                # Dropped while busy, close it to avoid warnings
+                obj.close()
+            return
         if inspect.isgenerator(obj):
             obj = _to_async_gen(obj)
         self._resolve_generation += 1
@@ -1829,54 +2704,182 @@ class rx:
         previous_task = self._current_task
         if previous_task is not None and not previous_task.done():
             previous_task.cancel()
+        self._async_busy = True
         async_executor(partial(self._resolve_async, obj, generation))
 
+    def _emit_async(self):
+        """
+        Notify dependents of a new asynchronous result, coalescing rapid
+        results into a single notification if requested.
+        """
+        if self._async_coalesce is None:
+            t.cast('Trigger', self._trigger).param.trigger('value')
+        elif self._async_emit_handle is None:
+            import asyncio
+            self._async_emit_handle = asyncio.get_running_loop().call_later(
+                self._async_coalesce, self._flush_async
+            )
+
+    def _flush_async(self):
+        """Emit a coalesced notification that is still pending."""
+        handle = self._async_emit_handle
+        if handle is None:
+            return
+        handle.cancel()
+        self._async_emit_handle = None
+        t.cast('Trigger', self._trigger).param.trigger('value')
+
+    def _aliases_shared(self) -> bool:
+        """
+        Whether this node was cloned from a shared node without diverging
+        accessor and therefore simply takes on its value.
+        """
+        return (
+            self._shared is not None and self._method is None and
+            self._shared._method is None and not self._is_async
+        )
+
+    def _fusable(self) -> bool:
+        """
+        Whether this node applies a pure operation whose output only feeds
+        the single node derived from it, so that it can be fused into the
+        evaluation of that node without storing its own output.
+        """
+        return self._pure and self._shared is None and len(self._dependents) == 1
+
+    def _fused_operations(self, nodes: list[rx]) -> Callable[[t.Any], t.Any]:
+        """Return the fused operations of the given nodes preceding this one."""
+        fused = self._fused
+        if fused is None or fused[0] != len(nodes):
+            fused = self._fused = (len(nodes), _fuse_operations(nodes))
+        return fused[1]
+
     def _resolve(self):
         if self._error_state:
             raise self._error_state
-        elif self._dirty or self._root._dirty_obj:
-            try:
-                obj = self._obj if self._prev is None else self._prev._resolve()
-                if obj is Skip or obj is Undefined:
-                    self._current_ = Undefined
-                    raise Skip
-                elif (
-                    self._shared is not None and
-                    self._method is None and
-                    self._shared._method is None
-                ):
-                    # If this rx is cloned from an shared input then we make use
-                    # of the shared.rx.value to ensure branching pipelines do
-                    # not have to recompute the inputs multiple times.
-                    if self._is_async:
-                        self._shared.rx.value # trigger async resolve
-                        self._lazy_resolve()
-                    else:
-                        self._current_ = self._shared.rx.value
-                    raise Skip
-                operation = self._operation
-                if operation:
+        # Walk back to the closest node that does not have to be
+        # re-evaluated, then evaluate the dirty nodes going forward.
+        # Changes to the inputs of the root invalidate all its dependents,
+        # so only the root itself has to check whether its object is dirty,
+        # which lets a cache hit leave the nodes upstream of it unresolved.
+        nodes = []
+        cache_keys = {}
+        node = self
+        while node._error_state is None and (
+            node._dirty or (node._prev is None and node._root._dirty_obj)
+        ):
+            if node._cache is not None:
+                key = cache_keys[id(node)] = node._cache.key(node._internal_params)
+                cached = node._cache.get(key)
+                if cached is not Undefined:
+                    node._current_ = cached
+                    node._dirty = False
+                    break
+            nodes.append(node)
+            if node._aliases_shared():
+                node = node._shared
+            elif node._prev is None:
+                node = None
+                break
+            else:
+                node = node._prev
+        try:
+            if node is None:
+                try:
+                    obj = nodes[-1]._obj
+                except Skip:
+                    root = nodes.pop()
+                    root._dirty = False
+                    obj = root._current_
+            elif node._error_state is not None:
+                raise node._error_state
+            else:
+                obj = node._current_
+                if node._method:
+                    obj = getattr(obj, node._method, obj)
+            fuse = not profiling.enabled
+            while nodes:
+                node = nodes[-1]
+                if fuse and node._fusable() and obj is not Skip and obj is not Undefined:
+                    # Linear runs of pure operations are applied by a single
+                    # callable, leaving the nodes in the run dirty so they are
+                    # recomputed if their own value is requested. Branching
+                    # nodes have several dependents and always store outputs.
+                    i = len(nodes) - 1
+                    while i > 0 and nodes[i]._fusable() and nodes[i-1]._prev is nodes[i]:
+                        i -= 1
+                    if i < len(nodes) - 1:
+                        fused = nodes[i]._fused_operations(nodes[:i:-1])
+                        try:
+                            obj = fused(obj)
+                        except Skip:
+                            # Evaluate the run node by node to handle the Skip
+                            fuse = False
+                        else:
+                            del nodes[i+1:]
+                            continue
+                obj = node._evaluate(obj)
+                if node._cache is not None and node._current_ is not Undefined:
+                    node._cache.put(cache_keys[id(node)], node._current_)
+                nodes.pop()
+        except Exception as e:
+            for node in nodes:
+                node._error_state = e
+            raise e
+        if hasattr(obj, '__call__'):
+            self.__call__.__func__.__doc__ = self.__call__.__doc__
+        return obj
+
+    def _evaluate(self, obj):
+        """
+        Evaluate this node given the output of the node preceding it,
+        or of the shared node it aliases, and return its own output.
+        """
+        try:
+            if obj is Skip or obj is Undefined:
+                self._current_ = Undefined
+                raise Skip
+            elif (
+                self._shared is not None and
+                self._method is None and
+                self._shared._method is None
+            ):
+                # If this rx is cloned from an shared input then we make use
+                # of the shared.rx.value to ensure branching pipelines do
+                # not have to recompute the inputs multiple times.
+                if self._is_async:
+                    self._shared.rx.value # trigger async resolve
+                    self._lazy_resolve()
+                else:
+                    # _resolve already passed in the value of the shared node
+                    self._current_ = obj
+                    self._dirty_obj = False
+                raise Skip
+            operation = self._operation
+            if operation:
+                if profiling.enabled:
+                    obj = profiling._profile.call(
+                        _operation_name(operation), self._eval_operation,
+                        (obj, operation), category='rx'
+                    )
+                else:
                     obj = self._eval_operation(obj, operation)
-                    if self._is_async:
-                        self._lazy_resolve(obj)
-                        obj = Skip
-                    if obj is Skip:
-                        raise Skip
-            except Skip:
-                self._dirty = False
-                return self._current_
-            except Exception as e:
-                self._error_state = e
-                raise e
-            self._current_ = current = obj
-        else:
-            current = self._current_
+                if self._is_async:
+                    self._lazy_resolve(obj)
+                    obj = Skip
+                if obj is Skip:
+                    raise Skip
+        except Skip:
+            self._dirty = False
+            return self._current_
+        except Exception as e:
+            self._error_state = e
+            raise e
+        self._current_ = current = obj
         self._dirty = False
         if self._method:
             # E.g. `pi = dfi.A` leads to `pi._method` equal to `'A'`.
             current = getattr(current, self._method, current)
-        if hasattr(current, '__call__'):
-            self.__call__.__func__.__doc__ = self.__call__.__doc__
         return current
 
     def _transform_output(self, obj):
@@ -1952,14 +2955,36 @@ class rx:
         self._method = None
         return self._clone(operation)
 
+    def _operation_input(self) -> Self:
+        if self._method:
+            return self._resolve_accessor()
+        # Without a pending method accessor an operation can be applied
+        # to this node directly rather than to an intermediate copy,
+        # evaluating it eagerly just like the copy would.
+        if not self._lazy:
+            _ = self._current
+        return self
+
     def __getattribute__(self, name):
+        if name.startswith('_') or name == 'rx':
+            return super().__getattribute__(name)
         self_dict = super().__getattribute__('__dict__')
-        if not self_dict.get('_init') or name == 'rx' or name.startswith('_'):
+        if not self_dict.get('_init'):
             return super().__getattribute__(name)
 
         current = self_dict['_current_']
         dirty = self_dict['_dirty']
         if self_dict['_lazy']:
+            if name in self_dict:
+                return self_dict[name]
+            elif name in rx._accessors:
+                # Only evaluate the expression to check the accessor
+                # predicate once the accessor is actually requested
+                accessor, predicate = rx._accessors[name]
+                if predicate is None or predicate(self._resolve()):
+                    new = accessor(self)
+                    setattr(self, name, new)
+                    return new
             # there is no current, delay the getattr to later
             operation = {
                 'fn': lambda obj, name: getattr(obj, name),
@@ -2014,7 +3039,7 @@ class rx:
     #----------------------------------------------------------------
 
     def __array_ufunc__(self, ufunc, method, *args, **kwargs) -> Self:
-        new = self._resolve_accessor()
+        new = self._operation_input()
         operation = {
             'fn': getattr(ufunc, method),
             'args': args[1:],
@@ -2026,7 +3051,7 @@ class rx:
     def _apply_operator(
         self, operator: Callable, *args, reverse: bool = False, **kwargs
     ) -> Self:
-        new = self._resolve_accessor()
+        new = self._operation_input()
         operation = {
             'fn': operator,
             'args': args,
@@ -2173,20 +3198,24 @@ class rx:
             'expression value.'
         )
 
+    def _resolve_argument(self, key, arg):
+        deps = self._arg_deps.get(key, frozenset())
+        if deps is None:
+            val = arg
+        elif key in self._arg_cache:
+            val = self._arg_cache[key]
+        else:
+            val = resolve_value(arg)
+            if deps:
+                self._arg_cache[key] = val
+        if val is Skip or val is Undefined:
+            raise Skip
+        return val
+
     def _eval_operation(self, obj, operation):
         fn, args, kwargs = operation['fn'], operation['args'], operation['kwargs']
-        resolved_args = []
-        for arg in args:
-            val = resolve_value(arg)
-            if val is Skip or val is Undefined:
-                raise Skip
-            resolved_args.append(val)
-        resolved_kwargs = {}
-        for k, arg in kwargs.items():
-            val = resolve_value(arg)
-            if val is Skip or val is Undefined:
-                raise Skip
-            resolved_kwargs[k] = val
+        resolved_args = [self._resolve_argument(i, arg) for i, arg in enumerate(args)]
+        resolved_kwargs = {k: self._resolve_argument(k, arg) for k, arg in kwargs.items()}
         if isinstance(fn, str):
             obj = getattr(obj, fn)(*resolved_args, **resolved_kwargs)
         elif operation.get('reverse'):
@@ -145,6 +145,13 @@ def test_bind_instance_params_and_constants_as_args_and_kwargs():
     P.number = 6.28
     assert bound_fn() == (('foo', 'baz',), {'num': 6.28, 'bar': 6})
 
+def test_bind_repeated_partial_calls_independent():
+    P = Parameters()
+    bound_fn = bind(identity, 'foo', P.param.string, num=P.param.number)
+    assert bound_fn(1, extra=2) == (('foo', 'string', 1), {'num': 3.14, 'extra': 2})
+    P.string = 'baz'
+    assert bound_fn() == (('foo', 'baz'), {'num': 3.14})
+
 def test_bind_curry_function_with_deps():
     P = Parameters()
     bound_fn = bind(
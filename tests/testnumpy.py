@@ -78,3 +78,28 @@ class TestNumpy(unittest.TestCase):
 
         mp = MatParam()
         mp.param.pprint()
+
+
+class TestReactiveBuffer(unittest.TestCase):
+
+    def test_buffer_dtype(self):
+        x = param.rx(0.0)
+        buffered = x.rx.buffer(3, dtype='float64')
+        for i in range(1, 6):
+            x.rx.value = float(i)
+            view = buffered.rx.value
+            _is_array_and_equal(view, numpy.arange(max(1, i-2), i+1, dtype='float64'))
+        assert not view.flags.writeable
+        assert view.base is not None
+
+    def test_buffer_dtype_views_share_memory(self):
+        x = param.rx(0.0)
+        buffered = x.rx.buffer(2, dtype='float64')
+        views, copies = [], []
+        buffered.rx.watch(lambda v: (views.append(v), copies.append(v.copy())))
+        for i in range(1, 4):
+            x.rx.value = float(i)
+        # Views are overwritten as new items arrive, copies are not
+        _is_array_and_equal(copies[0], [0.0, 1.0])
+        assert numpy.shares_memory(views[0], views[-1])
+        _is_array_and_equal(views[-1], [2.0, 3.0])
@@ -1,11 +1,14 @@
 """Unit test for param.depends."""
 
 import asyncio
+import threading
 
 import param
 import pytest
 
-from param.parameterized import _parse_dependency_spec
+from param.parameterized import (
+    _parse_dependency_spec, _split_dependency_path, propagation_mode
+)
 
 
 @pytest.fixture
@@ -54,6 +57,36 @@ class TestDependencyParser:
         assert attr == 'parameter'
         assert what == 'constant'
 
+    def test_parse_cached(self):
+        spec = 'subobject.cached_parameter:constant'
+        first = _parse_dependency_spec(spec)
+        hits = _parse_dependency_spec.cache_info().hits
+        assert _parse_dependency_spec(spec) is first
+        assert _parse_dependency_spec.cache_info().hits == hits + 1
+
+    def test_split_path(self):
+        assert _split_dependency_path('.subobject.subsubobject') == ('subobject', 'subsubobject')
+
+    def test_dynamic_dependency_reparsed_from_cache(self):
+        class Sub(param.Parameterized):
+            a = param.Parameter()
+
+        class P(param.Parameterized):
+            sub = param.Parameter()
+
+            count = param.Integer()
+
+            @param.depends('sub.a', watch=True)
+            def cb(self):
+                self.count += 1
+
+        p = P(sub=Sub())
+        misses = _parse_dependency_spec.cache_info().misses
+        p.sub = Sub()
+        p.sub.a = 1
+        assert p.count == 1
+        assert _parse_dependency_spec.cache_info().misses == misses
+
 
 class TestParamDependsSubclassing:
 
@@ -1274,6 +1307,543 @@ class TestParamDepends:
         assert pinfo.name == 'p'
 
 
+class TestDependsGraph:
+
+    def test_graph_compiled_once_per_class(self):
+        class P(param.Parameterized):
+            a = param.Parameter()
+
+            @param.depends('a', watch=True)
+            def cb(self):
+                pass
+
+        assert P._param__private.depends_graph is None
+        P()
+        graph = P._param__private.depends_graph
+        assert graph is not None
+        P()
+        assert P._param__private.depends_graph is graph
+
+    def test_graph_groups_constant_dependencies(self):
+        class P(param.Parameterized):
+            a = param.Parameter()
+            b = param.Parameter()
+
+            @param.depends('a', 'b', 'a:constant', watch=True)
+            def cb(self):
+                pass
+
+        graph = P().param._depends_graph
+        [(name, _, _, groups, dynamic, coroutine, executor)] = graph.methods
+        assert name == 'cb'
+        assert groups == [(None, 'value', ['a', 'b']), (None, 'constant', ['a'])]
+        assert dynamic == []
+        assert not coroutine
+        assert executor is None
+
+    def test_graph_indexes_dynamic_dependencies(self):
+        class P(param.Parameterized):
+            a = param.Parameter()
+            b = param.Parameter()
+
+            @param.depends('a.x', 'b.y', watch=True)
+            def cb(self):
+                pass
+
+        graph = P().param._depends_graph
+        assert sorted(graph.dynamic) == ['a', 'b']
+        assert [spec.spec for spec in graph.dynamic['a'][0][2]] == ['a.x']
+
+    def test_graph_subclass_inherits_watchers(self):
+        class P(param.Parameterized):
+            a = param.Parameter()
+
+            count = param.Integer()
+
+            @param.depends('a', watch=True)
+            def cb(self):
+                self.count += 1
+
+        class Q(P):
+            b = param.Parameter()
+
+            @param.depends('b', watch=True)
+            def cb2(self):
+                self.count += 10
+
+        q = Q()
+        q.a = 1
+        q.b = 1
+        assert q.count == 11
+        assert Q._param__private.depends_graph is not P._param__private.depends_graph
+
+    def test_dynamic_dependency_swap_keeps_other_attributes(self):
+        class Sub(param.Parameterized):
+            x = param.Number()
+
+        class P(param.Parameterized):
+            a = param.Parameter()
+            b = param.Parameter()
+            count = param.Integer()
+
+            @param.depends('a.x', 'b.x', watch=True)
+            def cb(self):
+                self.count += 1
+
+        p = P(a=Sub(), b=Sub())
+        p.a = Sub()
+        p.b.x = 1
+        assert p.count == 1
+        p.a.x = 1
+        assert p.count == 2
+
+    def test_dynamic_dependency_swap_rewires_incrementally(self):
+        class Sub(param.Parameterized):
+            a = param.Number()
+            b = param.Parameter()
+
+        class P(param.Parameterized):
+            b = param.Parameter()
+            count = param.Integer()
+
+            @param.depends('b.b.a', watch=True)
+            def cb(self):
+                self.count += 1
+
+        p = P(b=Sub(b=Sub()))
+        old = [w for _, w in p._param__private.dynamic_watchers['cb']['b']]
+        old_leaf = p.b.b
+        p.b.b = Sub(a=1)
+        assert p.count == 1
+        new = [w for _, w in p._param__private.dynamic_watchers['cb']['b']]
+        # Only the watcher on the replaced subobject is recreated
+        assert all(n is o for n, o in zip(new[:2], old[:2]))
+        assert new[2] is not old[2] and new[2].inst is p.b.b
+        assert not old_leaf._param__private.watchers['a']['value']
+        p.b.b.a = 2
+        assert p.count == 2
+        old_leaf.a = 3
+        assert p.count == 2
+
+    def test_instance_parameters_not_copied_for_dependencies(self):
+        class P(param.Parameterized):
+            a = param.Parameter()
+
+            @param.depends('a', watch=True)
+            def cb(self):
+                pass
+
+        p = P()
+        assert 'a' not in p._param__private.params
+
+
+class Diamond(param.Parameterized):
+
+    a = param.Number()
+
+    b = param.Number()
+
+    c = param.Number()
+
+    calls = param.List()
+
+    @param.depends('a', watch=True)
+    def update_b(self):
+        self.b = self.a + 1
+
+    @param.depends('a', watch=True)
+    def update_c(self):
+        self.c = self.a + 2
+
+    @param.depends('b', 'c', watch=True)
+    def total(self):
+        self.calls.append((self.b, self.c))
+
+
+class TestPropagation:
+
+    def test_diamond_depth_first_observes_glitch(self):
+        d = Diamond()
+        d.a = 1
+        assert d.calls == [(2, 0), (2, 3)]
+
+    def test_diamond_topological_runs_once(self):
+        d = Diamond()
+        with propagation_mode('topological'):
+            d.a = 1
+        assert d.calls == [(2, 3)]
+        assert param.parameterized.propagation == 'depth-first'
+
+    def test_topological_writers_declared_statically(self):
+        d = Diamond()
+        graph = d.param._depends_graph
+        assert graph.writers == {'b': {'update_b'}, 'c': {'update_c'}}
+        propagation = param.parameterized._Propagation()
+        assert propagation.height(d, 'a') == 0
+        assert propagation.height(d, 'b') == propagation.height(d, 'c') == 1
+
+    def test_topological_learns_writes_of_helpers(self):
+        class P(param.Parameterized):
+            a = param.Number()
+            b = param.Number()
+
+            @param.depends('a', watch=True)
+            def update_b(self):
+                self._set_b()
+
+            def _set_b(self):
+                self.b = self.a
+
+            @param.depends('b', watch=True)
+            def record(self):
+                pass
+
+        p = P()
+        assert p.param._depends_graph.writers == {}
+        with propagation_mode('topological'):
+            p.a = 1
+        assert p.param._depends_graph.writers == {'b': {'update_b'}}
+
+    def test_topological_chain_runs_in_rank_order(self):
+        class Chain(param.Parameterized):
+            a = param.Number()
+            b = param.Number()
+            c = param.Number()
+            calls = param.List()
+
+            @param.depends('a', 'c', watch=True)
+            def report(self):
+                self.calls.append((self.a, self.c))
+
+            @param.depends('a', watch=True)
+            def update_b(self):
+                self.b = self.a * 2
+
+            @param.depends('b', watch=True)
+            def update_c(self):
+                self.c = self.b + 1
+
+        chain = Chain()
+        with propagation_mode('topological'):
+            chain.a = 1
+        assert chain.calls == [(1, 3)]
+
+    def test_topological_subobject_diamond_runs_once(self):
+        class Leaf(param.Parameterized):
+            x = param.Number()
+            y = param.Number()
+
+            @param.depends('x', watch=True)
+            def update_y(self):
+                self.y = self.x * 2
+
+        class Root(param.Parameterized):
+            a = param.Number()
+            left = param.ClassSelector(class_=Leaf)
+            right = param.ClassSelector(class_=Leaf)
+            calls = param.List()
+
+            @param.depends('a', watch=True)
+            def push(self):
+                self.left.x = self.a
+                self.right.param.update(x=self.a)
+
+            @param.depends('left.y', 'right.y', watch=True)
+            def total(self):
+                self.calls.append((self.left.y, self.right.y))
+
+        root = Root(left=Leaf(), right=Leaf())
+        with propagation_mode('topological'):
+            root.a = 1
+            root.a = 2
+        assert root.calls == [(2, 2), (4, 4)]
+
+    def test_topological_subobject_chain(self):
+        class Leaf(param.Parameterized):
+            x = param.Number()
+            y = param.Number()
+
+            @param.depends('x', watch=True)
+            def update_y(self):
+                self.y = self.x + 10
+
+        class Root(param.Parameterized):
+            a = param.Number()
+            b = param.Number()
+            leaf = param.ClassSelector(class_=Leaf)
+            calls = param.List()
+
+            @param.depends('a', 'leaf.y', watch=True)
+            def report(self):
+                self.calls.append((self.a, self.leaf.y))
+
+            @param.depends('a', watch=True)
+            def update_b(self):
+                self.b = self.a
+
+            @param.depends('b', watch=True)
+            def push(self):
+                self.leaf.x = self.b
+
+        root = Root(leaf=Leaf())
+        with propagation_mode('topological'):
+            root.a = 1
+        assert root.calls == [(1, 11)]
+
+    def test_propagation_mode_thread_local(self):
+        d = Diamond()
+        entered, release = threading.Event(), threading.Event()
+
+        def run():
+            with propagation_mode('topological'):
+                entered.set()
+                release.wait(5)
+
+        thread = threading.Thread(target=run)
+        thread.start()
+        try:
+            entered.wait(5)
+            d.a = 1
+        finally:
+            release.set()
+            thread.join()
+        assert d.calls == [(2, 0), (2, 3)]
+        assert param.parameterized._propagation_overrides == 0
+
+    def test_topological_merges_events(self):
+        d = Diamond()
+        events = []
+        d.param.watch(lambda *evs: events.extend(evs), ['b', 'c'])
+        with propagation_mode('topological'):
+            d.param.update(b=1, c=2)
+        assert [(e.name, e.old, e.new) for e in events] == [('b', 0, 1), ('c', 0, 2)]
+        assert d.calls == [(1, 2)]
+
+    def test_topological_merges_repeated_event(self):
+        class P(param.Parameterized):
+            a = param.Number()
+            b = param.Number()
+
+            @param.depends('a', watch=True)
+            def update_b(self):
+                self.b = 1
+                self.b = 2
+
+        p = P()
+        events = []
+        p.param.watch(lambda *evs: events.extend(evs), 'b')
+        with propagation_mode('topological'):
+            p.a = 1
+        assert [(e.old, e.new) for e in events] == [(0, 2)]
+
+    def test_topological_queued_watcher(self):
+        class P(param.Parameterized):
+            a = param.Number()
+            b = param.Number()
+            calls = param.List()
+
+            @param.depends('b', watch=True)
+            def record(self):
+                self.calls.append(self.b)
+
+        p = P()
+        p.param.watch(lambda event: setattr(p, 'b', event.new), 'a', queued=True)
+        with propagation_mode('topological'):
+            p.a = 1
+        assert p.calls == [1]
+
+    def test_topological_error_runs_remaining_watchers(self):
+        d = Diamond()
+        calls = []
+
+        def fail(event):
+            if event.new == 1:
+                raise ValueError('Watcher failed')
+
+        d.param.watch(fail, 'a')
+        d.param.watch(lambda event: calls.append(event.new), 'a')
+        with propagation_mode('topological'):
+            with pytest.raises(ValueError, match='Watcher failed'):
+                d.a = 1
+            assert calls == [1]
+            assert d.calls == [(2, 3)]
+            d.a = 2
+        assert calls == [1, 2]
+        assert param.parameterized._propagation_state.current is None
+
+    def test_invalid_propagation_mode(self):
+        with pytest.raises(ValueError, match="Propagation mode must be"):
+            with propagation_mode('breadth-first'):
+                pass
+
+
+class Cached(param.Parameterized):
+
+    a = param.Parameter(0)
+
+    b = param.Parameter()
+
+    calls = param.Integer()
+
+    @param.depends('a', cache=True)
+    def view(self, scale=1):
+        self.calls += 1
+        return self.a * scale
+
+    @param.depends('b.a', cache=2)
+    def nested(self):
+        self.calls += 1
+        return None if self.b is None else self.b.a
+
+
+class TestDependsCache:
+
+    def test_method_cache_hit(self):
+        p = Cached(a=1)
+        assert p.view() == 1
+        assert p.view() == 1
+        assert p.calls == 1
+        assert p.view._dinfo['cache'] == 128
+
+    def test_method_cache_miss_on_change(self):
+        p = Cached(a=1)
+        p.view()
+        p.a = 2
+        assert p.view() == 2
+        p.a = 1
+        assert p.view() == 1
+        assert p.calls == 2
+
+    def test_method_cache_keyed_on_arguments(self):
+        p = Cached(a=1)
+        assert p.view(scale=2) == 2
+        assert p.view(scale=3) == 3
+        assert p.view(scale=2) == 2
+        assert p.calls == 2
+
+    def test_method_cache_per_instance(self):
+        p1, p2 = Cached(a=1), Cached(a=1)
+        p1.view()
+        p2.view()
+        assert p1.calls == 1
+        assert p2.calls == 1
+
+    def test_method_cache_lru_eviction(self):
+        p = Cached(b=Cached(a=1))
+        for a in (1, 2, 3):
+            p.b.a = a
+            p.nested()
+        p.b.a = 2
+        p.nested()
+        assert p.calls == 3
+        p.b.a = 1
+        p.nested()
+        assert p.calls == 4
+
+    def test_method_cache_subobject_dependency(self):
+        p = Cached(b=Cached(a=1))
+        assert p.nested() == 1
+        p.b = Cached(a=2)
+        assert p.nested() == 2
+        p.b = Cached(a=2)
+        assert p.nested() == 2
+        assert p.calls == 2
+
+    def test_method_cache_unhashable_values_keyed_on_version(self):
+        p = Cached(a=[1])
+        p.view()
+        p.a.append(2)
+        p.view()
+        assert p.calls == 1
+        p.a = [1, 2]
+        p.view()
+        assert p.calls == 2
+
+    def test_method_cache_unhashable_values_modified_in_place(self):
+        class P(param.Parameterized):
+            l = param.List([1, 2])
+
+            @param.depends('l', cache=True)
+            def total(self):
+                return sum(self.l)
+
+        p = P()
+        assert p.total() == 3
+        p.l.append(5)
+        p.param.trigger('l')
+        assert p.total() == 8
+        p.l.append(1)
+        p.l = p.l
+        assert p.total() == 9
+
+    def test_method_cache_overridden_in_subclass(self):
+        class Sub(Cached):
+            @param.depends('b')
+            def view(self, scale=1):
+                return super().view(scale)
+
+        p = Sub(a=1)
+        assert p.view() == 1
+        p.a = 2
+        assert p.view() == 2
+        assert p.calls == 2
+
+    def test_method_cache_unhashable_subobject_values(self):
+        p = Cached(b=Cached(a=[1]))
+        p.nested()
+        p.nested()
+        assert p.calls == 2
+
+    def test_method_cache_clear(self):
+        p = Cached(a=1)
+        p.view()
+        Cached.view.cache_clear()
+        p.view()
+        assert p.calls == 2
+
+    def test_method_cache_with_watch(self):
+        class P(param.Parameterized):
+            a = param.Parameter(0)
+            calls = param.Integer()
+
+            @param.depends('a', watch=True, cache=True)
+            def cb(self):
+                self.calls += 1
+
+        p = P()
+        p.a = 1
+        p.a = 2
+        p.a = 1
+        assert p.calls == 2
+
+    def test_function_cache(self):
+        p = Cached(a=1)
+        calls = []
+
+        @param.depends(p.param.a, cache=True)
+        def function(a):
+            calls.append(a)
+            return a + 1
+
+        assert function(p.a) == 2
+        assert function(p.a) == 2
+        p.a = 2
+        assert function(p.a) == 3
+        assert calls == [1, 2]
+
+    def test_invalid_cache(self):
+        with pytest.raises(ValueError, match='boolean or a positive integer'):
+            @param.depends('a', cache=0)
+            def function(self):
+                pass
+
+    def test_cache_coroutine_not_supported(self):
+        with pytest.raises(ValueError, match='Caching is not supported'):
+            @param.depends('a', cache=True)
+            async def function(self):
+                pass
+
+
 class TestParamDependsFunction:
 
     def setup_method(self):
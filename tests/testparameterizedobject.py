@@ -1,6 +1,7 @@
 """Unit test for Parameterized."""
 import abc
 import inspect
+import pickle
 import re
 import sys
 import unittest
@@ -2002,3 +2003,119 @@ def test_no_param_namespace_cycle():
 
     del obj
     assert freed, "Parameterized instance not freed immediately — likely a reference cycle via .param"
+
+
+class Versioned(param.Parameterized):
+
+    a = param.Number()
+
+    b = param.List()
+
+
+def test_version_initial():
+    p = Versioned(a=1, b=[1])
+    assert p.param.version('a') == 0
+    assert p.param.version('b') == 0
+    assert p.param.version() == 0
+
+
+def test_version_not_tracked_until_requested():
+    p = Versioned()
+    p.a = 1
+    assert p._param__private.versions is None
+    assert p.param.version('a') == 0
+    p.a = 2
+    assert p.param.version('a') == 1
+    assert p.param.version() == 1
+
+
+def test_version_incremented_on_change():
+    p = Versioned()
+    p.param.version()
+    p.a = 1
+    p.a = 2
+    assert p.param.version('a') == 2
+    assert p.param.version('b') == 0
+    assert p.param.version() == 2
+
+
+def test_version_unchanged_when_equal_scalar_set():
+    p = Versioned(a=1)
+    p.param.version()
+    p.a = 1
+    p.a = 1.0
+    assert p.param.version('a') == 1
+
+
+def test_version_incremented_when_container_set_again():
+    p = Versioned()
+    p.b.append(1)
+    assert p.param.version('b') == 0
+    p.b = p.b
+    assert p.param.version('b') == 1
+    p.b = [1]
+    assert p.param.version('b') == 2
+
+
+def test_version_incremented_on_trigger():
+    p = Versioned(a=1)
+    p.param.version()
+    p.b.append(1)
+    p.param.trigger('a', 'b')
+    assert p.param.version('a') == 1
+    assert p.param.version('b') == 1
+    assert p.param.version() == 2
+
+
+def test_version_update_batch():
+    p = Versioned()
+    p.param.version()
+    p.param.update(a=1, b=[1])
+    assert p.param.version() == 2
+
+
+def test_version_class():
+    class P(param.Parameterized):
+        a = param.Number()
+
+    assert P.param.version('a') == 0
+    P.a = 1
+    assert P.param.version('a') == 1
+    assert P.param.version() == 1
+    assert P().param.version('a') == 0
+
+
+def test_version_class_subclass():
+    class Base(param.Parameterized):
+        x = param.Number(1)
+
+    class Sub(Base):
+        pass
+
+    Base.param.version()
+    Base.x = 2
+    assert Base.param.version('x') == 1
+    assert Sub.param.version('x') == 1
+    Sub.x = 3
+    assert Base.param.version('x') == 1
+    assert Sub.param.version('x') == 2
+    assert Sub.param.version() == 1
+    Base.x = 5
+    assert Base.param.version('x') == 2
+    assert Sub.param.version('x') == 2
+    assert Sub.x == 3
+
+
+def test_version_unknown_parameter():
+    with pytest.raises(ValueError, match='c parameter was not found'):
+        Versioned().param.version('c')
+
+
+def test_version_pickle_roundtrip():
+    p = Versioned()
+    p.param.version()
+    p.a = 1
+    p2 = pickle.loads(pickle.dumps(p))
+    assert p2.param.version('a') == 1
+    p2.a = 2
+    assert p2.param.version('a') == 2
@@ -0,0 +1,208 @@
+"""Unit test for the watcher and rx profiling instrumentation."""
+import json
+import time
+
+import param
+import pytest
+
+from param import profiling
+
+
+class Profiled(param.Parameterized):
+
+    a = param.Number()
+
+    b = param.Number()
+
+    c = param.Number()
+
+    @param.depends('a', watch=True)
+    def slow(self):
+        time.sleep(0.01)
+
+    @param.depends('b', watch=True)
+    def cascade(self):
+        self.c = self.b
+
+    @param.depends('c', watch=True)
+    def leaf(self):
+        pass
+
+
+def process_callback(event):
+    return event.new
+
+
+@pytest.fixture(autouse=True)
+def reset_profiling():
+    profiling.disable()
+    profiling.reset()
+    yield
+    profiling.disable()
+    profiling.reset()
+
+
+def test_profiling_disabled_by_default():
+    p = Profiled()
+    p.a = 1
+    assert profiling.stats()['callbacks'] == {}
+
+
+def test_profile_depends_watcher():
+    p = Profiled()
+    with profiling.profile() as profile:
+        p.a = 1
+        p.a = 2
+    stats = profile.stats()['callbacks']['Profiled.slow']
+    assert stats['calls'] == 2
+    assert stats['max'] >= 0.01
+    assert stats['total'] >= stats['max']
+    assert stats['mean'] == stats['total'] / 2
+
+
+def test_profile_context_restores_state():
+    p = Profiled()
+    with profiling.profile():
+        pass
+    assert not profiling.enabled
+    p.a = 1
+    assert profiling.stats()['callbacks'] == {}
+
+
+def test_profile_enable_disable():
+    p = Profiled()
+    profiling.enable()
+    p.a = 1
+    profiling.disable()
+    p.a = 2
+    assert profiling.stats()['callbacks']['Profiled.slow']['calls'] == 1
+
+
+def test_profile_watch_function():
+    p = Profiled()
+
+    def callback(event):
+        pass
+
+    p.param.watch(callback, 'a')
+    with profiling.profile() as profile:
+        p.a = 1
+    name = 'test_profile_watch_function.<locals>.callback'
+    assert profile.stats()['callbacks'][name]['calls'] == 1
+
+
+def test_profile_cascade_depth():
+    p = Profiled()
+    with profiling.profile() as profile:
+        p.b = 1
+    stats = profile.stats()
+    assert stats['callbacks']['Profiled.cascade']['calls'] == 1
+    assert stats['callbacks']['Profiled.leaf']['calls'] == 1
+    assert stats['max_cascade_depth'] == 2
+
+
+def test_profile_batch_events():
+    p = Profiled()
+    p.param.watch(lambda *events: None, ['a', 'b'])
+    with profiling.profile() as profile:
+        p.param.update(a=1, b=2)
+    stats = profile.stats()
+    assert stats['batches'] == 1
+    assert stats['batch_events'] == 2
+    assert stats['max_batch_events'] == 2
+
+
+def test_profile_rx_operations():
+    x = param.rx(1)
+    y = (x + 1) * 2
+    with profiling.profile() as profile:
+        x.rx.value = 2
+        assert y.rx.value == 6
+    callbacks = profile.stats()['callbacks']
+    assert callbacks['rx.add']['calls'] >= 1
+    assert callbacks['rx.mul']['calls'] >= 1
+
+
+def test_profile_reset():
+    p = Profiled()
+    with profiling.profile():
+        p.a = 1
+    with profiling.profile(reset=False) as profile:
+        p.a = 2
+    assert profile.stats()['callbacks']['Profiled.slow']['calls'] == 2
+    profiling.reset()
+    assert profiling.stats()['callbacks'] == {}
+
+
+def test_profile_sorted_by_total():
+    p = Profiled()
+    with profiling.profile() as profile:
+        p.a = 1
+        p.b = 1
+    assert next(iter(profile.stats()['callbacks'])) == 'Profiled.slow'
+
+
+def test_trace_causal_links():
+    p = Profiled()
+    with profiling.trace() as trace:
+        p.b = 1
+    events = {event['name']: event for event in trace.events}
+    assert set(events) == {'set Profiled.b', 'Profiled.cascade', 'set Profiled.c', 'Profiled.leaf'}
+    set_b, cascade = events['set Profiled.b'], events['Profiled.cascade']
+    set_c, leaf = events['set Profiled.c'], events['Profiled.leaf']
+    assert set_b['args']['parent'] is None
+    assert cascade['args']['parent'] == set_b['args']['id']
+    assert set_c['args']['parent'] == cascade['args']['id']
+    assert leaf['args']['parent'] == set_c['args']['id']
+    assert set_b['cat'] == 'set'
+    assert cascade['cat'] == 'depends'
+    assert cascade['args']['events'] == ['b']
+    assert set_b['ts'] <= cascade['ts']
+    assert cascade['ts'] + cascade['dur'] <= set_b['ts'] + set_b['dur']
+    assert all(event['ph'] == 'X' for event in trace.events)
+
+
+def test_trace_watcher_category():
+    p = Profiled()
+    p.param.watch(lambda event: None, 'a')
+    with profiling.trace() as trace:
+        p.a = 1
+    assert {event['cat'] for event in trace.events} == {'set', 'depends', 'watcher'}
+
+
+def test_trace_rx():
+    x = param.rx(1)
+    y = x + 1
+    with profiling.trace() as trace:
+        x.rx.value = 2
+        y.rx.value
+    assert any(event['cat'] == 'rx' and event['name'] == 'rx.add' for event in trace.events)
+
+
+def test_trace_restores_state():
+    p = Profiled()
+    with profiling.trace() as trace:
+        pass
+    assert not profiling.enabled
+    p.a = 1
+    assert trace.events == []
+
+
+def test_trace_save(tmp_path):
+    p = Profiled()
+    filename = tmp_path / 'trace.json'
+    with profiling.trace(filename):
+        p.b = 1
+    with open(filename) as f:
+        data = json.load(f)
+    assert len(data['traceEvents']) == 4
+    assert data['displayTimeUnit'] == 'ms'
+
+
+async def test_profile_process_executor_callback():
+    p = Profiled()
+    p.param.watch(process_callback, 'a', executor='process')
+    with profiling.profile() as profile:
+        p.a = 1
+        await p.param.idle()
+    assert 'process_callback' not in profile.stats()['callbacks']
@@ -3,6 +3,8 @@ import gc
 import math
 import operator
 import re
+import sys
+import threading
 import time
 import weakref
 
@@ -10,7 +12,7 @@ import param
 import pytest
 
 from param.parameterized import Skip
-from param.reactive import bind, rx
+from param.reactive import _OutputCache, bind, rx
 from typing import Any, Callable
 
 from .utils import async_wait_until
@@ -1039,20 +1041,692 @@ def test_reactive_derived_node_is_garbage_collected():
         return sum(len(lst) for what in watchers.values() for lst in what.values())
 
     a = param.rx(1)
-    baseline = watcher_count(a)
+    offset = param.rx(1)
+    baseline = watcher_count(offset)
     assert baseline == 2
 
-    b = a + 1
+    b = a + offset
     assert b.rx.value == 2
-    assert watcher_count(a) > baseline
+    assert watcher_count(offset) > baseline
 
     ref = weakref.ref(b)
     del b
     gc.collect()
     assert ref() is None
-    assert watcher_count(a) == baseline
+    assert watcher_count(offset) == baseline
 
-    c = a + 10
+    c = a + offset
     a.rx.value = 5
-    assert c.rx.value == 15
-    assert watcher_count(a) > baseline
+    assert c.rx.value == 6
+    assert watcher_count(offset) > baseline
+
+
+def test_reactive_derived_nodes_share_invalidation_watcher():
+    def watcher_count(source):
+        watchers = source._internal_params[0].owner._param__private.watchers
+        return sum(len(lst) for what in watchers.values() for lst in what.values())
+
+    a = param.rx(1)
+    b = a + 1
+    count = watcher_count(a)
+    c = b
+    for _ in range(50):
+        c = c * 1
+    assert watcher_count(a) == count
+    a.rx.value = 2
+    assert c.rx.value == 3
+
+
+def test_reactive_fused_chain_caches_branch_point():
+    calls = []
+
+    def count(value):
+        calls.append(value)
+        return value
+
+    x = rx(1)
+    y = (x + 1).rx.pipe(count) * 2
+    branch1 = y + 1
+    branch2 = y - 1
+    assert branch1.rx.value == 5
+    assert branch2.rx.value == 3
+    assert calls == [2]
+    x.rx.value = 2
+    assert branch2.rx.value == 5
+    assert branch1.rx.value == 7
+    assert y.rx.value == 6
+    assert calls == [2, 3]
+
+
+def test_reactive_fused_chain_skip_keeps_intermediate():
+    def skip_odd(value):
+        if value % 2:
+            raise Skip
+        return value
+
+    x = rx(0)
+    y = (x + 0).rx.pipe(skip_odd) + 1
+    assert y.rx.value == 1
+    x.rx.value = 1
+    assert y.rx.value == 1
+    x.rx.value = 2
+    assert y.rx.value == 3
+
+
+def test_reactive_fused_chain_error_recovers():
+    x = rx(1)
+    y = (x + 1).rx.pipe(lambda v: 1 / v) + 1
+    assert y.rx.value == 1.5
+    x.rx.value = -1
+    with pytest.raises(ZeroDivisionError):
+        y.rx.value
+    x.rx.value = 1
+    assert y.rx.value == 1.5
+
+
+def test_reactive_fused_operations_leave_intermediates_dirty():
+    x = rx(1)
+    a = x + 1
+    b = a * 2
+    c = b - 3
+    assert c.rx.value == 1
+    x.rx.value = 2
+    assert c.rx.value == 3
+    assert c._fused is not None
+    assert a._dirty and b._dirty
+    assert a.rx.value == 3
+    assert b.rx.value == 6
+
+
+def test_reactive_fused_operations_reused():
+    x = rx(1)
+    y = (x + 1) * 2 - 3
+    x.rx.value = 2
+    assert y.rx.value == 3
+    fused = y._fused
+    x.rx.value = 3
+    assert y.rx.value == 5
+    assert y._fused is fused
+
+
+def test_reactive_fused_operations_store_branch_point():
+    x = rx(1)
+    a = x + 1
+    b = a * 2 + 1
+    c = a * 3 + 1
+    x.rx.value = 2
+    assert b.rx.value == 7
+    assert not a._dirty
+    assert c.rx.value == 10
+
+
+def test_reactive_fused_operations_with_accessors():
+    x = rx(1+2j)
+    y = (x * 2).imag * 3 + 1
+    assert y.rx.value == 13
+    x.rx.value = 3+4j
+    assert y.rx.value == 25
+
+
+def test_reactive_fused_operations_with_references():
+    x = rx(1)
+    offset = rx(1)
+    y = (x + offset) * 2 - offset
+    x.rx.value = 2
+    assert y.rx.value == 5
+    offset.rx.value = 2
+    assert y.rx.value == 6
+    offset.rx.value = Skip
+    x.rx.value = 3
+    assert y.rx.value == 6
+
+
+def test_reactive_deep_pipeline_exceeding_recursion_limit():
+    depth = 500
+    x = rx(0)
+    y = x
+    for _ in range(depth):
+        y = y + 1
+    limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(depth // 2)
+    try:
+        x.rx.value = 1
+        assert y.rx.value == depth + 1
+    finally:
+        sys.setrecursionlimit(limit)
+
+
+def test_reactive_only_evaluates_dirty_tail():
+    calls = []
+
+    def count(value):
+        calls.append(value)
+        return value
+
+    head = rx(1)
+    tail = rx(0)
+    expr = (head + 1).rx.pipe(count) + tail
+    assert expr.rx.value == 2
+    tail.rx.value = 1
+    assert expr.rx.value == 3
+    assert calls == [2]
+    head.rx.value = 2
+    assert expr.rx.value == 4
+    assert calls == [2, 3]
+
+
+def test_reactive_error_propagates_to_downstream_nodes():
+    x = rx(1)
+    y = x.rx.pipe(lambda v: 1 / v)
+    z = y + 1
+    x.rx.value = 0
+    with pytest.raises(ZeroDivisionError):
+        z.rx.value
+    assert isinstance(z._error_state, ZeroDivisionError)
+    assert isinstance(y._error_state, ZeroDivisionError)
+
+
+def test_reactive_operation_caches_reference_arguments():
+    calls = []
+
+    class P(param.Parameterized):
+        offset = param.Integer(default=1)
+
+    p = P()
+
+    def offset(value):
+        calls.append(value)
+        return value
+
+    x = rx(1)
+    y = x + bind(offset, p.param.offset)
+    assert y.rx.value == 2
+    x.rx.value = 2
+    assert y.rx.value == 3
+    assert calls == [1]
+    p.offset = 2
+    assert y.rx.value == 4
+    assert calls == [1, 2]
+
+
+def test_reactive_operation_reference_argument_trigger():
+    class P(param.Parameterized):
+        items = param.List(default=[1])
+
+    p = P()
+    x = rx([0])
+    y = x + p.param.items
+    assert y.rx.value == [0, 1]
+    p.items.append(2)
+    p.param.trigger('items')
+    assert y.rx.value == [0, 1, 2]
+
+
+def test_reactive_operation_resolves_argument_without_dependencies():
+    counter = []
+
+    def count():
+        counter.append(None)
+        return len(counter)
+
+    x = rx(0)
+    y = x + bind(count)
+    assert y.rx.value == 1
+    x.rx.value = 1
+    assert y.rx.value == 3
+
+
+def test_reactive_cache_toggle():
+    calls = []
+
+    def expensive(value, factor):
+        calls.append((value, factor))
+        return value * factor
+
+    x = rx(1)
+    factor = rx(2)
+    cached = x.rx.pipe(expensive, factor).rx.cache()
+    assert cached.rx.value == 2
+    x.rx.value = 2
+    assert cached.rx.value == 4
+    x.rx.value = 1
+    assert cached.rx.value == 2
+    factor.rx.value = 3
+    assert cached.rx.value == 3
+    factor.rx.value = 2
+    assert (cached + 1).rx.value == 3
+    assert calls == [(1, 2), (2, 2), (1, 3)]
+
+
+def test_reactive_cache_maxsize():
+    calls = []
+    x = rx(0)
+    cached = x.rx.pipe(lambda v: calls.append(v) or v).rx.cache(maxsize=2)
+    for value in (0, 1, 2, 0):
+        x.rx.value = value
+        assert cached.rx.value == value
+    assert calls == [0, 1, 2, 0]
+    x.rx.value = 2
+    assert cached.rx.value == 2
+    assert calls == [0, 1, 2, 0]
+
+
+def test_reactive_cache_max_bytes():
+    x = rx(1)
+    cached = (x * 'a').rx.cache(max_bytes=3000)
+    for n in (1000, 1001, 1002):
+        x.rx.value = n
+        assert cached.rx.value == 'a' * n
+    cache = cached._cache
+    assert cache.nbytes <= 3000
+    assert len(cache.entries) == 2
+
+
+def test_reactive_cache_unhashable_input():
+    calls = []
+    data = [1, 2]
+    x = rx(data)
+    cached = x.rx.pipe(lambda v: calls.append(v) or sum(v)).rx.cache()
+    assert cached.rx.value == 3
+    x.rx.value = [1, 2, 3]
+    assert cached.rx.value == 6
+    x.rx.value = data
+    assert cached.rx.value == 3
+    assert len(calls) == 3
+
+
+def test_reactive_cache_unhashable_parameter_triggered():
+    class P(param.Parameterized):
+        l = param.List([1])
+
+    p = P()
+    calls = []
+    cached = rx(p.param.l).rx.pipe(lambda v: calls.append(v) or sum(v)).rx.cache()
+    assert cached.rx.value == 1
+    p.l.append(5)
+    p.param.trigger('l')
+    assert cached.rx.value == 6
+    assert cached.rx.value == 6
+    assert len(calls) == 2
+
+
+def test_reactive_cache_hit_not_looked_up_again(monkeypatch):
+    x = rx(1)
+    cached = x.rx.pipe(lambda v: v * 2).rx.cache()
+    result = cached + 1
+    assert result.rx.value == 3
+    x.rx.value = 2
+    assert result.rx.value == 5
+    x.rx.value = 1
+    keys = []
+    key = _OutputCache.key
+    monkeypatch.setattr(_OutputCache, 'key', lambda self, params: keys.append(1) or key(self, params))
+    assert result.rx.value == 3
+    assert result.rx.value == 3
+    assert cached.rx.value == 2
+    assert len(keys) == 1
+
+
+def test_reactive_cache_invalid():
+    x = rx(1)
+    with pytest.raises(ValueError, match='maxsize must be a positive integer'):
+        x.rx.cache(maxsize=0)
+    with pytest.raises(ValueError, match='max_bytes must be None or a positive integer'):
+        x.rx.cache(max_bytes=-1)
+
+    async def coro(value):
+        return value
+
+    with pytest.raises(ValueError, match='not supported for asynchronous'):
+        x.rx.pipe(coro).rx.cache()
+
+
+@pytest.fixture
+def default_lazy():
+    param.reactive.default_lazy = True
+    try:
+        yield
+    finally:
+        param.reactive.default_lazy = False
+
+
+def test_reactive_default_lazy(default_lazy):
+    calls = []
+
+    def count(value):
+        calls.append(value)
+        return value
+
+    x = rx('a')
+    expr = (x.rx.pipe(count) + 'b').upper()[::-1]
+    assert x._lazy and expr._lazy
+    assert calls == []
+    assert expr.rx.value == 'BA'
+    assert calls == ['a']
+    assert not rx(1, lazy=False)._lazy
+
+
+def test_reactive_lazy_accessor_predicate():
+    checked = []
+
+    class Accessor:
+        def __init__(self, expr):
+            self.expr = expr
+
+    def predicate(value):
+        checked.append(value)
+        return isinstance(value, str)
+
+    rx.register_accessor('strings', Accessor, predicate)
+    try:
+        x = rx('a', lazy=True)
+        expr = x + 'b'
+        assert checked == []
+        accessor = expr.strings
+        assert isinstance(accessor, Accessor)
+        assert accessor.expr is expr
+        assert checked == ['ab']
+        assert expr.strings is accessor
+
+        y = rx(1, lazy=True) + 1
+        assert isinstance(y.strings, rx)
+        assert checked == ['ab', 2]
+    finally:
+        del rx._accessors['strings']
+
+
+def test_reactive_operation_derives_from_node_directly():
+    p = Parameters()
+    x = rx(1)
+    y = x + p.param.integer
+    z = (y * p.param.integer).rx.pipe(lambda v: v - 1)
+    assert y._prev is x
+    assert z._root is x
+    assert [param.name for param in z._params].count('integer') == 1
+    assert z.rx.value == 55
+    p.integer = 2
+    assert z.rx.value == 5
+
+
+def test_reactive_operation_on_accessor_records_method():
+    x = rx('a b')
+    y = x.upper().split()
+    assert y.rx.value == ['A', 'B']
+    x.rx.value = 'c d'
+    assert y.rx.value == ['C', 'D']
+
+
+def test_reactive_buffer():
+    x = rx(0)
+    buffered = x.rx.buffer(3)
+    values = []
+    for i in range(1, 6):
+        x.rx.value = i
+        values.append(list(buffered.rx.value))
+    assert values == [[1], [1, 2], [1, 2, 3], [2, 3, 4], [3, 4, 5]]
+
+
+def test_reactive_buffer_outputs_not_modified():
+    x = rx(0)
+    buffered = x.rx.buffer(2)
+    history = []
+    buffered.rx.watch(history.append)
+    for i in range(1, 4):
+        x.rx.value = i
+    assert history == [[1], [1, 2], [2, 3]]
+
+
+@pytest.mark.parametrize('agg', ['sum', 'mean', 'min', 'max'])
+def test_reactive_rolling(agg):
+    inputs = [3, 1, 4, 1, 5, 9, 2, 6, 5, 3, 5, 8, 9, 7, 9]
+    reduce = {'sum': sum, 'mean': lambda v: sum(v) / len(v), 'min': min, 'max': max}[agg]
+    x = rx(inputs[0])
+    rolling = x.rx.rolling(4, agg)
+    assert rolling.rx.value == reduce(inputs[:1])
+    for i, value in enumerate(inputs[1:], start=2):
+        x.rx.value = value
+        assert rolling.rx.value == pytest.approx(reduce(inputs[max(0, i-4):i]))
+
+
+def test_reactive_rolling_float_sum_does_not_drift():
+    x = rx(0.1)
+    rolling = x.rx.rolling(3, 'sum')
+    for i in range(1000):
+        x.rx.value = 0.1 * (i % 7) + 1e8 * (i % 2)
+        rolling.rx.value
+    x.rx.value = 0.1
+    rolling.rx.value
+    x.rx.value = 0.2
+    rolling.rx.value
+    x.rx.value = 0.3
+    assert rolling.rx.value == pytest.approx(0.6, abs=1e-6)
+
+
+@pytest.mark.parametrize(('method', 'args'), [
+    ('buffer', (0,)), ('buffer', (1.5,)), ('rolling', (0,)), ('rolling', (3, 'median')),
+])
+def test_reactive_buffer_rolling_invalid(method, args):
+    with pytest.raises(ValueError):
+        getattr(rx(1).rx, method)(*args)
+
+
+def test_reactive_append():
+    x = rx([1, 2])
+    y = x.rx.pipe(len)
+    assert y.rx.value == 2
+    x.rx.append([3, 4])
+    assert x.rx.value == [1, 2, 3, 4]
+    assert y.rx.value == 4
+
+
+def test_reactive_append_derived_raises():
+    with pytest.raises(AttributeError):
+        (rx([1]) + [2]).rx.append([3])
+
+
+def test_reactive_incremental_applies_to_delta():
+    inputs = []
+
+    def positive(values):
+        inputs.append(list(values))
+        return [v for v in values if v > 0]
+
+    x = rx([1, -2])
+    filtered = x.rx.incremental(positive)
+    total = filtered.rx.incremental(sum)
+    count = filtered.rx.incremental(len)
+    assert total.rx.value == 1
+    assert count.rx.value == 1
+    x.rx.append([3, -4])
+    x.rx.append([5])
+    assert total.rx.value == 9
+    assert count.rx.value == 3
+    assert filtered.rx.value == [1, 3, 5]
+    assert inputs == [[1, -2], [3, -4], [5]]
+
+
+def test_reactive_incremental_recomputes_on_set():
+    inputs = []
+
+    def double(values):
+        inputs.append(list(values))
+        return [v * 2 for v in values]
+
+    x = rx([1])
+    y = x.rx.incremental(double)
+    assert y.rx.value == [2]
+    x.rx.value = [2, 3]
+    assert y.rx.value == [4, 6]
+    x.rx.append([4])
+    assert y.rx.value == [4, 6, 8]
+    assert inputs == [[1], [2, 3], [4]]
+
+
+def test_reactive_incremental_recomputes_on_argument_change():
+    inputs = []
+
+    def above(values, threshold):
+        inputs.append(list(values))
+        return [v for v in values if v > threshold]
+
+    threshold = rx(0)
+    x = rx([1, 2])
+    y = x.rx.incremental(above, threshold)
+    assert y.rx.value == [1, 2]
+    threshold.rx.value = 1
+    assert y.rx.value == [2]
+    x.rx.append([3])
+    assert y.rx.value == [2, 3]
+    assert inputs == [[1, 2], [1, 2], [3]]
+
+
+def test_reactive_incremental_recomputes_without_delta_source():
+    x = rx([1])
+    y = (x + [2]).rx.incremental(sum)
+    assert y.rx.value == 3
+    x.rx.append([3])
+    assert y.rx.value == 6
+
+
+def test_reactive_incremental_recovers_from_error():
+    def total(values):
+        if None in values:
+            raise ValueError('Missing value')
+        return sum(values)
+
+    x = rx([1])
+    y = x.rx.incremental(total)
+    assert y.rx.value == 1
+    x.rx.append([None])
+    with pytest.raises(ValueError):
+        y.rx.value
+    x.rx.value = [1, 2]
+    assert y.rx.value == 3
+    x.rx.append([3])
+    assert y.rx.value == 6
+
+
+def test_reactive_incremental_groupby():
+    pd = pytest.importorskip("pandas")
+    df = rx(pd.DataFrame({'key': ['a', 'b'], 'value': [1, 2]}))
+    sums = df.rx.incremental(
+        lambda df: df.groupby('key').value.sum(), combine=lambda a, b: a.add(b, fill_value=0)
+    )
+    assert sums.rx.value.to_dict() == {'a': 1, 'b': 2}
+    df.rx.append(pd.DataFrame({'key': ['a', 'c'], 'value': [3, 4]}))
+    assert sums.rx.value.to_dict() == {'a': 4, 'b': 2, 'c': 4}
+
+
+async def _flood(policy, values):
+    calls = []
+
+    async def work(value):
+        calls.append(value)
+        await asyncio.sleep(0.02)
+        return value
+
+    x = rx(0)
+    y = x.rx.pipe(work).rx.backpressure(policy)
+    y.rx.watch(lambda _: None)
+    for value in values:
+        x.rx.value = value
+        await asyncio.sleep(0.001)
+    return x, y, calls
+
+
+async def test_reactive_backpressure_latest():
+    _, y, calls = await _flood('latest', [1, 2, 3])
+    await async_wait_until(lambda: y.rx.value == 3, interval=10)
+    assert calls[-1] == 3
+
+
+async def test_reactive_backpressure_queue():
+    _, y, calls = await _flood('queue', [1, 2, 3])
+    await async_wait_until(lambda: calls == [1, 2, 3] and y.rx.value == 3, interval=10)
+
+
+async def test_reactive_backpressure_drop():
+    x, y, calls = await _flood('drop', [1, 2, 3])
+    await async_wait_until(lambda: y.rx.value == 1, interval=10)
+    await asyncio.sleep(0.05)
+    assert calls == [1]
+    x.rx.value = 4
+    await async_wait_until(lambda: y.rx.value == 4, interval=10)
+    assert calls == [1, 4]
+
+
+async def test_reactive_backpressure_coalesce():
+    async def gen(value):
+        for i in range(20):
+            await asyncio.sleep(0.001)
+            yield value + i
+
+    seen = []
+    y = rx(0).rx.pipe(gen).rx.backpressure(coalesce=0.05)
+    y.rx.watch(seen.append)
+    y.rx.value
+    await async_wait_until(lambda: bool(seen) and seen[-1] == 19, interval=10)
+    assert len(seen) < 20
+
+
+@pytest.mark.parametrize(('expr', 'args'), [
+    (lambda: rx(1).rx.pipe(lambda v: v), ()),
+    (lambda: rx(1).rx.pipe(asyncio.sleep), ('first',)),
+    (lambda: rx(1).rx.pipe(asyncio.sleep), ('latest', -1)),
+])
+def test_reactive_backpressure_invalid(expr, args):
+    with pytest.raises(ValueError):
+        expr().rx.backpressure(*args)
+
+
+def test_reactive_resolve_all_computes_shared_input_once():
+    calls = []
+
+    def expensive(value):
+        calls.append(value)
+        return value * 10
+
+    x = rx(1)
+    shared = x.rx.pipe(expensive)
+    branches = [shared + 1, shared - 1, shared * 2, shared]
+    assert rx.resolve_all(branches + [3]) == [11, 9, 20, 10, 3]
+    assert calls == [1]
+    x.rx.value = 2
+    assert rx.resolve_all(branches) == [21, 19, 40, 20]
+    assert calls == [1, 2]
+
+
+def test_reactive_resolve_all_shared_argument():
+    calls = []
+
+    def expensive(value):
+        calls.append(value)
+        return value
+
+    y = rx(2).rx.pipe(expensive)
+    assert rx.resolve_all([rx(1) + y, rx(3) * y]) == [3, 6]
+    assert calls == [2]
+
+
+def test_reactive_resolve_all_executor():
+    from concurrent.futures import ThreadPoolExecutor
+
+    threads = set()
+
+    def record(value):
+        threads.add(threading.current_thread().name)
+        return value
+
+    x = rx(1)
+    with ThreadPoolExecutor(thread_name_prefix='resolve_all') as executor:
+        assert rx.resolve_all([x.rx.pipe(record), (x + 1).rx.pipe(record)], executor=executor) == [1, 2]
+    assert threads and all(name.startswith('resolve_all') for name in threads)
+
+
+def test_reactive_resolve_all_raises():
+    def fail(value):
+        raise ValueError('Branch failed')
+
+    x = rx(1)
+    with pytest.raises(ValueError, match='Branch failed'):
+        rx.resolve_all([x + 1, x.rx.pipe(fail)])
@@ -1,4 +1,5 @@
 import asyncio
+import copy
 import threading
 import time
 
@@ -109,6 +110,52 @@ def test_param_ref_no_desync_on_trigger():
 
     assert p.string == p2.string == 'bar'
 
+def test_parameter_ref_only_resolves_affected_refs():
+    resolved = []
+
+    class Source(param.Parameterized):
+        a = param.String()
+        b = param.String()
+
+    source = Source()
+
+    def track(value):
+        resolved.append(value)
+        return value
+
+    p = Parameters(
+        string=bind(track, source.param.a),
+        string_list=[bind(track, source.param.b)],
+    )
+    resolved.clear()
+    source.a = 'changed'
+    assert resolved == ['changed']
+    assert p.string == 'changed'
+    assert p.string_list == ['']
+
+def test_parameter_ref_constant():
+    class P(param.Parameterized):
+        value = param.String(constant=True, allow_refs=True)
+
+    p = Parameters()
+    p2 = P(value=p.param.string)
+    p.string = 'updated'
+    assert p2.value == 'updated'
+    assert p2.param.value.constant
+
+def test_parameter_self_ref_deepcopy():
+    class P(param.Parameterized):
+        a = param.String()
+        b = param.String(allow_refs=True)
+
+    p = P()
+    p.b = p.param.a
+    p2 = copy.deepcopy(p)
+    p2.a = 'copy'
+    p.a = 'original'
+    assert p2.b == 'copy'
+    assert p.b == 'original'
+
 def test_parameter_ref_update():
     p = Parameters()
     p2 = Parameters(string=p.param.string)
@@ -121,6 +168,38 @@ def test_parameter_ref_update():
     p3.string = 'newly linked'
     assert p2.string == 'newly linked'
 
+def test_parameter_ref_update_keeps_unrelated_watchers():
+    p = Parameters()
+    p2 = Parameters(string='other')
+    p3 = Parameters(string_list=[p.param.string], dictionary={'a': p2.param.string})
+    watchers = list(p3._param__private.ref_watchers)
+    assert len(watchers) == 2
+
+    p4 = Parameters(string='new')
+    p3.string_list = [p4.param.string]
+    assert p3.string_list == ['new']
+    ref_watchers = p3._param__private.ref_watchers
+    assert watchers[1] in ref_watchers
+    assert watchers[0] not in ref_watchers
+    assert len(ref_watchers) == 2
+
+    p.string = 'unlinked'
+    assert p3.string_list == ['new']
+    p4.string = 'linked'
+    assert p3.string_list == ['linked']
+    p2.string = 'still linked'
+    assert p3.dictionary == {'a': 'still linked'}
+
+def test_parameter_ref_update_shared_owner():
+    p = Parameters()
+    p2 = Parameters(string=p.param.string, string_list=[p.param.string])
+
+    p2.string = bind(lambda value: value.upper(), p.param.string)
+    p.string = 'shared'
+    assert p2.string == 'SHARED'
+    assert p2.string_list == ['shared']
+    assert len(p2._param__private.ref_watchers) == 1
+
 def test_parameter_ref_update_context():
     p = Parameters(string='linked')
     p2 = Parameters(string=p.param.string)
@@ -253,6 +332,25 @@ async def test_async_bind_ref():
     await asyncio.sleep(0.1)
     assert p2.string == 'new string!'
 
+async def test_async_bind_ref_only_resolves_on_dependency():
+    p = Parameters()
+    calls = []
+
+    async def exclaim(string):
+        calls.append(string)
+        return string + '!'
+
+    p2 = Parameters(string=bind(exclaim, p.param.string), dictionary=p.param.dictionary)
+    await asyncio.sleep(0.05)
+    p.dictionary = {'a': 1}
+    await asyncio.sleep(0.05)
+    assert calls == ['string']
+    assert p2.dictionary == {'a': 1}
+    p.string = 'new string'
+    await asyncio.sleep(0.05)
+    assert calls == ['string', 'new string']
+    assert p2.string == 'new string!'
+
 async def test_async_generator_ref():
     async def gen_strings():
         yield 'string?'
@@ -1,7 +1,14 @@
 """Unit test for watch mechanism."""
+import asyncio
+import concurrent.futures
 import copy
+import gc
+import pickle
 import re
+import threading
+import time
 import unittest
+import weakref
 
 import param
 import pytest
@@ -1061,3 +1068,364 @@ class TestTrigger(unittest.TestCase):
                     self.param.trigger('x')
 
         P()
+
+
+class TestAsyncScheduler:
+
+    async def test_idle_waits_for_coroutine_watcher(self):
+        obj = SimpleWatchExample()
+        values = []
+
+        async def cb(event):
+            await asyncio.sleep(0.01)
+            values.append(event.new)
+
+        obj.param.watch(cb, 'a')
+        obj.a = 1
+        assert values == []
+        await obj.param.idle()
+        assert values == [1]
+
+    async def test_idle_waits_for_depends_coroutine_method(self):
+        class P(param.Parameterized):
+            a = param.Number()
+            value = param.Number()
+
+            @param.depends('a', watch=True)
+            async def update(self):
+                await asyncio.sleep(0.01)
+                self.value = self.a * 2
+
+        p = P()
+        p.a = 2
+        await p.param.idle()
+        assert p.value == 4
+
+    async def test_scheduler_bounds_concurrency(self):
+        obj = SimpleWatchExample()
+        obj.param.scheduler = param.parameterized.AsyncScheduler(max_concurrency=2)
+        running, peak = [], []
+
+        async def cb(event):
+            running.append(event.new)
+            peak.append(len(running))
+            await asyncio.sleep(0.01)
+            running.remove(event.new)
+
+        obj.param.watch(cb, 'a')
+        for i in range(1, 7):
+            obj.a = i
+        await obj.param.idle()
+        assert max(peak) == 2
+        assert len(peak) == 6
+
+    async def test_scheduler_cancels_superseded(self):
+        obj = SimpleWatchExample()
+        obj.param.scheduler = param.parameterized.AsyncScheduler(cancel_superseded=True)
+        completed = []
+
+        async def cb(event):
+            await asyncio.sleep(0.01)
+            completed.append(event.new)
+
+        obj.param.watch(cb, 'a')
+        obj.a = 1
+        await asyncio.sleep(0)
+        obj.a = 2
+        await asyncio.sleep(0)
+        obj.a = 3
+        await obj.param.idle()
+        assert completed == [3]
+
+    async def test_idle_reraises_callback_error(self):
+        obj = SimpleWatchExample()
+        obj.param.scheduler = scheduler = param.parameterized.AsyncScheduler()
+
+        async def cb(event):
+            raise ValueError('Callback failed')
+
+        loop = asyncio.get_running_loop()
+        loop.set_exception_handler(lambda loop, context: None)
+        obj.param.watch(cb, 'a')
+        obj.a = 1
+        with pytest.raises(ValueError, match='Callback failed'):
+            await obj.param.idle()
+        assert scheduler.pending == 0
+        await obj.param.idle()
+
+    def test_scheduler_inherited_from_class(self):
+        scheduler = param.parameterized.AsyncScheduler(max_concurrency=1)
+
+        class P(param.Parameterized):
+            a = param.Number()
+
+        class Q(P):
+            pass
+
+        P.param.scheduler = scheduler
+        assert Q().param.scheduler is scheduler
+        assert SimpleWatchExample().param.scheduler is param.parameterized.async_scheduler
+
+    def test_scheduler_invalid_max_concurrency(self):
+        with pytest.raises(ValueError, match='max_concurrency must be a positive integer'):
+            param.parameterized.AsyncScheduler(max_concurrency=0)
+
+
+class TestWatchExecutor:
+
+    async def test_watch_executor_thread(self):
+        obj = SimpleWatchExample()
+        threads = []
+
+        def cb(event):
+            threads.append(threading.current_thread())
+
+        obj.param.watch(cb, 'a', executor='thread')
+        obj.a = 1
+        await obj.param.idle()
+        assert len(threads) == 1
+        assert threads[0] is not threading.current_thread()
+
+    async def test_watch_executor_preserves_order_per_watcher(self):
+        obj = SimpleWatchExample()
+        values = []
+
+        def cb(event):
+            time.sleep(0.001 * (5 - event.new))
+            values.append(event.new)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+            obj.param.watch(cb, 'a', executor=executor)
+            for i in range(1, 5):
+                obj.a = i
+            await obj.param.idle()
+        assert values == [1, 2, 3, 4]
+
+    async def test_watch_executor_cancel_superseded(self):
+        obj = SimpleWatchExample()
+        obj.param.scheduler = param.parameterized.AsyncScheduler(cancel_superseded=True)
+        values = []
+
+        def cb(event):
+            time.sleep(0.01)
+            values.append(event.new)
+
+        obj.param.watch(cb, 'a', executor='thread')
+        for i in range(1, 5):
+            obj.a = i
+        await obj.param.idle()
+        assert values == [1, 4]
+
+    async def test_watch_executor_error_reraised_by_idle(self):
+        obj = SimpleWatchExample()
+
+        def cb(event):
+            raise ValueError('Callback failed')
+
+        obj.param.watch(cb, 'a', executor='thread')
+        logger = param.get_logger()
+        handler = MockLoggingHandler(level='DEBUG')
+        logger.addHandler(handler)
+        try:
+            obj.a = 1
+            with pytest.raises(ValueError, match='Callback failed'):
+                await obj.param.idle()
+        finally:
+            logger.removeHandler(handler)
+        handler.assertContains('ERROR', 'dispatched to executor')
+
+    async def test_watch_executor_batched_events(self):
+        obj = SimpleWatchExample()
+        calls = []
+
+        def cb(*events):
+            calls.append(sorted(e.name for e in events))
+
+        obj.param.watch(cb, ['a', 'b'], executor='thread')
+        with param.parameterized.batch_call_watchers(obj):
+            obj.a = 1
+            obj.b = 2
+        await obj.param.idle()
+        assert calls == [['a', 'b']]
+
+    async def test_depends_executor_thread(self):
+        class P(param.Parameterized):
+            a = param.Number()
+            threads = param.List()
+
+            @param.depends('a', watch=True, on_init=True, executor='thread')
+            def update(self):
+                self.threads.append(threading.current_thread())
+
+        p = P()
+        p.a = 1
+        await p.param.idle()
+        assert len(p.threads) == 2
+        assert threading.current_thread() not in p.threads
+
+    def test_watch_executor_invalid(self):
+        obj = SimpleWatchExample()
+        with pytest.raises(ValueError, match="Executor must be 'thread', 'process'"):
+            obj.param.watch(lambda e: None, 'a', executor='foo')
+
+    def test_watch_executor_coroutine_not_supported(self):
+        obj = SimpleWatchExample()
+
+        async def cb(event):
+            pass
+
+        with pytest.raises(ValueError, match='Coroutine callbacks cannot be dispatched'):
+            obj.param.watch(cb, 'a', executor='thread')
+
+
+class Subscriber(param.Parameterized):
+
+    value = param.Number(allow_refs=True)
+
+    def __init__(self, **params):
+        super().__init__(**params)
+        self.events = []
+
+    def callback(self, event):
+        self.events.append(event.new)
+
+    def values_callback(self, **kwargs):
+        self.events.append(kwargs)
+
+    async def async_callback(self, event):
+        self.events.append(event.new)
+
+
+class SubObjectDepends(param.Parameterized):
+
+    source = param.ClassSelector(class_=SimpleWatchExample)
+
+    calls = param.Integer()
+
+    @param.depends('source.a', watch=True)
+    def update(self):
+        self.calls += 1
+
+
+def _value_watchers(obj, name='a'):
+    return obj._param__private.watchers.get(name, {}).get('value', [])
+
+
+class TestWeakWatchers:
+
+    def test_weak_watch_calls_method(self):
+        source = SimpleWatchExample()
+        sub = Subscriber()
+        source.param.watch(sub.callback, 'a', weak=True)
+        source.a = 1
+        assert sub.events == [1]
+
+    def test_weak_watch_removed_when_owner_collected(self):
+        source = SimpleWatchExample()
+        sub = Subscriber()
+        source.param.watch(sub.callback, 'a', weak=True)
+        assert len(_value_watchers(source)) == 1
+        ref = weakref.ref(sub)
+        del sub
+        gc.collect()
+        assert ref() is None
+        assert _value_watchers(source) == []
+        source.a = 1
+
+    def test_strong_watch_keeps_owner_alive(self):
+        source = SimpleWatchExample()
+        sub = Subscriber()
+        source.param.watch(sub.callback, 'a')
+        ref = weakref.ref(sub)
+        del sub
+        gc.collect()
+        assert ref() is not None
+        assert len(_value_watchers(source)) == 1
+
+    def test_weak_watch_unwatch(self):
+        source = SimpleWatchExample()
+        sub = Subscriber()
+        watcher = source.param.watch(sub.callback, 'a', weak=True)
+        source.param.unwatch(watcher)
+        del sub
+        gc.collect()
+        assert _value_watchers(source) == []
+
+    def test_weak_watch_values(self):
+        source = SimpleWatchExample()
+        sub = Subscriber()
+        source.param.watch_values(sub.values_callback, 'a', weak=True)
+        source.a = 2
+        assert sub.events == [{'a': 2}]
+        del sub
+        gc.collect()
+        assert _value_watchers(source) == []
+
+    def test_weak_watch_class(self):
+        sub = Subscriber()
+        SimpleWatchExample.param.watch(sub.callback, 'a', weak=True)
+        try:
+            SimpleWatchExample.a = 3
+            assert sub.events == [3]
+            del sub
+            gc.collect()
+            assert SimpleWatchExample.param['a'].watchers['value'] == []
+        finally:
+            SimpleWatchExample.a = 0
+
+    async def test_weak_watch_coroutine(self):
+        source = SimpleWatchExample()
+        sub = Subscriber()
+        source.param.watch(sub.async_callback, 'a', weak=True)
+        source.a = 4
+        await source.param.idle()
+        assert sub.events == [4]
+
+    def test_weak_watch_requires_method(self):
+        source = SimpleWatchExample()
+        with pytest.raises(ValueError, match='Weak watchers require a bound method'):
+            source.param.watch(lambda event: None, 'a', weak=True)
+
+    def test_weak_watch_deepcopy(self):
+        source = SimpleWatchExample()
+        sub = Subscriber()
+        source.param.watch(sub.callback, 'a', weak=True)
+        source_copy, sub_copy = copy.deepcopy((source, sub))
+        source_copy.a = 5
+        assert sub_copy.events == [5]
+        assert sub.events == []
+
+    def test_weak_watch_pickle(self):
+        source = SimpleWatchExample()
+        source.param.watch(Subscriber().callback, 'a', weak=True)
+        gc.collect()
+        pickle.loads(pickle.dumps(source)).a = 1
+
+    def test_ref_watcher_removed_when_subscriber_collected(self):
+        source = SimpleWatchExample()
+        sub = Subscriber(value=source.param.a)
+        source.a = 2
+        assert sub.value == 2
+        assert len(_value_watchers(source)) == 1
+        del sub
+        gc.collect()
+        assert _value_watchers(source) == []
+
+    def test_depends_subobject_watcher_removed_when_collected(self):
+        source = SimpleWatchExample()
+        obj = SubObjectDepends(source=source)
+        source.a = 1
+        assert obj.calls == 1
+        assert len(_value_watchers(source)) == 1
+        del obj
+        gc.collect()
+        assert _value_watchers(source) == []
+
+    def test_subscriber_churn_keeps_watchers_bounded(self):
+        source = SimpleWatchExample()
+        for i in range(50):
+            Subscriber(value=source.param.a)
+            SubObjectDepends(source=source)
+            source.a = i
+        gc.collect()
+        assert _value_watchers(source) == []